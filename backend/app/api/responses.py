@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import os
+import secrets
+import stat
+from collections.abc import Mapping
+from typing import BinaryIO
+
+import anyio
+from fastapi import Response
+from fastapi.responses import FileResponse
+from starlette.types import Receive, Scope, Send
+
+# Browsers seeking through a video issue a handful of ranges at most; anything beyond
+# this is more likely abuse than a real client and gets the whole file instead.
+MAX_RANGES = 16
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of ``If-None-Match`` against ``etag`` (RFC 9110, section 13.1.2)."""
+
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+def parse_range_header(range_header: str, size: int) -> list[tuple[int, int]] | None:
+    """Parse an RFC 9110 ``bytes=`` range header into inclusive ``(start, end)`` pairs.
+
+    Returns ``None`` when the header should be ignored (malformed, unsupported unit or
+    too many ranges) and raises :class:`RangeNotSatisfiable` when none of the ranges
+    overlap the file. Overlapping and adjacent ranges are coalesced.
+    """
+
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec:
+        return None
+
+    ranges: list[tuple[int, int]] = []
+    for raw_range in spec.split(","):
+        first, dash, last = raw_range.strip().partition("-")
+        if not dash:
+            return None
+        try:
+            if first:
+                start = int(first)
+                end = int(last) if last else size - 1
+                if last and end < start:
+                    return None
+            else:
+                suffix = int(last)
+                if suffix == 0:
+                    continue
+                start, end = max(size - suffix, 0), size - 1
+        except ValueError:
+            return None
+        if start < 0 or start >= size:
+            continue
+        ranges.append((start, min(end, size - 1)))
+
+    if len(ranges) > MAX_RANGES:
+        return None
+    if not ranges:
+        raise RangeNotSatisfiable()
+
+    ranges.sort()
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        last_start, last_end = merged[-1]
+        if start <= last_end + 1:
+            merged[-1] = (last_start, max(last_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class RangeFileResponse(FileResponse):
+    """``FileResponse`` with HTTP Range support.
+
+    Serves ``206 Partial Content`` for single and multiple (``multipart/byteranges``)
+    ranges and ``416`` for unsatisfiable ones. File bytes are handed to the server via
+    the ASGI ``http.response.zerocopy`` extension (sendfile) when it is advertised,
+    falling back to ``http.response.pathsend`` for whole files and to buffered reads
+    otherwise.
+    """
+
+    chunk_size = 256 * 1024
+
+    def __init__(self, path: str | os.PathLike[str], request_headers: Mapping[str, str], **kwargs) -> None:
+        super().__init__(path, **kwargs)
+        self.headers.setdefault("accept-ranges", "bytes")
+        self.range_header = request_headers.get("range")
+        self.if_range = request_headers.get("if-range")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.stat_result is None:
+            try:
+                stat_result = await anyio.to_thread.run_sync(os.stat, self.path)
+            except FileNotFoundError:
+                raise RuntimeError(f"File at path {self.path} does not exist.")
+            if not stat.S_ISREG(stat_result.st_mode):
+                raise RuntimeError(f"File at path {self.path} is not a file.")
+            self.stat_result = stat_result
+            self.set_stat_headers(stat_result)
+
+        size = self.stat_result.st_size
+        ranges = None
+        if self.range_header and size and self._if_range_matches():
+            try:
+                ranges = parse_range_header(self.range_header, size)
+            except RangeNotSatisfiable:
+                await self._send_not_satisfiable(send, size)
+                return
+
+        send_body = scope["method"].upper() != "HEAD"
+        extensions = scope.get("extensions", {})
+        if ranges is None:
+            if send_body and "http.response.zerocopy" in extensions and "http.response.pathsend" not in extensions:
+                await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+                await self._send_file_ranges(scope, send, [(b"", 0, size - 1)], b"")
+                if self.background is not None:
+                    await self.background()
+            else:
+                await super().__call__(scope, receive, send)
+            return
+
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            self.status_code = 206
+            self.headers["content-range"] = f"bytes {start}-{end}/{size}"
+            self.headers["content-length"] = str(end - start + 1)
+            await send({"type": "http.response.start", "status": 206, "headers": self.raw_headers})
+            if send_body:
+                await self._send_file_ranges(scope, send, [(b"", start, end)], b"")
+            else:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+        else:
+            boundary = secrets.token_hex(16)
+            parts = [
+                (
+                    (
+                        f"--{boundary}\r\ncontent-type: {self.media_type}\r\n"
+                        f"content-range: bytes {start}-{end}/{size}\r\n\r\n"
+                    ).encode("latin-1"),
+                    start,
+                    end,
+                )
+                for start, end in ranges
+            ]
+            trailer = f"--{boundary}--\r\n".encode("latin-1")
+            content_length = sum(len(header) + (end - start + 1) + 2 for header, start, end in parts) + len(trailer)
+            self.status_code = 206
+            self.headers["content-type"] = f"multipart/byteranges; boundary={boundary}"
+            self.headers["content-length"] = str(content_length)
+            await send({"type": "http.response.start", "status": 206, "headers": self.raw_headers})
+            if send_body:
+                await self._send_file_ranges(scope, send, parts, trailer, separator=b"\r\n")
+            else:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        if self.background is not None:
+            await self.background()
+
+    def _if_range_matches(self) -> bool:
+        if not self.if_range:
+            return True
+        return self.if_range in {self.headers.get("etag"), self.headers.get("last-modified")}
+
+    async def _send_not_satisfiable(self, send: Send, size: int) -> None:
+        headers = [
+            (b"content-range", f"bytes */{size}".encode("latin-1")),
+            (b"accept-ranges", b"bytes"),
+            (b"content-length", b"0"),
+        ]
+        await send({"type": "http.response.start", "status": 416, "headers": headers})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def _send_file_ranges(
+        self,
+        scope: Scope,
+        send: Send,
+        parts: list[tuple[bytes, int, int]],
+        trailer: bytes,
+        separator: bytes = b"",
+    ) -> None:
+        zerocopy = "http.response.zerocopy" in scope.get("extensions", {})
+        with open(self.path, "rb") as file:
+            for header, start, end in parts:
+                if header:
+                    await send({"type": "http.response.body", "body": header, "more_body": True})
+                if zerocopy:
+                    await send(
+                        {
+                            "type": "http.response.zerocopy",
+                            "file": file,
+                            "offset": start,
+                            "count": end - start + 1,
+                            "more_body": True,
+                        }
+                    )
+                else:
+                    await self._send_chunks(send, file, start, end)
+                if separator:
+                    await send({"type": "http.response.body", "body": separator, "more_body": True})
+        await send({"type": "http.response.body", "body": trailer, "more_body": False})
+
+    async def _send_chunks(self, send: Send, file: BinaryIO, start: int, end: int) -> None:
+        remaining = end - start + 1
+        file.seek(start)
+        while remaining > 0:
+            chunk = await anyio.to_thread.run_sync(file.read, min(self.chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+
+
+__all__ = ["RangeFileResponse", "RangeNotSatisfiable", "etag_matches", "not_modified", "parse_range_header"]
@@ -1,35 +1,75 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, Request, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
 
-from app.core.settings import DEFAULT_ENVIRONMENT
+from app.api.responses import RangeFileResponse, etag_matches, not_modified
+from app.core.settings import ALLOWED_ENVIRONMENTS, DEFAULT_ENVIRONMENT
 from app.models import ProjectRetentionSettings
+from app.services.loadtests import METRICS
 from app.services.storage import ProjectStorageService
 
 router = APIRouter(prefix="/api", tags=["projects"])
 
 
-def get_storage_service() -> ProjectStorageService:
-    return ProjectStorageService()
+def get_storage_service(request: Request) -> ProjectStorageService:
+    # Installed by the application's lifespan handler (see ``create_application``).
+    return request.app.state.storage
+
+
+def _revalidate(request: Request, response: Response, etag: str) -> Response | None:
+    """Answer 304 when the client's copy is current; otherwise tag the response."""
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return None
 
 
 @router.get("/projects")
 async def list_projects(
-    environment: str = DEFAULT_ENVIRONMENT, storage: ProjectStorageService = Depends(get_storage_service)
+    request: Request,
+    response: Response,
+    environment: str = DEFAULT_ENVIRONMENT,
+    storage: ProjectStorageService = Depends(get_storage_service),
 ) -> list[dict[str, object]]:
     environment = storage.validate_environment(environment)
+    not_modified_response = _revalidate(request, response, storage.listing_etag("projects", environment))
+    if not_modified_response is not None:
+        return not_modified_response
     return storage.list_projects(environment)
 
 
 @router.get("/overview")
 async def project_overview(
-    environment: str = DEFAULT_ENVIRONMENT, storage: ProjectStorageService = Depends(get_storage_service)
+    request: Request,
+    response: Response,
+    environment: str = DEFAULT_ENVIRONMENT,
+    storage: ProjectStorageService = Depends(get_storage_service),
 ) -> list[dict[str, object]]:
     environment = storage.validate_environment(environment)
+    not_modified_response = _revalidate(request, response, storage.listing_etag("overview", environment))
+    if not_modified_response is not None:
+        return not_modified_response
     return storage.project_overview(environment)
 
 
+@router.get("/overview/environments")
+async def project_overview_by_environment(
+    request: Request,
+    response: Response,
+    environments: list[str] | None = Query(None),
+    storage: ProjectStorageService = Depends(get_storage_service),
+) -> list[dict[str, object]]:
+    requested = environments or sorted(ALLOWED_ENVIRONMENTS)
+    selected = [storage.validate_environment(environment) for environment in dict.fromkeys(requested)]
+    not_modified_response = _revalidate(request, response, storage.listing_etag("overview-environments", ",".join(selected)))
+    if not_modified_response is not None:
+        return not_modified_response
+    return storage.project_overview_by_environment(selected)
+
+
 @router.get("/projects/{project}")
 async def project_details(
     project: str, environment: str = DEFAULT_ENVIRONMENT, storage: ProjectStorageService = Depends(get_storage_service)
@@ -52,6 +92,34 @@ async def update_retention_settings(
     return storage.update_retention_settings(project, settings)
 
 
+@router.get("/projects/{project}/diff")
+async def diff_builds(
+    project: str,
+    base: str,
+    head: str,
+    environment: str = DEFAULT_ENVIRONMENT,
+    threshold: float = Query(20.0, ge=0),
+    storage: ProjectStorageService = Depends(get_storage_service),
+) -> dict[str, object]:
+    environment = storage.validate_environment(environment)
+    return await run_in_threadpool(storage.diff_builds, project, base, head, environment, threshold)
+
+
+@router.get("/projects/{project}/loadtests/trends")
+async def loadtest_trends(
+    project: str,
+    environment: str = DEFAULT_ENVIRONMENT,
+    endpoints: list[str] | None = Query(None, alias="endpoint"),
+    metrics: list[str] | None = Query(None, alias="metric"),
+    limit: int | None = Query(None, ge=1),
+    storage: ProjectStorageService = Depends(get_storage_service),
+) -> dict[str, object]:
+    environment = storage.validate_environment(environment)
+    if metrics and not set(metrics) <= set(METRICS):
+        raise HTTPException(status_code=400, detail=f"Unsupported metric; expected one of {', '.join(METRICS)}.")
+    return storage.loadtest_trends(project, environment, endpoints, list(dict.fromkeys(metrics or [])) or None, limit)
+
+
 @router.post("/projects/{project}/upload")
 async def upload_results(
     project: str,
@@ -73,13 +141,14 @@ async def upload_results(
     return {"message": "Upload accepted", "build_id": build_id}
 
 
-@router.get("/projects/{project}/report/{path:path}")
+@router.api_route("/projects/{project}/report/{path:path}", methods=["GET", "HEAD"])
 async def serve_report(
+    request: Request,
     project: str,
     path: str = "index.html",
     environment: str = DEFAULT_ENVIRONMENT,
     storage: ProjectStorageService = Depends(get_storage_service),
-) -> FileResponse:
+) -> RangeFileResponse:
     environment = storage.validate_environment(environment)
     safe_path = storage.get_report_path(project, path, environment)
-    return FileResponse(safe_path)
+    return RangeFileResponse(safe_path, request.headers)
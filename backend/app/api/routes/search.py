@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+
+from app.api.routes.projects import get_storage_service
+from app.services.storage import ProjectStorageService
+
+router = APIRouter(prefix="/api", tags=["search"])
+
+
+@router.get("/search")
+async def search_results(
+    q: str = Query(..., min_length=1, max_length=500),
+    project: str | None = None,
+    environment: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    status: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    storage: ProjectStorageService = Depends(get_storage_service),
+) -> dict[str, object]:
+    if environment is not None:
+        environment = storage.validate_environment(environment)
+    result = await run_in_threadpool(
+        storage.search_results,
+        q,
+        project=project,
+        environment=environment,
+        since=since,
+        until=until,
+        status=status,
+        limit=limit,
+        offset=offset,
+    )
+    return {"query": q, **result}
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 PROJECTS_DIR = DATA_DIR / "projects"
 FRONTEND_DIST = Path(__file__).resolve().parent.parent / "static"
 METADATA_FILENAME = "metadata.json"
+# Full-text search index, stored next to the projects directory.
+SEARCH_INDEX_FILENAME = "search.sqlite3"
 SUMMARY_FILENAME = "summary.json"
 DEFAULT_ENVIRONMENT = "prod"
 ALLOWED_ENVIRONMENTS = {"dev", "staging", "prod"}
+# Number of build pairs whose joined test outcomes are kept in memory for /diff.
+DIFF_CACHE_SIZE = 64
+# Limits checked against an uploaded archive's central directory before extraction.
+MAX_ARCHIVE_MEMBERS = 100_000
+MAX_ARCHIVE_UNCOMPRESSED_BYTES = 4 * 1024**3
+MAX_ARCHIVE_COMPRESSION_RATIO = 200
+# Threads shared by all uploads for decompressing archive members.
+EXTRACTION_WORKERS = min(8, os.cpu_count() or 1)
 
 
 def ensure_directories() -> None:
@@ -1,15 +1,35 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 
 from app.api.routes.projects import router as projects_router
-from app.core.settings import FRONTEND_DIST, ensure_directories
+from app.api.routes.search import router as search_router
+from app.core.settings import FRONTEND_DIST
+from app.services.storage import ProjectStorageService
+
+
+def create_application(projects_dir: Path | None = None) -> FastAPI:
+    """Build the ASGI application, storing projects under ``projects_dir`` (default ``PROJECTS_DIR``).
 
+    Nothing touches storage until the application starts up.
+    """
 
-def create_application() -> FastAPI:
-    application = FastAPI(title="Test Results Dashboard API", openapi_url="/api/openapi.json")
+    @asynccontextmanager
+    async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+        # One service per application, created before the first request is served so
+        # that concurrent first requests cannot each build (and leak) their own.
+        application.state.storage = ProjectStorageService(projects_dir)
+        try:
+            yield
+        finally:
+            application.state.storage.close()
+
+    application = FastAPI(title="Test Results Dashboard API", openapi_url="/api/openapi.json", lifespan=lifespan)
 
     application.add_middleware(
         CORSMiddleware,
@@ -20,12 +40,11 @@ def create_application() -> FastAPI:
     )
 
     application.include_router(projects_router)
-
-    @application.on_event("startup")
-    async def startup_event() -> None:  # pragma: no cover - startup hook
-        ensure_directories()
+    application.include_router(search_router)
 
     if FRONTEND_DIST.exists():
+        from fastapi.staticfiles import StaticFiles
+
         application.mount("/", StaticFiles(directory=FRONTEND_DIST, html=True), name="frontend")
     else:
 
@@ -36,4 +55,11 @@ def create_application() -> FastAPI:
     return application
 
 
-app = create_application()
+def __getattr__(name: str) -> FastAPI:
+    # Build the ASGI app on first access (``uvicorn app.main:app``) rather than at
+    # import time, so importing ``create_application`` stays cheap.
+    if name == "app":
+        application = create_application()
+        globals()["app"] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
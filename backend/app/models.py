@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import bisect
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PositiveInt, PrivateAttr, field_validator
 
 
 class HistoryEntry(BaseModel):
     build_id: str
     uploaded_at: datetime
     environment: str = Field("prod", min_length=1)
+    report_type: Literal["allure", "loadtest"] = "allure"
 
 
 class ProjectMetadata(BaseModel):
@@ -19,8 +21,116 @@ class ProjectMetadata(BaseModel):
     history: List[HistoryEntry] = Field(default_factory=list)
     retention_runs: Optional[int] = Field(None, ge=1)
     retention_days: Optional[int] = Field(None, ge=1)
+    retention_runs_by_environment: dict[str, PositiveInt] = Field(default_factory=dict)
+
+    # ``history`` split by (environment, report_type), each list oldest-first and holding
+    # the same entry objects, plus the entries stored under each (environment, build_id)
+    # directory. Built once when the metadata is loaded; change ``history`` through the
+    # methods below so all three stay in step.
+    _history_by_kind: dict[tuple[str, str], list[HistoryEntry]] = PrivateAttr(default_factory=dict)
+    _history_by_build: dict[tuple[str, str], list[HistoryEntry]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        for entry in self.history:
+            self._history_by_kind.setdefault((entry.environment, entry.report_type), []).append(entry)
+            self._history_by_build.setdefault((entry.environment, entry.build_id), []).append(entry)
+
+    def history_kinds(self) -> list[tuple[str, str]]:
+        return list(self._history_by_kind)
+
+    def has_build(self, environment: str, build_id: str) -> bool:
+        """Whether a retained entry still stores its report under ``history/<environment>/<build_id>``."""
+
+        return (environment, build_id) in self._history_by_build
+
+    def add_history_entry(self, entry: HistoryEntry) -> list[HistoryEntry]:
+        """Record an upload, replacing and returning earlier entries for the same build directory."""
+
+        replaced = self._history_by_build.pop((entry.environment, entry.build_id), [])
+        for previous in replaced:
+            self._remove_entry(previous)
+        key = (entry.environment, entry.report_type)
+        bisect.insort(self.history, entry, key=_uploaded_at)
+        bisect.insort(self._history_by_kind.setdefault(key, []), entry, key=_uploaded_at)
+        self._history_by_build[(entry.environment, entry.build_id)] = [entry]
+        return replaced
+
+    def expire_history(self, cutoff: datetime) -> list[HistoryEntry]:
+        """Remove and return the entries uploaded before ``cutoff``."""
+
+        expired = bisect.bisect_left(self.history, cutoff, key=_uploaded_at)
+        evicted = self.history[:expired]
+        del self.history[:expired]
+        counts: dict[tuple[str, str], int] = {}
+        for entry in evicted:
+            key = (entry.environment, entry.report_type)
+            counts[key] = counts.get(key, 0) + 1
+        # Expired entries are the oldest of their kind too, so each kind loses a prefix.
+        for key, count in counts.items():
+            self._drop_oldest_of_kind(key, count)
+        return evicted
+
+    def trim_history(self, environment: str, report_type: str, limit: int) -> list[HistoryEntry]:
+        """Remove and return the oldest entries of a kind beyond its newest ``limit``."""
+
+        key = (environment, report_type)
+        over = len(self._history_by_kind.get(key, ())) - limit
+        if over <= 0:
+            return []
+        evicted = self._drop_oldest_of_kind(key, over)
+        for entry in reversed(evicted):
+            del self.history[_index_of(self.history, entry)]
+        return evicted
+
+    def _drop_oldest_of_kind(self, key: tuple[str, str], count: int) -> list[HistoryEntry]:
+        entries = self._history_by_kind[key]
+        dropped = entries[:count]
+        del entries[:count]
+        if not entries:
+            del self._history_by_kind[key]
+        for entry in dropped:
+            self._forget_build(entry)
+        return dropped
+
+    def _remove_entry(self, entry: HistoryEntry) -> None:
+        key = (entry.environment, entry.report_type)
+        entries = self._history_by_kind[key]
+        del entries[_index_of(entries, entry)]
+        if not entries:
+            del self._history_by_kind[key]
+        del self.history[_index_of(self.history, entry)]
+
+    def _forget_build(self, entry: HistoryEntry) -> None:
+        key = (entry.environment, entry.build_id)
+        entries = [other for other in self._history_by_build[key] if other is not entry]
+        self._history_by_build[key] = entries
+        if not entries:
+            del self._history_by_build[key]
+
+    @field_validator("history")
+    @classmethod
+    def _order_history(cls, history: List[HistoryEntry]) -> List[HistoryEntry]:
+        # History is kept oldest-first so retention can bisect on upload time. Metadata
+        # written by older versions may be newest-first; normalise it once on load.
+        if any(earlier.uploaded_at > later.uploaded_at for earlier, later in zip(history, history[1:])):
+            history.sort(key=lambda entry: entry.uploaded_at)
+        return history
+
+
+def _uploaded_at(entry: HistoryEntry) -> datetime:
+    return entry.uploaded_at
+
+
+def _index_of(entries: list[HistoryEntry], entry: HistoryEntry) -> int:
+    # Entries are ordered by upload time, so bisect to the first candidate and step over
+    # any uploaded in the same instant.
+    index = bisect.bisect_left(entries, entry.uploaded_at, key=_uploaded_at)
+    while entries[index] is not entry:
+        index += 1
+    return index
 
 
 class ProjectRetentionSettings(BaseModel):
     retention_runs: Optional[int] = Field(None, ge=1)
     retention_days: Optional[int] = Field(None, ge=1)
+    retention_runs_by_environment: dict[str, PositiveInt] = Field(default_factory=dict)
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple
+
+FAILING_STATUSES = {"failed", "broken"}
+
+
+class CaseOutcome(NamedTuple):
+    name: str
+    status: str
+    duration: int | None
+    message: str | None
+
+
+class DiffRow(NamedTuple):
+    key: str
+    base: CaseOutcome | None
+    head: CaseOutcome | None
+
+
+def _test_key(test_case: dict) -> str | None:
+    return test_case.get("historyId") or test_case.get("fullName") or test_case.get("name")
+
+
+def read_test_outcomes(report_dir: Path) -> dict[str, CaseOutcome]:
+    """Per-test outcome of an extracted Allure report, keyed by ``historyId`` (or full name).
+
+    Test-case files are read and reduced one at a time, so memory use is bounded by the
+    size of the outcome map rather than by the report. When retries left several results
+    for one test, the one that started last wins.
+    """
+
+    outcomes: dict[str, CaseOutcome] = {}
+    started: dict[str, int] = {}
+    try:
+        entries = os.scandir(report_dir / "data" / "test-cases")
+    except OSError:
+        return outcomes
+
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            try:
+                with open(entry.path, encoding="utf-8") as fp:
+                    test_case = json.load(fp)
+            except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+                continue
+            if not isinstance(test_case, dict):
+                continue
+            key = _test_key(test_case)
+            if not key:
+                continue
+            timing = test_case.get("time") or {}
+            start = timing.get("start") or 0
+            if key in started and started[key] > start:
+                continue
+            started[key] = start
+            outcomes[key] = CaseOutcome(
+                name=test_case.get("fullName") or test_case.get("name") or key,
+                status=test_case.get("status") or "unknown",
+                duration=timing.get("duration"),
+                message=test_case.get("statusMessage"),
+            )
+    return outcomes
+
+
+def join_outcomes(base: dict[str, CaseOutcome], head: dict[str, CaseOutcome]) -> list[DiffRow]:
+    return [DiffRow(key, base.get(key), head.get(key)) for key in base.keys() | head.keys()]
+
+
+def _describe(row: DiffRow) -> dict[str, object]:
+    outcome = row.head or row.base
+    return {
+        "key": row.key,
+        "name": outcome.name if outcome else row.key,
+        "baseStatus": row.base.status if row.base else None,
+        "headStatus": row.head.status if row.head else None,
+        "baseDuration": row.base.duration if row.base else None,
+        "headDuration": row.head.duration if row.head else None,
+        "message": row.head.message if row.head else None,
+    }
+
+
+def summarize_diff(rows: list[DiffRow], threshold: float) -> dict[str, object]:
+    """Classify joined outcomes; ``threshold`` is the slowdown in percent that counts as slower."""
+
+    newly_failing: list[dict[str, object]] = []
+    fixed: list[dict[str, object]] = []
+    slower: list[dict[str, object]] = []
+    added = removed = 0
+    factor = 1 + threshold / 100
+
+    for row in rows:
+        if row.base is None:
+            added += 1
+            if row.head is not None and row.head.status in FAILING_STATUSES:
+                newly_failing.append(_describe(row))
+            continue
+        if row.head is None:
+            removed += 1
+            continue
+
+        base_failing = row.base.status in FAILING_STATUSES
+        head_failing = row.head.status in FAILING_STATUSES
+        if head_failing and not base_failing:
+            newly_failing.append(_describe(row))
+        elif base_failing and row.head.status == "passed":
+            fixed.append(_describe(row))
+
+        if row.base.duration and row.head.duration is not None and row.head.duration > row.base.duration * factor:
+            description = _describe(row)
+            description["change"] = round((row.head.duration / row.base.duration - 1) * 100, 1)
+            slower.append(description)
+
+    newly_failing.sort(key=lambda item: item["name"])
+    fixed.sort(key=lambda item: item["name"])
+    slower.sort(key=lambda item: item["change"], reverse=True)
+    return {
+        "summary": {
+            "tests": len(rows),
+            "newlyFailing": len(newly_failing),
+            "fixed": len(fixed),
+            "slower": len(slower),
+            "added": added,
+            "removed": removed,
+        },
+        "newlyFailing": newly_failing,
+        "fixed": fixed,
+        "slower": slower,
+    }
+
+
+class BuildDiffCache:
+    """Bounded LRU of joined test outcomes keyed by ``(project, environment, base, head)``.
+
+    Stored builds never change, so an entry stays valid until one of its builds is
+    evicted by retention (or replaced by an upload reusing its id); the storage service
+    calls :meth:`invalidate` in both cases. The threshold is applied per request, so
+    every threshold shares one entry.
+
+    Diffs are computed outside the cache lock, so each invalidation bumps a per-project
+    generation: take :meth:`generation` before reading the builds and pass it to
+    :meth:`put`, which drops the rows if the project was invalidated in between.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, str, str], list[DiffRow]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, project: str) -> int:
+        with self._lock:
+            return self._generations.get(project, 0)
+
+    def get(self, key: tuple[str, str, str, str]) -> list[DiffRow] | None:
+        with self._lock:
+            rows = self._entries.get(key)
+            if rows is not None:
+                self._entries.move_to_end(key)
+            return rows
+
+    def put(self, key: tuple[str, str, str, str], rows: list[DiffRow], generation: int | None = None) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generations.get(key[0], 0):
+                return
+            self._entries[key] = rows
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, project: str, build_ids: set[str]) -> None:
+        with self._lock:
+            self._generations[project] = self._generations.get(project, 0) + 1
+            stale = [key for key in self._entries if key[0] == project and {key[2], key[3]} & build_ids]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+__all__ = ["BuildDiffCache", "CaseOutcome", "join_outcomes", "read_test_outcomes", "summarize_diff"]
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import stat
+import tempfile
+import time
+import zipfile
+import zlib
+from collections.abc import Iterable
+from concurrent.futures import Executor, wait
+from pathlib import Path, PurePosixPath, PureWindowsPath
+from typing import BinaryIO, NamedTuple
+
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+COPY_BUFFER_SIZE = 1024 * 1024
+# Members are handed to the pool in batches of roughly this many bytes (or members),
+# so archives of many tiny files do not pay one future per file.
+BATCH_BYTES = 8 * 1024 * 1024
+BATCH_MEMBERS = 256
+
+
+Member = tuple[zipfile.ZipInfo, PurePosixPath]
+
+
+class ExtractionLimits(NamedTuple):
+    max_members: int
+    max_uncompressed_bytes: int
+    # Largest uncompressed/compressed size ratio allowed for a single member ...
+    max_compression_ratio: float
+    # ... once it expands to at least this many bytes (small files compress arbitrarily well).
+    ratio_min_bytes: int = COPY_BUFFER_SIZE
+
+
+class ExtractionStats(NamedTuple):
+    members: int
+    total_bytes: int
+    seconds: float
+
+    @property
+    def throughput(self) -> float:
+        """Uncompressed bytes written per second."""
+
+        return self.total_bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+def _reject(detail: str) -> HTTPException:
+    return HTTPException(status_code=400, detail=detail)
+
+
+def _member_path(name: str) -> PurePosixPath | None:
+    """Relative path a member extracts to, or ``None`` if it would escape the target."""
+
+    path = PurePosixPath(name.replace("\\", "/"))
+    if path.is_absolute() or ".." in path.parts or PureWindowsPath(name).drive:
+        return None
+    return path
+
+
+def scan_archive(archive: zipfile.ZipFile, limits: ExtractionLimits) -> list[Member]:
+    """Check the central directory against ``limits`` before anything is written.
+
+    Only the directory is read. Declared sizes are binding: ``zipfile`` stops reading a
+    member at its declared size and fails its CRC check if the data disagrees, so an
+    archive cannot write more than it declares here.
+    """
+
+    members = archive.infolist()
+    if len(members) > limits.max_members:
+        raise _reject(f"Archive has too many entries ({len(members)} > {limits.max_members}).")
+
+    # Later entries with the same name win, as with ``ZipFile.extractall``.
+    planned: dict[PurePosixPath, Member] = {}
+    total = 0
+    for info in members:
+        path = _member_path(info.filename)
+        if path is None:
+            raise _reject(f"Archive entry escapes the report directory: {info.filename!r}.")
+        if stat.S_ISLNK(info.external_attr >> 16):
+            raise _reject(f"Archive entry is a symbolic link: {info.filename!r}.")
+        total += info.file_size
+        if total > limits.max_uncompressed_bytes:
+            raise _reject(f"Archive expands to more than {limits.max_uncompressed_bytes} bytes.")
+        if (
+            info.file_size >= limits.ratio_min_bytes
+            and info.file_size > limits.max_compression_ratio * max(info.compress_size, 1)
+        ):
+            raise _reject(f"Archive entry {info.filename!r} exceeds the allowed compression ratio.")
+        if path.parts:
+            planned.pop(path, None)
+            planned[path] = (info, path)
+    return list(planned.values())
+
+
+def _batches(planned: list[Member]) -> Iterable[list[Member]]:
+    batch: list[Member] = []
+    size = 0
+    # Largest members first, so one big file does not end up last on a single thread.
+    for member in sorted(planned, key=lambda item: item[0].file_size, reverse=True):
+        batch.append(member)
+        size += member[0].file_size
+        if size >= BATCH_BYTES or len(batch) >= BATCH_MEMBERS:
+            yield batch
+            batch, size = [], 0
+    if batch:
+        yield batch
+
+
+def _extract_batch(archive: zipfile.ZipFile, target: Path, batch: list[Member]) -> None:
+    # ``ZipFile`` serialises reads of the underlying file but decompresses outside its
+    # lock, and zlib releases the GIL, so threads sharing one archive run in parallel.
+    created: set[str] = set()
+    for info, path in batch:
+        destination = os.path.join(target, *path.parts)
+        directory = destination if info.is_dir() else os.path.dirname(destination)
+        if directory not in created:
+            os.makedirs(directory, exist_ok=True)
+            created.add(directory)
+        if info.is_dir():
+            continue
+        with archive.open(info) as source, open(destination, "wb", buffering=0) as sink:
+            shutil.copyfileobj(source, sink, COPY_BUFFER_SIZE)
+
+
+def extract_archive(
+    source: BinaryIO, target_dir: Path, limits: ExtractionLimits, executor: Executor | None = None
+) -> ExtractionStats:
+    """Extract a zip archive into ``target_dir``, replacing it if it exists.
+
+    The archive is validated with :func:`scan_archive` first, then unpacked into a
+    staging directory next to ``target_dir`` (across ``executor`` when given) and
+    renamed into place, so readers never see a half-extracted report.
+    """
+
+    started = time.perf_counter()
+    try:
+        archive = zipfile.ZipFile(source)
+    except zipfile.BadZipFile:
+        raise _reject("Upload must be a zip archive containing an Allure report.") from None
+
+    with archive:
+        planned = scan_archive(archive, limits)
+        target_dir.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=target_dir.parent, prefix=f".{target_dir.name}.staging-"))
+        try:
+            if executor is None:
+                for batch in _batches(planned):
+                    _extract_batch(archive, staging, batch)
+            else:
+                futures = [executor.submit(_extract_batch, archive, staging, batch) for batch in _batches(planned)]
+                # Let every batch settle before the staging directory can be removed.
+                wait(futures)
+                for future in futures:
+                    future.result()
+            if target_dir.exists():
+                shutil.rmtree(target_dir)
+            os.replace(staging, target_dir)
+        except (zipfile.BadZipFile, zlib.error, EOFError) as exc:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise _reject(f"Archive is corrupt: {exc}.") from None
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    stats = ExtractionStats(
+        members=len(planned),
+        total_bytes=sum(info.file_size for info, _ in planned),
+        seconds=time.perf_counter() - started,
+    )
+    logger.info(
+        "Extracted %d entries (%.1f MiB) into %s in %.3f s (%.1f MiB/s)",
+        stats.members,
+        stats.total_bytes / COPY_BUFFER_SIZE,
+        target_dir,
+        stats.seconds,
+        stats.throughput / COPY_BUFFER_SIZE,
+    )
+    return stats
+
+
+__all__ = ["ExtractionLimits", "ExtractionStats", "extract_archive", "scan_archive"]
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import copy
+import csv
+import json
+import math
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from app.services.files import write_atomic
+
+METRICS = ("rps", "failure_rate", "p50", "p95", "p99")
+SERIES_VERSION = 1
+# JSON stats files larger than this are not considered when looking for results.
+MAX_JSON_STATS_BYTES = 16 * 1024 * 1024
+
+_PERCENTILE_COLUMNS = {"p50": "50%", "p95": "95%", "p99": "99%"}
+
+
+def _number(value: object) -> float:
+    try:
+        number = float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return 0.0
+    return number if math.isfinite(number) else 0.0
+
+
+def _endpoint(method: str | None, name: str, requests: int, failures: int, rps: float, **percentiles: float) -> dict:
+    return {
+        "method": method or None,
+        "name": name,
+        "requests": requests,
+        "failures": failures,
+        "rps": rps,
+        "failure_rate": failures / requests if requests else 0.0,
+        **{metric: percentiles.get(metric, 0.0) for metric in ("p50", "p95", "p99")},
+    }
+
+
+def _parse_stats_csv(path: Path) -> list[dict]:
+    """Endpoints from Locust's ``--csv`` ``*_stats.csv`` (the ``Aggregated`` row is skipped)."""
+
+    endpoints: list[dict] = []
+    with path.open(newline="", encoding="utf-8") as fp:
+        for row in csv.DictReader(fp):
+            if row.get("Name") == "Aggregated" or not row.get("Name"):
+                continue
+            endpoints.append(
+                _endpoint(
+                    row.get("Type"),
+                    row["Name"],
+                    int(_number(row.get("Request Count"))),
+                    int(_number(row.get("Failure Count"))),
+                    _number(row.get("Requests/s")),
+                    **{metric: _number(row.get(column)) for metric, column in _PERCENTILE_COLUMNS.items()},
+                )
+            )
+    return endpoints
+
+
+def _histogram_percentile(response_times: dict[str, int], total: int, fraction: float) -> float:
+    if not total:
+        return 0.0
+    threshold = total * fraction
+    seen = 0
+    for response_time, count in sorted(((_number(key), value) for key, value in response_times.items())):
+        seen += count
+        if seen >= threshold:
+            return response_time
+    return 0.0
+
+
+def _parse_locust_json(entries: list) -> list[dict]:
+    """Endpoints from Locust's ``--json`` output (raw per-endpoint stats)."""
+
+    endpoints: list[dict] = []
+    for entry in entries:
+        requests = int(_number(entry.get("num_requests")))
+        elapsed = _number(entry.get("last_request_timestamp")) - _number(entry.get("start_time"))
+        response_times = entry.get("response_times") or {}
+        endpoints.append(
+            _endpoint(
+                entry.get("method"),
+                str(entry.get("name", "")),
+                requests,
+                int(_number(entry.get("num_failures"))),
+                requests / elapsed if elapsed > 0 else 0.0,
+                p50=_histogram_percentile(response_times, requests, 0.50),
+                p95=_histogram_percentile(response_times, requests, 0.95),
+                p99=_histogram_percentile(response_times, requests, 0.99),
+            )
+        )
+    return endpoints
+
+
+def _parse_summary_json(summary: dict) -> list[dict]:
+    """Endpoints from a ``{"endpoints": [...]}`` summary (as written by openapi-locustgen)."""
+
+    endpoints: list[dict] = []
+    for entry in summary["endpoints"]:
+        if not isinstance(entry, dict) or not entry.get("name"):
+            continue
+        requests = int(_number(entry.get("requests")))
+        failures = int(_number(entry.get("failures")))
+        record = _endpoint(
+            entry.get("method"),
+            str(entry["name"]),
+            requests,
+            failures,
+            _number(entry.get("rps")),
+            **{metric: _number(entry.get(metric)) for metric in ("p50", "p95", "p99")},
+        )
+        if "failure_rate" in entry:
+            record["failure_rate"] = _number(entry["failure_rate"])
+        endpoints.append(record)
+    return endpoints
+
+
+def _is_summary(data: object) -> bool:
+    endpoints = data.get("endpoints") if isinstance(data, dict) else None
+    return (
+        isinstance(endpoints, list)
+        and bool(endpoints)
+        and all(isinstance(entry, dict) and entry.get("name") and "requests" in entry for entry in endpoints)
+    )
+
+
+def find_loadtest_results(report_dir: Path) -> list[dict] | None:
+    """Per-endpoint results from Locust stats in an extracted archive, or ``None`` if there are none.
+
+    Files without at least one endpoint are skipped, so they are never stored as empty runs.
+    """
+
+    for path in sorted(report_dir.rglob("*_stats.csv")):
+        try:
+            endpoints = _parse_stats_csv(path)
+        except (OSError, UnicodeDecodeError, csv.Error):
+            continue
+        if endpoints:
+            return endpoints
+
+    for path in sorted(report_dir.rglob("*.json")):
+        try:
+            if path.stat().st_size > MAX_JSON_STATS_BYTES:
+                continue
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            continue
+        if _is_summary(data):
+            return _parse_summary_json(data)
+        if isinstance(data, list) and data and all(isinstance(entry, dict) and "num_requests" in entry for entry in data):
+            return _parse_locust_json(data)
+    return None
+
+
+def endpoint_key(endpoint: dict) -> str:
+    return f"{endpoint['method']} {endpoint['name']}" if endpoint.get("method") else endpoint["name"]
+
+
+class LoadTestStore:
+    """Columnar per-project, per-environment time series of load-test results.
+
+    Each series is one JSON file holding parallel arrays -- build ids, upload times and,
+    for every endpoint, one array per metric with ``null`` for builds that did not hit
+    the endpoint::
+
+        {"builds": ["b1", "b2"], "timestamps": [...],
+         "endpoints": {"GET /pets": {"method": "GET", "name": "/pets",
+                                     "p95": [41.0, 44.0], ...}}}
+
+    so charting hundreds of builds reads and parses a single small file. Parsed series
+    are cached in memory and revalidated against the file's mtime and size. Callers
+    serialise writes per project (see ``ProjectStorageService._project_lock``).
+    """
+
+    def __init__(self, projects_dir: Path) -> None:
+        self.projects_dir = projects_dir
+        self._cache: dict[Path, tuple[tuple[int, int], dict]] = {}
+        self._cache_lock = threading.Lock()
+
+    def series_path(self, project: str, environment: str) -> Path:
+        return self.projects_dir / project / "loadtests" / f"{environment}.json"
+
+    def close(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    def load(self, project: str, environment: str) -> dict:
+        path = self.series_path(project, environment)
+        try:
+            stat = path.stat()
+        except OSError:
+            return self._empty()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._cache_lock:
+            cached = self._cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        try:
+            series = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return self._empty()
+        if series.get("version") != SERIES_VERSION:
+            return self._empty()
+        with self._cache_lock:
+            self._cache[path] = (signature, series)
+        return series
+
+    @staticmethod
+    def _empty() -> dict:
+        return {"version": SERIES_VERSION, "builds": [], "timestamps": [], "endpoints": {}}
+
+    def _save(self, project: str, environment: str, series: dict) -> None:
+        path = self.series_path(project, environment)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, json.dumps(series, separators=(",", ":")).encode("utf-8"))
+        with self._cache_lock:
+            self._cache.pop(path, None)
+
+    def append(
+        self, project: str, environment: str, build_id: str, uploaded_at: datetime, endpoints: list[dict]
+    ) -> None:
+        series = copy.deepcopy(self.load(project, environment))  # never mutate the cached copy
+        if build_id in series["builds"]:
+            self._drop(series, {build_id})
+        size = len(series["builds"])
+        series["builds"].append(build_id)
+        series["timestamps"].append(uploaded_at.isoformat())
+
+        results = {endpoint_key(endpoint): endpoint for endpoint in endpoints}
+        for key, column in series["endpoints"].items():
+            result = results.pop(key, None)
+            for metric in METRICS:
+                column[metric].append(result[metric] if result else None)
+        for key, result in results.items():
+            column = {"method": result["method"], "name": result["name"]}
+            for metric in METRICS:
+                column[metric] = [None] * size + [result[metric]]
+            series["endpoints"][key] = column
+        self._save(project, environment, series)
+
+    def remove_builds(self, project: str, environment: str, build_ids: set[str]) -> None:
+        series = self.load(project, environment)
+        if not build_ids.intersection(series["builds"]):
+            return
+        series = copy.deepcopy(series)
+        self._drop(series, build_ids)
+        self._save(project, environment, series)
+
+    @staticmethod
+    def _drop(series: dict, build_ids: set[str]) -> None:
+        keep = [index for index, build in enumerate(series["builds"]) if build not in build_ids]
+        series["builds"] = [series["builds"][index] for index in keep]
+        series["timestamps"] = [series["timestamps"][index] for index in keep]
+        for key in list(series["endpoints"]):
+            column = series["endpoints"][key]
+            for metric in METRICS:
+                column[metric] = [column[metric][index] for index in keep]
+            if all(value is None for value in column["rps"]):
+                del series["endpoints"][key]
+
+    def trends(
+        self,
+        project: str,
+        environment: str,
+        endpoints: list[str] | None = None,
+        metrics: list[str] | None = None,
+        limit: int | None = None,
+    ) -> dict[str, object]:
+        series = self.load(project, environment)
+        window = slice(-limit, None) if limit else slice(None)
+        selected_metrics = metrics or list(METRICS)
+        wanted = set(endpoints) if endpoints else None
+        return {
+            "project": project,
+            "environment": environment,
+            "builds": series["builds"][window],
+            "timestamps": series["timestamps"][window],
+            "endpoints": {
+                key: {
+                    "method": column["method"],
+                    "name": column["name"],
+                    **{metric: column[metric][window] for metric in selected_metrics},
+                }
+                for key, column in series["endpoints"].items()
+                if wanted is None or key in wanted or column["name"] in wanted
+            },
+        }
+
+
+__all__ = ["METRICS", "LoadTestStore", "endpoint_key", "find_loadtest_results"]
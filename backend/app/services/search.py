@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import html
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    project TEXT NOT NULL,
+    environment TEXT NOT NULL,
+    build_id TEXT NOT NULL,
+    uploaded_at TEXT NOT NULL,
+    name TEXT NOT NULL,
+    full_name TEXT,
+    suite TEXT,
+    status TEXT NOT NULL,
+    message TEXT
+);
+CREATE INDEX IF NOT EXISTS results_build ON results (project, environment, build_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS results_fts USING fts5(
+    name, full_name, suite, message, content='results', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS results_ai AFTER INSERT ON results BEGIN
+    INSERT INTO results_fts (rowid, name, full_name, suite, message)
+    VALUES (new.id, new.name, new.full_name, new.suite, new.message);
+END;
+CREATE TRIGGER IF NOT EXISTS results_ad AFTER DELETE ON results BEGIN
+    INSERT INTO results_fts (results_fts, rowid, name, full_name, suite, message)
+    VALUES ('delete', old.id, old.name, old.full_name, old.suite, old.message);
+END;
+CREATE TRIGGER IF NOT EXISTS results_au AFTER UPDATE ON results BEGIN
+    INSERT INTO results_fts (results_fts, rowid, name, full_name, suite, message)
+    VALUES ('delete', old.id, old.name, old.full_name, old.suite, old.message);
+    INSERT INTO results_fts (rowid, name, full_name, suite, message)
+    VALUES (new.id, new.name, new.full_name, new.suite, new.message);
+END;
+"""
+
+_SUITE_LABELS = ("parentSuite", "suite", "subSuite")
+# snippet() marks matches with these private-use characters; the text around them is
+# HTML-escaped before they are swapped for ``<mark>`` tags.
+_MATCH_START = "\ue000"
+_MATCH_END = "\ue001"
+
+
+def _suite(test_case: dict) -> str | None:
+    labels = {
+        label.get("name"): label.get("value")
+        for label in test_case.get("labels") or []
+        if isinstance(label, dict) and label.get("name") in _SUITE_LABELS
+    }
+    parts = [labels[name] for name in _SUITE_LABELS if labels.get(name)]
+    return " / ".join(parts) or None
+
+
+def iter_test_results(report_dir: Path) -> Iterator[tuple[str, str | None, str | None, str, str | None]]:
+    """Yield ``(name, full_name, suite, status, message)`` for each test case of an Allure report."""
+
+    try:
+        entries = os.scandir(report_dir / "data" / "test-cases")
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                with open(entry.path, encoding="utf-8") as fp:
+                    test_case = json.load(fp)
+            except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+                continue
+            if not isinstance(test_case, dict) or not (test_case.get("name") or test_case.get("fullName")):
+                continue
+            yield (
+                test_case.get("name") or test_case["fullName"],
+                test_case.get("fullName"),
+                _suite(test_case),
+                test_case.get("status") or "unknown",
+                test_case.get("statusMessage"),
+            )
+
+
+def _timestamp(value: datetime) -> str:
+    # Upload times are stored as naive UTC ISO strings (``datetime.utcnow()``).
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat()
+
+
+def highlight(snippet: str) -> str:
+    """HTML-escape an FTS5 snippet and turn its match sentinels into ``<mark>`` tags."""
+
+    cleaned = html.escape(snippet)
+    return cleaned.replace(_MATCH_START, "<mark>").replace(_MATCH_END, "</mark>")
+
+
+def match_expression(query: str) -> str:
+    """Turn free text into an FTS5 query that matches every word literally.
+
+    Each whitespace-separated token is quoted so FTS5 operators and punctuation in user
+    input (``-``, ``:``, ``AND``...) are treated as text; a trailing ``*`` keeps prefix
+    matching.
+    """
+
+    terms = []
+    for token in query.split():
+        prefix = token.endswith("*") and len(token) > 1
+        token = token.rstrip("*") if prefix else token
+        quoted = '"' + token.replace('"', '""') + '"'
+        terms.append(f"{quoted}*" if prefix else quoted)
+    return " ".join(terms)
+
+
+class SearchIndex:
+    """SQLite FTS5 index over test names, suites and failure messages of ingested builds.
+
+    Rows live in a plain ``results`` table (filterable by project, environment, upload
+    time and status); ``results_fts`` is an external-content FTS5 table kept in sync by
+    triggers, so text is stored once. The database is opened on first use and shared by
+    all requests behind a lock.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def index_build(
+        self, project: str, environment: str, build_id: str, uploaded_at: datetime, report_dir: Path
+    ) -> int:
+        """(Re)index every test case of a build and return the number of rows written."""
+
+        timestamp = _timestamp(uploaded_at)
+        rows = [
+            (project, environment, build_id, timestamp, *result) for result in iter_test_results(report_dir)
+        ]
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("BEGIN")
+                connection.execute(
+                    "DELETE FROM results WHERE project = ? AND environment = ? AND build_id = ?",
+                    (project, environment, build_id),
+                )
+                connection.executemany(
+                    "INSERT INTO results (project, environment, build_id, uploaded_at, name, full_name, suite, "
+                    "status, message) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        return len(rows)
+
+    def remove_builds(self, project: str, builds: Iterable[tuple[str, str]]) -> None:
+        """Drop the rows of ``(environment, build_id)`` pairs evicted from ``project``."""
+
+        builds = list(builds)
+        if not builds:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("BEGIN")
+                connection.executemany(
+                    "DELETE FROM results WHERE project = ? AND environment = ? AND build_id = ?",
+                    [(project, environment, build_id) for environment, build_id in builds],
+                )
+
+    def search(
+        self,
+        query: str,
+        *,
+        project: str | None = None,
+        environment: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        status: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> dict[str, object]:
+        expression = match_expression(query)
+        if not expression:
+            return {"results": [], "limit": limit, "offset": offset, "hasMore": False}
+
+        clauses = ["results_fts MATCH ?"]
+        parameters: list[object] = [expression]
+        for column, value in (("project", project), ("environment", environment), ("status", status)):
+            if value is not None:
+                clauses.append(f"r.{column} = ?")
+                parameters.append(value)
+        if since is not None:
+            clauses.append("r.uploaded_at >= ?")
+            parameters.append(_timestamp(since))
+        if until is not None:
+            clauses.append("r.uploaded_at <= ?")
+            parameters.append(_timestamp(until))
+
+        # Newest first by rowid lets FTS5 walk its doclists in order instead of sorting all
+        # matches; one extra row tells whether another page exists without a COUNT(*).
+        sql = (
+            "SELECT r.project, r.environment, r.build_id, r.uploaded_at, r.name, r.full_name, r.suite, r.status, "
+            "r.message, snippet(results_fts, 3, ?, ?, '…', 16) "
+            "FROM results_fts JOIN results r ON r.id = results_fts.rowid "
+            f"WHERE {' AND '.join(clauses)} ORDER BY results_fts.rowid DESC LIMIT ? OFFSET ?"
+        )
+        parameters = [_MATCH_START, _MATCH_END, *parameters, limit + 1, offset]
+        with self._lock:
+            rows = self._connect().execute(sql, parameters).fetchall()
+
+        results = [
+            {
+                "project": row[0],
+                "environment": row[1],
+                "buildId": row[2],
+                "uploadedAt": row[3],
+                "name": row[4],
+                "fullName": row[5],
+                "suite": row[6],
+                "status": row[7],
+                "message": row[8],
+                "snippet": highlight(row[9]) if row[8] else None,
+            }
+            for row in rows[:limit]
+        ]
+        return {"results": results, "limit": limit, "offset": offset, "hasMore": len(rows) > limit}
+
+
+__all__ = ["SearchIndex", "highlight", "iter_test_results", "match_expression"]
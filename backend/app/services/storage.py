@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import json
+import os
 import shutil
-import tempfile
-import zipfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -12,18 +16,67 @@ from fastapi import HTTPException
 from app.core.settings import (
     ALLOWED_ENVIRONMENTS,
     DEFAULT_ENVIRONMENT,
+    DIFF_CACHE_SIZE,
+    EXTRACTION_WORKERS,
+    MAX_ARCHIVE_COMPRESSION_RATIO,
+    MAX_ARCHIVE_MEMBERS,
+    MAX_ARCHIVE_UNCOMPRESSED_BYTES,
     METADATA_FILENAME,
     PROJECTS_DIR,
+    SEARCH_INDEX_FILENAME,
     SUMMARY_FILENAME,
-    ensure_directories,
 )
 from app.models import HistoryEntry, ProjectMetadata, ProjectRetentionSettings
+from app.services.diff import BuildDiffCache, join_outcomes, read_test_outcomes, summarize_diff
+from app.services.extraction import ExtractionLimits, extract_archive
+from app.services.files import write_atomic
+from app.services.loadtests import LoadTestStore, find_loadtest_results
+from app.services.search import SearchIndex
 
 
 class ProjectStorageService:
-    def __init__(self, projects_dir: Path = PROJECTS_DIR) -> None:
-        self.projects_dir = projects_dir
-        ensure_directories()
+    """Filesystem-backed project storage.
+
+    A single instance is created per application (see ``app.main``) and shared by
+    all requests, so anything expensive to set up belongs on the instance rather
+    than in per-request code paths.
+    """
+
+    def __init__(self, projects_dir: Path | None = None, search_index_path: Path | None = None) -> None:
+        self.projects_dir = projects_dir or PROJECTS_DIR
+        self.search_index = SearchIndex(search_index_path or self.projects_dir.parent / SEARCH_INDEX_FILENAME)
+        # Held only while a caller uses it, so idle projects do not keep a lock around.
+        self._project_locks: weakref.WeakValueDictionary[str, threading.Lock] = weakref.WeakValueDictionary()
+        self._project_locks_guard = threading.Lock()
+        self.loadtests = LoadTestStore(self.projects_dir)
+        self.diffs = BuildDiffCache(DIFF_CACHE_SIZE)
+        self.extraction_limits = ExtractionLimits(
+            max_members=MAX_ARCHIVE_MEMBERS,
+            max_uncompressed_bytes=MAX_ARCHIVE_UNCOMPRESSED_BYTES,
+            max_compression_ratio=MAX_ARCHIVE_COMPRESSION_RATIO,
+        )
+        # Shared by all uploads, so concurrent ingests cannot together exceed this many threads.
+        self._extraction_executor = ThreadPoolExecutor(max_workers=EXTRACTION_WORKERS, thread_name_prefix="extract")
+        self.projects_dir.mkdir(parents=True, exist_ok=True)
+
+    def close(self) -> None:
+        """Release resources held by the service. Called on application shutdown."""
+
+        with self._project_locks_guard:
+            self._project_locks.clear()
+        self.loadtests.close()
+        self.diffs.clear()
+        self.search_index.close()
+        self._extraction_executor.shutdown(wait=True, cancel_futures=True)
+
+    def _project_lock(self, project: str) -> threading.Lock:
+        # Uploads and retention updates run concurrently in the threadpool; serialise
+        # read-modify-write cycles on a project's metadata.
+        with self._project_locks_guard:
+            lock = self._project_locks.get(project)
+            if lock is None:
+                lock = self._project_locks[project] = threading.Lock()
+            return lock
 
     @staticmethod
     def validate_environment(environment: str) -> str:
@@ -65,9 +118,8 @@ class ProjectStorageService:
     def save_metadata(self, metadata: ProjectMetadata) -> None:
         project_dir = self.projects_dir / metadata.project
         project_dir.mkdir(parents=True, exist_ok=True)
-        metadata_path = project_dir / METADATA_FILENAME
-        with metadata_path.open("w", encoding="utf-8") as fp:
-            fp.write(metadata.model_dump_json(indent=2))
+        # Listings read metadata files without taking the project lock.
+        write_atomic(project_dir / METADATA_FILENAME, metadata.model_dump_json(indent=2).encode("utf-8"))
 
     # Summary helpers
     def _summary_path(self, project: str, environment: str, build_id: str) -> Path:
@@ -76,7 +128,13 @@ class ProjectStorageService:
     def _legacy_summary_path(self, project: str, build_id: str) -> Path:
         return self.projects_dir / project / "history" / build_id / "widgets" / SUMMARY_FILENAME
 
-    def _load_summary_statistics(self, project: str, build_id: str, environment: str) -> dict[str, int]:
+    def _load_summary_statistics(
+        self,
+        project: str,
+        build_id: str,
+        environment: str,
+        summary_cache: dict[Path, dict[str, int]] | None = None,
+    ) -> dict[str, int]:
         base_stats = {
             "passed": 0,
             "failed": 0,
@@ -93,6 +151,8 @@ class ProjectStorageService:
             summary_path = legacy_summary_path
         if not summary_path.exists():
             return base_stats
+        if summary_cache is not None and summary_path in summary_cache:
+            return summary_cache[summary_path]
 
         try:
             summary_data = json.loads(summary_path.read_text(encoding="utf-8"))
@@ -107,6 +167,8 @@ class ProjectStorageService:
             stats[key] = int(statistic.get(key, 0))
 
         stats["total"] = int(statistic.get("total", sum(stats.values())))
+        if summary_cache is not None:
+            summary_cache[summary_path] = stats
         return stats
 
     @staticmethod
@@ -130,8 +192,33 @@ class ProjectStorageService:
         return None
 
     # Listing endpoints
+    def listing_etag(self, kind: str, environment: str) -> str:
+        """Validator for listing responses, computed from the raw metadata files.
+
+        Every change that affects a listing (upload, retention, settings) rewrites the
+        project's metadata, and build summaries never change once written, so hashing
+        the metadata bytes lets clients revalidate without the server parsing anything.
+        File contents are hashed rather than their mtimes, which filesystems with
+        coarse timestamps can leave unchanged across quick rewrites. ``kind`` names the
+        response shape, so different listings never share a validator.
+        """
+
+        digest = hashlib.sha1(f"{kind}:{environment}".encode(), usedforsecurity=False)
+        try:
+            entries = sorted(entry.name for entry in os.scandir(self.projects_dir) if entry.is_dir())
+        except FileNotFoundError:
+            entries = []
+        for name in entries:
+            try:
+                content = (self.projects_dir / name / METADATA_FILENAME).read_bytes()
+            except FileNotFoundError:
+                digest.update(f"{name}:-;".encode())
+                continue
+            digest.update(f"{name}:{len(content)}:".encode())
+            digest.update(content)
+        return f'W/"{digest.hexdigest()}"'
+
     def list_projects(self, environment: str = DEFAULT_ENVIRONMENT) -> list[dict[str, object]]:
-        ensure_directories()
         projects: list[dict[str, object]] = []
         for project_dir in self.projects_dir.iterdir():
             if not project_dir.is_dir():
@@ -152,7 +239,6 @@ class ProjectStorageService:
         return sorted(projects, key=lambda item: item["project"])
 
     def project_overview(self, environment: str = DEFAULT_ENVIRONMENT) -> list[dict[str, object]]:
-        ensure_directories()
         overview: list[dict[str, object]] = []
 
         for project_dir in self.projects_dir.iterdir():
@@ -160,39 +246,91 @@ class ProjectStorageService:
                 continue
 
             metadata = self.load_metadata(project_dir.name)
-            latest_id = self._latest_for_environment(metadata, environment)
-            statistics = (
-                self._load_summary_statistics(project_dir.name, latest_id, environment)
-                if latest_id
-                else {
-                    "passed": 0,
-                    "failed": 0,
-                    "broken": 0,
-                    "skipped": 0,
-                    "unknown": 0,
-                    "total": 0,
-                }
-            )
+            overview.append(self._overview_entry(project_dir.name, metadata, environment))
+
+        return sorted(overview, key=lambda item: item["project"])
+
+    def project_overview_by_environment(self, environments: list[str]) -> list[dict[str, object]]:
+        """Overview of several environments per project from a single pass over storage.
 
+        Each project's metadata is loaded once and summary files shared between
+        environments (legacy, environment-less builds) are read once.
+        """
+
+        overview: list[dict[str, object]] = []
+
+        for project_dir in self.projects_dir.iterdir():
+            if not project_dir.is_dir():
+                continue
+
+            metadata = self.load_metadata(project_dir.name)
+            summary_cache: dict[Path, dict[str, int]] = {}
             overview.append(
                 {
                     "project": project_dir.name,
-                    "latest": latest_id,
-                    "environment": environment,
-                    "lastRun": self._last_run_for_project(metadata, environment),
-                    "status": self._derive_status(statistics),
-                    "statistics": statistics,
                     "retentionRuns": metadata.retention_runs,
                     "retentionDays": metadata.retention_days,
-                    "reportUrl": self._build_report_url(project_dir.name, latest_id, environment),
+                    "environments": {
+                        environment: self._overview_entry(project_dir.name, metadata, environment, summary_cache)
+                        for environment in environments
+                    },
                 }
             )
 
         return sorted(overview, key=lambda item: item["project"])
 
+    def _overview_entry(
+        self,
+        project: str,
+        metadata: ProjectMetadata,
+        environment: str,
+        summary_cache: dict[Path, dict[str, int]] | None = None,
+    ) -> dict[str, object]:
+        latest_id = self._latest_for_environment(metadata, environment)
+        statistics = (
+            self._load_summary_statistics(project, latest_id, environment, summary_cache)
+            if latest_id
+            else {
+                "passed": 0,
+                "failed": 0,
+                "broken": 0,
+                "skipped": 0,
+                "unknown": 0,
+                "total": 0,
+            }
+        )
+
+        return {
+            "project": project,
+            "latest": latest_id,
+            "environment": environment,
+            "lastRun": self._last_run_for_project(metadata, environment),
+            "status": self._derive_status(statistics),
+            "statistics": statistics,
+            "retentionRuns": metadata.retention_runs,
+            "retentionDays": metadata.retention_days,
+            "reportUrl": self._build_report_url(project, latest_id, environment),
+        }
+
     # Retention
-    def cleanup_project_history(self, metadata: ProjectMetadata) -> bool:
-        if metadata.retention_runs is None and metadata.retention_days is None:
+    def cleanup_project_history(self, metadata: ProjectMetadata, environment: str | None = None) -> bool:
+        """Apply the project's retention limits to ``metadata`` and delete evicted builds.
+
+        ``metadata.history`` is kept ordered by upload time, so expired builds are found
+        by bisecting on the cutoff. Run limits count builds per environment
+        (``retention_runs_by_environment`` overrides ``retention_runs``), so a busy
+        environment never evicts another's runs; the metadata keeps each environment's
+        builds in their own ordered list, so finding the builds over a limit costs only
+        as much as evicting them. Passing ``environment`` after an upload restricts the
+        run-limit check to the only environment that can have grown. Allure reports and
+        load-test results are counted separately.
+        """
+
+        if (
+            metadata.retention_runs is None
+            and metadata.retention_days is None
+            and not metadata.retention_runs_by_environment
+        ):
             return False
 
         project_dir = self.projects_dir / metadata.project
@@ -200,61 +338,119 @@ class ProjectStorageService:
         if not history_dir.exists():
             return False
 
-        now = datetime.utcnow()
-        entries = sorted(metadata.history, key=lambda entry: entry.uploaded_at, reverse=True)
+        evicted: list[HistoryEntry] = []
 
-        retained: list[HistoryEntry] = []
-        for entry in entries:
-            if metadata.retention_days is not None and entry.uploaded_at < now - timedelta(days=metadata.retention_days):
-                continue
-            retained.append(entry)
-
-        if metadata.retention_runs is not None:
-            retained = retained[: metadata.retention_runs]
+        if metadata.retention_days is not None:
+            evicted.extend(metadata.expire_history(datetime.utcnow() - timedelta(days=metadata.retention_days)))
 
-        retained_keys = {(entry.environment, entry.build_id) for entry in retained}
-        removed_entries = [entry for entry in entries if (entry.environment, entry.build_id) not in retained_keys]
-        for entry in removed_entries:
+        for env, report_type in metadata.history_kinds():
+            if environment is not None and env != environment:
+                continue
+            limit = metadata.retention_runs_by_environment.get(env, metadata.retention_runs)
+            if limit is not None:
+                evicted.extend(metadata.trim_history(env, report_type, limit))
+
+        # Re-uploads replace their history entry, but metadata written before that may still
+        # list a build twice; never delete a build directory a retained entry points at.
+        removed = [entry for entry in evicted if not metadata.has_build(entry.environment, entry.build_id)]
+        for entry in removed:
             target_dir = history_dir / entry.environment / entry.build_id
             legacy_dir = history_dir / entry.build_id
             if target_dir.exists():
                 shutil.rmtree(target_dir, ignore_errors=True)
             elif legacy_dir.exists():
                 shutil.rmtree(legacy_dir, ignore_errors=True)
+        self._purge_builds(metadata.project, removed)
 
         latest_id = metadata.latest
-        if latest_id and latest_id not in {entry.build_id for entry in retained}:
-            metadata.latest = retained[0].build_id if retained else None
-
-        metadata.history = retained
-        for env, build_id in list(metadata.latest_by_environment.items()):
-            env_history = [entry for entry in retained if entry.environment == env]
-            if env_history:
-                metadata.latest_by_environment[env] = env_history[0].build_id
+        self._repair_latest(metadata, removed)
+        return bool(evicted or latest_id != metadata.latest)
+
+    def _purge_builds(self, project: str, entries: list[HistoryEntry]) -> None:
+        """Drop cached diffs, search rows and load-test points of builds no longer stored."""
+
+        if not entries:
+            return
+        self.diffs.invalidate(project, {entry.build_id for entry in entries})
+        self.search_index.remove_builds(
+            project, [(entry.environment, entry.build_id) for entry in entries if entry.report_type == "allure"]
+        )
+        for env in {entry.environment for entry in entries if entry.report_type == "loadtest"}:
+            self.loadtests.remove_builds(
+                project,
+                env,
+                {entry.build_id for entry in entries if entry.environment == env and entry.report_type == "loadtest"},
+            )
+
+    @staticmethod
+    def _repair_latest(metadata: ProjectMetadata, removed: list[HistoryEntry]) -> None:
+        """Point ``latest`` pointers at removed builds back to the newest remaining report."""
+
+        # Only Allure reports can be served, so ``latest`` never points at load-test results.
+        history = metadata.history
+        removed_ids = {entry.build_id for entry in removed}
+        if metadata.latest in removed_ids:
+            metadata.latest = next(
+                (entry.build_id for entry in reversed(history) if entry.report_type == "allure"), None
+            )
+
+        for env in {entry.environment for entry in removed}:
+            if metadata.latest_by_environment.get(env) not in removed_ids:
+                continue
+            newest = next(
+                (entry for entry in reversed(history) if entry.environment == env and entry.report_type == "allure"),
+                None,
+            )
+            if newest is not None:
+                metadata.latest_by_environment[env] = newest.build_id
             else:
                 metadata.latest_by_environment.pop(env, None)
 
-        return bool(removed_entries or latest_id != metadata.latest)
-
     # Upload handling
     def process_upload(self, project: str, upload_content: bytes, build_id: str, environment: str) -> None:
         try:
             report_dir = self._extract_upload(project, upload_content, build_id, environment)
+            self.diffs.invalidate(project, {build_id})
             index_path = report_dir / "index.html"
+            loadtest_results = None
             if not index_path.exists():
-                raise HTTPException(
-                    status_code=400,
-                    detail="Uploaded archive does not contain an Allure report (index.html missing).",
+                loadtest_results = find_loadtest_results(report_dir)
+                if loadtest_results is None:
+                    raise HTTPException(
+                        status_code=400,
+                        detail="Uploaded archive does not contain an Allure report (index.html missing).",
+                    )
+
+            uploaded_at = datetime.utcnow()
+            if loadtest_results is None:
+                # Index before retention runs, so a build evicted straight away is pruned too.
+                self.search_index.index_build(project, environment, build_id, uploaded_at, report_dir)
+
+            with self._project_lock(project):
+                metadata = self.load_metadata(project)
+                entry = HistoryEntry(
+                    build_id=build_id,
+                    uploaded_at=uploaded_at,
+                    environment=environment,
+                    report_type="allure" if loadtest_results is None else "loadtest",
                 )
-
-            metadata = self.load_metadata(project)
-            metadata.latest = build_id
-            metadata.latest_by_environment[environment] = build_id
-            metadata.history.append(
-                HistoryEntry(build_id=build_id, uploaded_at=datetime.utcnow(), environment=environment)
-            )
-            self.cleanup_project_history(metadata)
-            self.save_metadata(metadata)
+                if loadtest_results is not None:
+                    self.loadtests.append(project, environment, build_id, entry.uploaded_at, loadtest_results)
+                # A re-upload under the same build id replaces the earlier entry; if it changed
+                # report type, the old type's rows describe a report that is gone.
+                replaced = [
+                    previous
+                    for previous in metadata.add_history_entry(entry)
+                    if previous.report_type != entry.report_type
+                ]
+                self._purge_builds(project, replaced)
+                if loadtest_results is None:
+                    metadata.latest = build_id
+                    metadata.latest_by_environment[environment] = build_id
+                else:
+                    self._repair_latest(metadata, replaced)
+                self.cleanup_project_history(metadata, environment)
+                self.save_metadata(metadata)
         finally:
             # No open file handles are held, but this keeps the contract symmetrical with upload caller.
             pass
@@ -265,20 +461,7 @@ class ProjectStorageService:
         history_dir.mkdir(parents=True, exist_ok=True)
 
         target_dir = history_dir / build_id
-        if target_dir.exists():
-            shutil.rmtree(target_dir)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            tmp_path = Path(temp_dir) / "upload.zip"
-            with tmp_path.open("wb") as buffer:
-                buffer.write(upload_content)
-
-            with tempfile.TemporaryDirectory() as extract_dir:
-                with zipfile.ZipFile(tmp_path, "r") as archive:
-                    archive.extractall(extract_dir)
-
-                shutil.copytree(extract_dir, target_dir)
-
+        extract_archive(io.BytesIO(upload_content), target_dir, self.extraction_limits, self._extraction_executor)
         return target_dir
 
     # Report serving
@@ -317,23 +500,103 @@ class ProjectStorageService:
         return safe_path
 
     # Retention endpoints
-    def get_retention_settings(self, project: str) -> ProjectRetentionSettings:
-        metadata = self.load_metadata(project)
+    @staticmethod
+    def _retention_settings(metadata: ProjectMetadata) -> ProjectRetentionSettings:
         return ProjectRetentionSettings(
-            retention_runs=metadata.retention_runs, retention_days=metadata.retention_days
+            retention_runs=metadata.retention_runs,
+            retention_days=metadata.retention_days,
+            retention_runs_by_environment=dict(metadata.retention_runs_by_environment),
         )
 
+    def get_retention_settings(self, project: str) -> ProjectRetentionSettings:
+        return self._retention_settings(self.load_metadata(project))
+
     def update_retention_settings(self, project: str, settings: ProjectRetentionSettings) -> ProjectRetentionSettings:
-        ensure_directories()
-        metadata = self.load_metadata(project)
-        metadata.retention_runs = settings.retention_runs
-        metadata.retention_days = settings.retention_days
+        for environment in settings.retention_runs_by_environment:
+            self.validate_environment(environment)
 
-        self.cleanup_project_history(metadata)
-        self.save_metadata(metadata)
+        with self._project_lock(project):
+            metadata = self.load_metadata(project)
+            metadata.retention_runs = settings.retention_runs
+            metadata.retention_days = settings.retention_days
+            metadata.retention_runs_by_environment = dict(settings.retention_runs_by_environment)
 
-        return ProjectRetentionSettings(
-            retention_runs=metadata.retention_runs, retention_days=metadata.retention_days
+            self.cleanup_project_history(metadata)
+            self.save_metadata(metadata)
+
+        return self._retention_settings(metadata)
+
+    # Load tests
+    def loadtest_trends(
+        self,
+        project: str,
+        environment: str,
+        endpoints: list[str] | None = None,
+        metrics: list[str] | None = None,
+        limit: int | None = None,
+    ) -> dict[str, object]:
+        return self.loadtests.trends(project, environment, endpoints, metrics, limit)
+
+    # Build diffs
+    def _build_dir(self, project: str, build_id: str, environment: str) -> Path:
+        history_dir = self.projects_dir / project / "history"
+        build_dir = history_dir / environment / build_id
+        if not build_dir.is_dir() and (history_dir / build_id).is_dir():
+            build_dir = history_dir / build_id
+        build_dir = self.safe_join(history_dir, build_dir)
+        if not build_dir.is_dir():
+            raise HTTPException(status_code=404, detail=f"Build {build_id} not found.")
+        return build_dir
+
+    def diff_builds(
+        self, project: str, base: str, head: str, environment: str = DEFAULT_ENVIRONMENT, threshold: float = 20.0
+    ) -> dict[str, object]:
+        """Compare per-test outcomes and durations of two stored builds.
+
+        Joined outcomes are cached per build pair (builds are immutable), so only the
+        first view of a pair reads the reports' test-case files.
+        """
+
+        key = (project, environment, base, head)
+        rows = self.diffs.get(key)
+        if rows is None:
+            generation = self.diffs.generation(project)
+            base_dir = self._build_dir(project, base, environment)
+            head_dir = self._build_dir(project, head, environment)
+            rows = join_outcomes(read_test_outcomes(base_dir), read_test_outcomes(head_dir))
+            self.diffs.put(key, rows, generation)
+
+        return {
+            "project": project,
+            "environment": environment,
+            "base": base,
+            "head": head,
+            "threshold": threshold,
+            **summarize_diff(rows, threshold),
+        }
+
+    # Search
+    def search_results(
+        self,
+        query: str,
+        *,
+        project: str | None = None,
+        environment: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        status: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> dict[str, object]:
+        return self.search_index.search(
+            query,
+            project=project,
+            environment=environment,
+            since=since,
+            until=until,
+            status=status,
+            limit=limit,
+            offset=offset,
         )
 
     # Details endpoints
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import io
+import zipfile
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
 from pathlib import Path
 
 import httpx
@@ -24,16 +26,33 @@ def temp_projects_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     import app.services.storage as storage
 
     monkeypatch.setattr(storage, "PROJECTS_DIR", projects_dir)
-    monkeypatch.setattr(storage, "DATA_DIR", data_dir)
-    monkeypatch.setattr(storage, "ensure_directories", settings.ensure_directories)
 
     settings.ensure_directories()
     return projects_dir
 
 
+ArchiveBuilder = Callable[[Mapping[str, str | bytes]], bytes]
+
+
+@pytest.fixture()
+def make_archive() -> ArchiveBuilder:
+    """Build an upload: a deflated zip with one member per ``{name: content}`` item."""
+
+    def build(files: Mapping[str, str | bytes]) -> bytes:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for name, content in files.items():
+                archive.writestr(name, content)
+        return buffer.getvalue()
+
+    return build
+
+
 @pytest.fixture()
-def storage_service(temp_projects_dir: Path) -> ProjectStorageService:
-    return ProjectStorageService(projects_dir=temp_projects_dir)
+def storage_service(temp_projects_dir: Path) -> Iterator[ProjectStorageService]:
+    service = ProjectStorageService(projects_dir=temp_projects_dir)
+    yield service
+    service.close()
 
 
 @pytest.fixture()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import HistoryEntry, ProjectMetadata
+from app.services.storage import ProjectStorageService
+
+
+def _write_build(projects_dir, build_id: str, tests: dict[str, tuple[str, int]], environment: str = "prod") -> None:
+    cases_dir = projects_dir / "demo" / "history" / environment / build_id / "data" / "test-cases"
+    cases_dir.mkdir(parents=True)
+    for index, (name, (status, duration)) in enumerate(tests.items()):
+        case = {
+            "uid": f"{build_id}-{index}",
+            "name": name,
+            "fullName": f"suite.{name}",
+            "historyId": f"history-{name}",
+            "status": status,
+            "statusMessage": "AssertionError: boom" if status == "failed" else None,
+            "time": {"start": 1000 + index, "stop": 1000 + index + duration, "duration": duration},
+        }
+        cases_dir.joinpath(f"{index}.json").write_text(json.dumps(case), encoding="utf-8")
+
+
+@pytest.fixture()
+def two_builds(temp_projects_dir):
+    _write_build(
+        temp_projects_dir,
+        "base",
+        {"login": ("passed", 100), "logout": ("failed", 50), "search": ("passed", 200), "gone": ("passed", 1)},
+    )
+    _write_build(
+        temp_projects_dir,
+        "head",
+        {"login": ("failed", 105), "logout": ("passed", 50), "search": ("passed", 300), "new": ("broken", 1)},
+    )
+
+
+def test_diff_builds_classifies_changes(storage_service: ProjectStorageService, two_builds):
+    diff = storage_service.diff_builds("demo", "base", "head", threshold=20)
+
+    assert diff["summary"] == {"tests": 5, "newlyFailing": 2, "fixed": 1, "slower": 1, "added": 1, "removed": 1}
+    assert [item["name"] for item in diff["newlyFailing"]] == ["suite.login", "suite.new"]
+    assert diff["newlyFailing"][0]["message"] == "AssertionError: boom"
+    assert [item["name"] for item in diff["fixed"]] == ["suite.logout"]
+    assert diff["slower"][0]["name"] == "suite.search"
+    assert diff["slower"][0]["change"] == 50.0
+
+    assert storage_service.diff_builds("demo", "base", "head", threshold=60)["summary"]["slower"] == 0
+
+
+def test_diff_cache_is_invalidated_on_retention_eviction(
+    storage_service: ProjectStorageService, two_builds, temp_projects_dir
+):
+    storage_service.diff_builds("demo", "base", "head")
+    assert storage_service.diffs.get(("demo", "prod", "base", "head")) is not None
+
+    metadata = ProjectMetadata(
+        project="demo",
+        latest="head",
+        latest_by_environment={"prod": "head"},
+        history=[
+            HistoryEntry(build_id="base", uploaded_at=datetime.utcnow() - timedelta(hours=1)),
+            HistoryEntry(build_id="head", uploaded_at=datetime.utcnow()),
+        ],
+        retention_runs=1,
+    )
+    storage_service.cleanup_project_history(metadata)
+
+    assert storage_service.diffs.get(("demo", "prod", "base", "head")) is None
+    with pytest.raises(Exception) as excinfo:
+        storage_service.diff_builds("demo", "base", "head")
+    assert excinfo.value.status_code == 404
+
+
+def test_diff_is_not_cached_when_invalidated_while_computing(
+    storage_service: ProjectStorageService, two_builds, monkeypatch: pytest.MonkeyPatch
+):
+    import app.services.storage as storage
+
+    read_test_outcomes = storage.read_test_outcomes
+
+    def read_during_cleanup(build_dir):
+        # A concurrent retention pass evicts the build while its report is being read.
+        storage_service.diffs.invalidate("demo", {"base"})
+        return read_test_outcomes(build_dir)
+
+    monkeypatch.setattr(storage, "read_test_outcomes", read_during_cleanup)
+    storage_service.diff_builds("demo", "base", "head")
+    assert storage_service.diffs.get(("demo", "prod", "base", "head")) is None
+
+    monkeypatch.setattr(storage, "read_test_outcomes", read_test_outcomes)
+    storage_service.diff_builds("demo", "base", "head")
+    assert storage_service.diffs.get(("demo", "prod", "base", "head")) is not None
+
+
+@pytest.mark.asyncio
+async def test_diff_endpoint(async_client, two_builds):
+    response = await async_client.get("/api/projects/demo/diff", params={"base": "base", "head": "head"})
+    assert response.status_code == 200
+    assert response.json()["summary"]["newlyFailing"] == 2
+
+    response = await async_client.get("/api/projects/demo/diff", params={"base": "../../demo", "head": "head"})
+    assert response.status_code == 404
+    response = await async_client.get("/api/projects/demo/diff", params={"base": "missing", "head": "head"})
+    assert response.status_code == 404
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import io
+import logging
+import random
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.extraction import ExtractionLimits, extract_archive
+from app.services.storage import ProjectStorageService
+
+LIMITS = ExtractionLimits(max_members=100, max_uncompressed_bytes=8 * 1024 * 1024, max_compression_ratio=50)
+
+
+def _noise(size: int, seed: int = 0) -> bytes:
+    # Incompressible, so only the size limits apply.
+    return random.Random(seed).randbytes(size)
+
+
+def test_extracts_members_in_parallel_and_replaces_target(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture, make_archive
+):
+    files = {f"data/test-cases/{index}.json": f'{{"name": "case {index}"}}'.encode() for index in range(600)}
+    files["index.html"] = b"<html>Report</html>"
+    files["data/attachments/big.bin"] = _noise(3 * 1024 * 1024)
+    target = tmp_path / "history" / "prod" / "build-1"
+    target.mkdir(parents=True)
+    (target / "stale.txt").write_text("old", encoding="utf-8")
+
+    with ThreadPoolExecutor(max_workers=4) as executor, caplog.at_level(logging.INFO, "app.services.extraction"):
+        stats = extract_archive(io.BytesIO(make_archive(files)), target, LIMITS._replace(max_members=1000), executor)
+
+    assert stats.members == len(files)
+    assert stats.total_bytes == sum(len(content) for content in files.values())
+    assert not (target / "stale.txt").exists()
+    for name, content in files.items():
+        assert (target / name).read_bytes() == content
+    assert [path.name for path in target.parent.iterdir()] == ["build-1"]
+    assert "Extracted 602 entries" in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("files", "detail"),
+    [
+        ({f"{index}.json": b"{}" for index in range(101)}, "too many entries"),
+        ({"a.bin": _noise(5 * 1024 * 1024), "b.bin": _noise(5 * 1024 * 1024, seed=1)}, "expands to more than"),
+        ({"zeros.bin": bytes(2 * 1024 * 1024)}, "compression ratio"),
+        ({"../outside.txt": b"x"}, "escapes the report directory"),
+        ({"/etc/passwd": b"x"}, "escapes the report directory"),
+        ({"C:\\windows\\evil.txt": b"x"}, "escapes the report directory"),
+    ],
+)
+def test_rejects_archives_over_limits_before_writing(
+    tmp_path: Path, files: dict[str, bytes], detail: str, make_archive
+):
+    target = tmp_path / "build-1"
+
+    with pytest.raises(HTTPException) as excinfo:
+        extract_archive(io.BytesIO(make_archive(files)), target, LIMITS)
+
+    assert excinfo.value.status_code == 400
+    assert detail in excinfo.value.detail
+    assert not tmp_path.joinpath("outside.txt").exists()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_corrupt_member_leaves_no_partial_report(tmp_path: Path, make_archive):
+    payload = make_archive({"index.html": b"<html>Report</html>" * 100})
+    # Flip a byte of compressed data so the CRC check fails during extraction.
+    corrupt = bytearray(payload)
+    corrupt[40] ^= 0xFF
+    target = tmp_path / "build-1"
+
+    with pytest.raises(HTTPException) as excinfo:
+        extract_archive(io.BytesIO(bytes(corrupt)), target, LIMITS)
+
+    assert excinfo.value.status_code == 400
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_upload_applies_service_limits(storage_service: ProjectStorageService, make_archive):
+    storage_service.extraction_limits = LIMITS._replace(max_members=1)
+    archive = make_archive({"index.html": b"<html>Report</html>", "data/test-cases/a.json": b"{}"})
+
+    with pytest.raises(HTTPException) as excinfo:
+        storage_service.process_upload("demo", archive, "build-1", "prod")
+
+    assert "too many entries" in excinfo.value.detail
+    assert not (storage_service.projects_dir / "demo" / "history" / "prod" / "build-1").exists()
+
+    with pytest.raises(HTTPException) as excinfo:
+        storage_service.process_upload("demo", b"not a zip", "build-2", "prod")
+    assert excinfo.value.detail == "Upload must be a zip archive containing an Allure report."
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.models import ProjectMetadata
+from app.services.loadtests import find_loadtest_results
+from app.services.storage import ProjectStorageService
+
+STATS_HEADER = (
+    "Type,Name,Request Count,Failure Count,Median Response Time,Average Response Time,Min Response Time,"
+    "Max Response Time,Average Content Size,Requests/s,Failures/s,50%,66%,75%,80%,90%,95%,98%,99%,99.9%,99.99%,100%"
+)
+
+
+def _stats_csv(p95: int, failures: int = 0, extra_endpoint: bool = False) -> str:
+    rows = [STATS_HEADER, f"GET,/pets,100,{failures},10,12,1,200,40,20.0,0,10,11,12,13,20,{p95},60,80,100,120,200"]
+    if extra_endpoint:
+        rows.append("POST,/pets,10,0,30,31,20,50,40,2.0,0,30,31,32,33,40,45,48,50,50,50,50")
+    rows.append(",Aggregated,100,0,10,12,1,200,40,20.0,0,10,11,12,13,20,40,60,80,100,120,200")
+    return "\n".join(rows) + "\n"
+
+
+def test_find_loadtest_results_reads_csv_and_json_formats(tmp_path):
+    (tmp_path / "csv").mkdir()
+    (tmp_path / "csv" / "run_stats.csv").write_text(_stats_csv(p95=40, failures=5), encoding="utf-8")
+    (tmp_path / "csv" / "run_stats_history.csv").write_text("ignored", encoding="utf-8")
+    [endpoint] = find_loadtest_results(tmp_path / "csv")
+    assert endpoint == {
+        "method": "GET",
+        "name": "/pets",
+        "requests": 100,
+        "failures": 5,
+        "rps": 20.0,
+        "failure_rate": 0.05,
+        "p50": 10.0,
+        "p95": 40.0,
+        "p99": 80.0,
+    }
+
+    (tmp_path / "locust").mkdir()
+    native = [
+        {
+            "name": "/pets",
+            "method": "GET",
+            "num_requests": 4,
+            "num_failures": 1,
+            "start_time": 100.0,
+            "last_request_timestamp": 102.0,
+            "response_times": {"10": 2, "20": 1, "90": 1},
+        }
+    ]
+    (tmp_path / "locust" / "stats.json").write_text(json.dumps(native), encoding="utf-8")
+    [endpoint] = find_loadtest_results(tmp_path / "locust")
+    assert (endpoint["rps"], endpoint["failure_rate"]) == (2.0, 0.25)
+    assert (endpoint["p50"], endpoint["p95"], endpoint["p99"]) == (10.0, 90.0, 90.0)
+
+    (tmp_path / "summary").mkdir()
+    summary = {"endpoints": [{"method": "GET", "name": "/pets", "requests": 10, "failures": 0, "rps": 5, "p95": 30}]}
+    (tmp_path / "summary" / "summary.json").write_text(json.dumps(summary), encoding="utf-8")
+    assert find_loadtest_results(tmp_path / "summary")[0]["p95"] == 30.0
+
+    (tmp_path / "allure").mkdir()
+    (tmp_path / "allure" / "summary.json").write_text(json.dumps({"statistic": {}}), encoding="utf-8")
+    assert find_loadtest_results(tmp_path / "allure") is None
+
+
+def test_process_upload_records_loadtest_series(storage_service: ProjectStorageService, make_archive):
+    storage_service.process_upload("demo", make_archive({"locust_stats.csv": _stats_csv(p95=40)}), "b1", "prod")
+    storage_service.process_upload(
+        "demo", make_archive({"locust_stats.csv": _stats_csv(p95=55, extra_endpoint=True)}), "b2", "prod"
+    )
+
+    metadata = storage_service.load_metadata("demo")
+    assert [entry.report_type for entry in metadata.history] == ["loadtest", "loadtest"]
+    assert metadata.latest is None
+
+    trends = storage_service.loadtest_trends("demo", "prod")
+    assert trends["builds"] == ["b1", "b2"]
+    assert trends["endpoints"]["GET /pets"]["p95"] == [40.0, 55.0]
+    assert trends["endpoints"]["POST /pets"]["rps"] == [None, 2.0]
+
+    limited = storage_service.loadtest_trends("demo", "prod", endpoints=["/pets"], metrics=["p99"], limit=1)
+    assert limited["builds"] == ["b2"]
+    assert limited["endpoints"]["GET /pets"] == {"method": "GET", "name": "/pets", "p99": [80.0]}
+
+
+def test_process_upload_still_rejects_archives_without_results(storage_service: ProjectStorageService, make_archive):
+    with pytest.raises(HTTPException) as excinfo:
+        storage_service.process_upload("demo", make_archive({"readme.txt": "nothing"}), "b1", "prod")
+    assert excinfo.value.detail == "Uploaded archive does not contain an Allure report (index.html missing)."
+
+
+@pytest.mark.parametrize(
+    "summary",
+    [{"endpoints": []}, {"endpoints": [1, "two"]}, {"endpoints": [{"name": "/pets"}]}, {"endpoints": [{"requests": 3}]}],
+)
+def test_summaries_without_endpoint_results_are_skipped(
+    storage_service: ProjectStorageService, tmp_path, summary, make_archive
+):
+    with pytest.raises(HTTPException):
+        storage_service.process_upload("demo", make_archive({"summary.json": json.dumps(summary)}), "b1", "prod")
+    assert storage_service.loadtest_trends("demo", "prod")["builds"] == []
+
+    (tmp_path / "a_summary.json").write_text(json.dumps(summary), encoding="utf-8")
+    (tmp_path / "b_summary.json").write_text(
+        json.dumps({"endpoints": [{"name": "/pets", "method": "GET", "requests": 3}]}), encoding="utf-8"
+    )
+    [endpoint] = find_loadtest_results(tmp_path)
+    assert endpoint["requests"] == 3
+
+
+def test_retention_trims_loadtest_series_separately_from_reports(storage_service: ProjectStorageService, make_archive):
+    storage_service.save_metadata(ProjectMetadata(project="demo", retention_runs=2))
+    storage_service.process_upload("demo", make_archive({"index.html": "<html></html>"}), "report", "prod")
+    for index, p95 in enumerate((40, 50, 60)):
+        archive = make_archive({"locust_stats.csv": _stats_csv(p95=p95)})
+        storage_service.process_upload("demo", archive, f"lt{index}", "prod")
+
+    metadata = storage_service.load_metadata("demo")
+    assert [entry.build_id for entry in metadata.history] == ["report", "lt1", "lt2"]
+    assert metadata.latest_by_environment == {"prod": "report"}
+
+    trends = storage_service.loadtest_trends("demo", "prod")
+    assert trends["builds"] == ["lt1", "lt2"]
+    assert trends["endpoints"]["GET /pets"]["p95"] == [50.0, 60.0]
+
+    metadata.retention_days = 1
+    metadata.history[1].uploaded_at = datetime.utcnow() - timedelta(days=3)
+    metadata.history.sort(key=lambda entry: entry.uploaded_at)
+    storage_service.cleanup_project_history(metadata)
+    assert storage_service.loadtest_trends("demo", "prod")["builds"] == ["lt2"]
+
+
+@pytest.mark.asyncio
+async def test_loadtest_trends_endpoint(async_client, storage_service: ProjectStorageService, make_archive):
+    storage_service.process_upload("demo", make_archive({"locust_stats.csv": _stats_csv(p95=40)}), "b1", "staging")
+
+    response = await async_client.get(
+        "/api/projects/demo/loadtests/trends", params={"environment": "staging", "metric": "p95"}
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["builds"] == ["b1"]
+    assert body["endpoints"] == {"GET /pets": {"method": "GET", "name": "/pets", "p95": [40.0]}}
+
+    response = await async_client.get("/api/projects/demo/loadtests/trends", params={"metric": "p42"})
+    assert response.status_code == 400
+    response = await async_client.get("/api/projects/unknown/loadtests/trends")
+    assert response.json()["builds"] == []
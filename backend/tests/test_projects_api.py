@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import io
 import json
+import os
 import zipfile
 from datetime import datetime
+from types import SimpleNamespace
 
 import pytest
 
+from app.api.routes import projects as projects_routes
 from app.core import settings
+from app.main import create_application
 from app.models import HistoryEntry, ProjectMetadata
 from app.services.storage import ProjectStorageService
 
@@ -101,3 +105,111 @@ async def test_upload_rejects_non_zip(async_client):
     )
     assert response.status_code == 400
     assert response.json()["detail"] == "Upload must be a zip archive containing an Allure report."
+
+
+@pytest.mark.asyncio
+async def test_storage_service_is_application_scoped(tmp_path):
+    application = create_application(tmp_path / "projects")
+    request = SimpleNamespace(app=application)
+    assert not (tmp_path / "projects").exists()
+
+    async with application.router.lifespan_context(application):
+        storage = projects_routes.get_storage_service(request)
+
+        assert storage is projects_routes.get_storage_service(request)
+        assert storage.projects_dir == tmp_path / "projects"
+        assert storage.projects_dir.is_dir()
+
+    assert storage._extraction_executor._shutdown
+
+
+@pytest.mark.asyncio
+async def test_overview_by_environment_returns_each_environment(
+    async_client, storage_service: ProjectStorageService, temp_projects_dir
+):
+    metadata = ProjectMetadata(
+        project="demo",
+        latest="build-002",
+        latest_by_environment={"prod": "build-001", "dev": "build-002"},
+        history=[
+            HistoryEntry(build_id="build-001", uploaded_at=datetime(2024, 1, 1), environment="prod"),
+            HistoryEntry(build_id="build-002", uploaded_at=datetime(2024, 1, 2), environment="dev"),
+        ],
+    )
+    storage_service.save_metadata(metadata)
+
+    summary_path = temp_projects_dir / "demo" / "history" / "prod" / "build-001" / "widgets"
+    summary_path.mkdir(parents=True, exist_ok=True)
+    summary_path.joinpath(settings.SUMMARY_FILENAME).write_text(
+        json.dumps({"statistic": {"passed": 1, "failed": 1, "broken": 0, "skipped": 0, "total": 2}}),
+        encoding="utf-8",
+    )
+
+    response = await async_client.get("/api/overview/environments?environments=prod&environments=dev")
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body) == 1
+    environments = body[0]["environments"]
+    assert list(environments) == ["prod", "dev"]
+    assert environments["prod"]["status"] == "failed"
+    assert environments["prod"]["latest"] == "build-001"
+    assert environments["dev"]["latest"] == "build-002"
+    assert environments["dev"]["status"] == "unknown"
+
+    response = await async_client.get("/api/overview/environments")
+    assert set(response.json()[0]["environments"]) == settings.ALLOWED_ENVIRONMENTS
+
+    response = await async_client.get("/api/overview/environments?environments=qa")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_listings_revalidate_with_etag(
+    async_client, storage_service: ProjectStorageService, temp_projects_dir
+):
+    metadata = ProjectMetadata(
+        project="demo",
+        latest="build-001",
+        latest_by_environment={"prod": "build-001"},
+        history=[HistoryEntry(build_id="build-001", uploaded_at=datetime(2024, 1, 1), environment="prod")],
+    )
+    storage_service.save_metadata(metadata)
+
+    for url in ("/api/projects", "/api/overview", "/api/overview/environments"):
+        response = await async_client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+        assert response.headers["cache-control"] == "no-cache"
+
+        revalidated = await async_client.get(url, headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["etag"] == etag
+
+    response = await async_client.get("/api/projects?environment=prod")
+    etag = response.headers["etag"]
+    other_environment = await async_client.get("/api/projects?environment=dev")
+    assert other_environment.headers["etag"] != etag
+
+    metadata.retention_runs = 3
+    storage_service.save_metadata(metadata)
+    response = await async_client.get("/api/projects?environment=prod", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()[0]["retentionRuns"] == 3
+
+    # A same-size rewrite within one mtime tick still changes the validator.
+    metadata_path = temp_projects_dir / "demo" / "metadata.json"
+    before = metadata_path.stat()
+    etag = response.headers["etag"]
+    metadata.retention_runs = 4
+    storage_service.save_metadata(metadata)
+    os.utime(metadata_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert metadata_path.stat().st_size == before.st_size
+    response = await async_client.get("/api/projects?environment=prod", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+    overview = await async_client.get("/api/overview?environment=prod")
+    by_environment = await async_client.get("/api/overview/environments?environments=prod")
+    assert overview.headers["etag"] != by_environment.headers["etag"]
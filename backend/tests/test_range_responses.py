@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from app.api.responses import RangeFileResponse, RangeNotSatisfiable, etag_matches, parse_range_header
+from app.models import HistoryEntry, ProjectMetadata
+from app.services.storage import ProjectStorageService
+
+LARGE_FILE_SIZE = 300 * 1024 * 1024
+REPORT_URL = "/api/projects/media/report/data/attachments/recording.webm"
+
+
+@pytest.fixture()
+def large_attachment(storage_service: ProjectStorageService, temp_projects_dir: Path) -> Path:
+    storage_service.save_metadata(
+        ProjectMetadata(
+            project="media",
+            latest="build-001",
+            latest_by_environment={"prod": "build-001"},
+            history=[HistoryEntry(build_id="build-001", uploaded_at=datetime(2024, 1, 1), environment="prod")],
+        )
+    )
+    report_dir = temp_projects_dir / "media" / "history" / "prod" / "build-001"
+    attachment = report_dir / "data" / "attachments" / "recording.webm"
+    attachment.parent.mkdir(parents=True)
+    # Sparse file: multi-hundred-MB on paper without writing it all to disk.
+    with attachment.open("wb") as fp:
+        fp.write(b"HEAD")
+        fp.seek(LARGE_FILE_SIZE // 2)
+        fp.write(b"MIDDLE")
+        fp.seek(LARGE_FILE_SIZE - 4)
+        fp.write(b"TAIL")
+    return attachment
+
+
+def test_parse_range_header_coalesces_and_clamps():
+    assert parse_range_header("bytes=0-9,5-19,100-", 50) == [(0, 19)]
+    assert parse_range_header("bytes=-10", 50) == [(40, 49)]
+    assert parse_range_header("bytes=0-0,10-12", 50) == [(0, 0), (10, 12)]
+    assert parse_range_header("items=0-10", 50) is None
+    with pytest.raises(RangeNotSatisfiable):
+        parse_range_header("bytes=60-70", 50)
+
+
+@pytest.mark.asyncio
+async def test_single_range_from_large_attachment(async_client, large_attachment):
+    start, end = LARGE_FILE_SIZE // 2, LARGE_FILE_SIZE // 2 + 5
+    response = await async_client.get(REPORT_URL, headers={"Range": f"bytes={start}-{end}"})
+
+    assert response.status_code == 206
+    assert response.content == b"MIDDLE"
+    assert response.headers["content-length"] == "6"
+    assert response.headers["content-range"] == f"bytes {start}-{end}/{LARGE_FILE_SIZE}"
+    assert response.headers["accept-ranges"] == "bytes"
+
+
+@pytest.mark.asyncio
+async def test_suffix_range_returns_file_tail(async_client, large_attachment):
+    response = await async_client.get(REPORT_URL, headers={"Range": "bytes=-4"})
+
+    assert response.status_code == 206
+    assert response.content == b"TAIL"
+
+
+@pytest.mark.asyncio
+async def test_multi_range_returns_multipart_byteranges(async_client, large_attachment):
+    response = await async_client.get(REPORT_URL, headers={"Range": f"bytes=0-3,{LARGE_FILE_SIZE - 4}-"})
+
+    assert response.status_code == 206
+    content_type = response.headers["content-type"]
+    assert content_type.startswith("multipart/byteranges; boundary=")
+    assert int(response.headers["content-length"]) == len(response.content)
+
+    boundary = content_type.split("boundary=")[1]
+    parts = response.content.split(f"--{boundary}".encode())
+    assert parts[-1] == b"--\r\n"
+    bodies = [part.split(b"\r\n\r\n", 1)[1][:-2] for part in parts[1:-1]]
+    assert bodies == [b"HEAD", b"TAIL"]
+    assert f"content-range: bytes 0-3/{LARGE_FILE_SIZE}".encode() in parts[1]
+
+
+@pytest.mark.asyncio
+async def test_unsatisfiable_range_returns_416(async_client, large_attachment):
+    response = await async_client.get(REPORT_URL, headers={"Range": f"bytes={LARGE_FILE_SIZE}-"})
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{LARGE_FILE_SIZE}"
+
+
+@pytest.mark.asyncio
+async def test_head_advertises_range_support(async_client, large_attachment):
+    response = await async_client.head(REPORT_URL)
+
+    assert response.status_code == 200
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-length"] == str(LARGE_FILE_SIZE)
+
+
+@pytest.mark.asyncio
+async def test_zerocopy_extension_is_used_when_available(large_attachment):
+    messages: list[dict] = []
+
+    async def receive():  # pragma: no cover - never awaited
+        return {"type": "http.request"}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "extensions": {"http.response.zerocopy": {}}}
+    response = RangeFileResponse(large_attachment, {"range": "bytes=100-199"})
+    await response(scope, receive, send)
+
+    assert messages[0]["status"] == 206
+    zerocopy = [message for message in messages if message["type"] == "http.response.zerocopy"]
+    assert [(message["offset"], message["count"]) for message in zerocopy] == [(100, 100)]
+    assert messages[-1] == {"type": "http.response.body", "body": b"", "more_body": False}
+
+
+def test_etag_matches_uses_weak_comparison():
+    assert etag_matches('W/"abc"', 'W/"abc"')
+    assert etag_matches('"abc"', 'W/"abc"')
+    assert etag_matches('"xyz", W/"abc"', 'W/"abc"')
+    assert etag_matches("*", 'W/"abc"')
+    assert not etag_matches('W/"xyz"', 'W/"abc"')
+    assert not etag_matches(None, 'W/"abc"')
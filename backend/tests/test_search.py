@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import ProjectMetadata
+from app.services.search import match_expression
+from app.services.storage import ProjectStorageService
+
+
+def _allure_files(tests: list[tuple[str, str, str | None]]) -> dict[str, str]:
+    files = {"index.html": "<html>Report</html>"}
+    for index, (name, status, message) in enumerate(tests):
+        case = {
+            "name": name,
+            "fullName": f"tests.api.{name}",
+            "status": status,
+            "statusMessage": message,
+            "labels": [{"name": "parentSuite", "value": "api"}, {"name": "suite", "value": "checkout"}],
+        }
+        files[f"data/test-cases/{index}.json"] = json.dumps(case)
+    return files
+
+
+def test_match_expression_quotes_user_input():
+    assert match_expression('ConnectionResetError: peer "reset"') == '"ConnectionResetError:" "peer" """reset"""'
+    assert match_expression("conn*  AND") == '"conn"* "AND"'
+    assert match_expression("   ") == ""
+
+
+def test_snippet_escapes_markup_from_reports(storage_service: ProjectStorageService, make_archive):
+    storage_service.process_upload(
+        "shop",
+        make_archive(_allure_files([("test_pay", "failed", "<img src=x onerror=alert(1)> ConnectionResetError")])),
+        "b1",
+        "prod",
+    )
+
+    snippet = storage_service.search_results("onerror")["results"][0]["snippet"]
+    assert snippet == "&lt;img src=x <mark>onerror</mark>=alert(1)&gt; ConnectionResetError"
+
+
+def test_upload_indexes_test_results(storage_service: ProjectStorageService, make_archive):
+    storage_service.process_upload(
+        "shop",
+        make_archive(
+            _allure_files(
+                [
+                    ("test_pay", "failed", "ConnectionResetError: [Errno 104] Connection reset by peer"),
+                    ("test_refund", "passed", None),
+                ]
+            )
+        ),
+        "b1",
+        "prod",
+    )
+    storage_service.process_upload(
+        "billing", make_archive(_allure_files([("test_invoice", "broken", "ConnectionResetError")])), "b1", "staging"
+    )
+
+    found = storage_service.search_results("ConnectionResetError")
+    assert [(item["project"], item["name"]) for item in found["results"]] == [
+        ("billing", "test_invoice"),
+        ("shop", "test_pay"),
+    ]
+    shop = storage_service.search_results("connectionreseterror", project="shop")["results"][0]
+    assert shop["suite"] == "api / checkout"
+    assert shop["status"] == "failed"
+    assert "<mark>ConnectionResetError</mark>" in shop["snippet"]
+
+    assert storage_service.search_results("checkout", status="passed")["results"][0]["name"] == "test_refund"
+    assert storage_service.search_results("ConnectionResetError", environment="staging")["results"][0]["project"] == "billing"
+    assert storage_service.search_results("test_ref*")["results"][0]["name"] == "test_refund"
+    assert storage_service.search_results("checkout", since=datetime.utcnow() + timedelta(days=1))["results"] == []
+
+    first = storage_service.search_results("checkout", limit=2)
+    assert first["hasMore"] is True
+    second = storage_service.search_results("checkout", limit=2, offset=2)
+    assert len(second["results"]) == 1
+    assert second["hasMore"] is False
+
+
+def test_retention_prunes_search_index(storage_service: ProjectStorageService, make_archive):
+    storage_service.save_metadata(ProjectMetadata(project="shop", retention_runs=1))
+    storage_service.process_upload(
+        "shop", make_archive(_allure_files([("test_old", "failed", "OldError")])), "b1", "prod"
+    )
+    storage_service.process_upload(
+        "shop", make_archive(_allure_files([("test_new", "failed", "NewError")])), "b2", "prod"
+    )
+
+    assert storage_service.search_results("OldError")["results"] == []
+    assert storage_service.search_results("NewError")["results"][0]["buildId"] == "b2"
+
+
+def test_reupload_of_a_build_id_replaces_its_entry(storage_service: ProjectStorageService, make_archive):
+    storage_service.save_metadata(ProjectMetadata(project="shop", retention_runs=1))
+    storage_service.process_upload(
+        "shop", make_archive(_allure_files([("test_pay", "failed", "OldError")])), "20260101000000", "prod"
+    )
+    storage_service.process_upload(
+        "shop", make_archive(_allure_files([("test_pay", "failed", "NewError")])), "20260101000000", "prod"
+    )
+
+    metadata = storage_service.load_metadata("shop")
+    assert [entry.build_id for entry in metadata.history] == ["20260101000000"]
+    assert metadata.latest_by_environment == {"prod": "20260101000000"}
+    assert (storage_service.projects_dir / "shop" / "history" / "prod" / "20260101000000" / "index.html").exists()
+    assert storage_service.search_results("OldError")["results"] == []
+    assert storage_service.search_results("NewError")["results"][0]["buildId"] == "20260101000000"
+
+
+@pytest.mark.asyncio
+async def test_search_endpoint(async_client, storage_service: ProjectStorageService, make_archive):
+    storage_service.process_upload(
+        "shop", make_archive(_allure_files([("test_pay", "failed", "Timeout")])), "b1", "prod"
+    )
+
+    response = await async_client.get("/api/search", params={"q": "timeout", "project": "shop", "limit": 1})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["query"] == "timeout"
+    assert body["hasMore"] is False
+    assert body["results"][0]["fullName"] == "tests.api.test_pay"
+
+    assert (await async_client.get("/api/search", params={"q": "x", "environment": "qa"})).status_code == 400
+    assert (await async_client.get("/api/search", params={"q": ""})).status_code == 422
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+# The profiling helper is shared with the repository-level import-time tests.
+sys.path.insert(0, str(BACKEND_ROOT.parent / "tests"))
+from import_profile import best_of  # noqa: E402
+
+# Cumulative import budget for ``app.main`` in milliseconds: the measured import (about
+# 550ms, nearly all FastAPI and pydantic) plus headroom for noisy runners. Override on
+# slow CI runners via the environment.
+STARTUP_BUDGET_MS = float(os.environ.get("TRD_STARTUP_BUDGET_MS", "900"))
+
+# Modules that must only be imported on demand, never as part of application startup.
+LAZY_MODULES = {"fastapi.staticfiles"}
+
+
+def test_app_import_stays_within_startup_budget():
+    best_ms, imported = best_of("app.main", BACKEND_ROOT)
+
+    assert best_ms < STARTUP_BUDGET_MS, f"import app.main took {best_ms:.0f}ms (budget {STARTUP_BUDGET_MS:.0f}ms)"
+    assert not LAZY_MODULES & imported
+
+
+def test_app_module_builds_application_on_first_access(temp_projects_dir: Path):
+    import app.main as main_module
+
+    application = main_module.app
+    try:
+        assert application is main_module.app
+        # Storage is only set up once the application starts.
+        assert not hasattr(application.state, "storage")
+    finally:
+        storage = getattr(application.state, "storage", None)
+        if storage is not None:
+            storage.close()
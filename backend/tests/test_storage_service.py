@@ -49,3 +49,147 @@ def test_cleanup_project_history_applies_retention(storage_service: ProjectStora
     assert metadata.latest == "new-build"
     assert metadata.latest_by_environment == {"prod": "new-build"}
     assert not (temp_projects_dir / project / "history" / "prod" / "old-build").exists()
+
+
+def _make_build_dirs(projects_dir, metadata: ProjectMetadata) -> None:
+    for entry in metadata.history:
+        (projects_dir / metadata.project / "history" / entry.environment / entry.build_id).mkdir(parents=True)
+
+
+def test_cleanup_project_history_limits_runs_per_environment(storage_service: ProjectStorageService, temp_projects_dir):
+    now = datetime.utcnow()
+    prod_entry = HistoryEntry(build_id="prod-1", uploaded_at=now - timedelta(hours=5), environment="prod")
+    dev_entries = [
+        HistoryEntry(build_id=f"dev-{index}", uploaded_at=now - timedelta(hours=4 - index), environment="dev")
+        for index in range(4)
+    ]
+    metadata = ProjectMetadata(
+        project="demo",
+        latest="dev-3",
+        latest_by_environment={"prod": "prod-1", "dev": "dev-3"},
+        history=[prod_entry, *dev_entries],
+        retention_runs=2,
+    )
+    _make_build_dirs(temp_projects_dir, metadata)
+
+    removed = storage_service.cleanup_project_history(metadata, "dev")
+
+    assert removed is True
+    assert metadata.history == [prod_entry, dev_entries[2], dev_entries[3]]
+    assert metadata.latest_by_environment == {"prod": "prod-1", "dev": "dev-3"}
+    assert (temp_projects_dir / "demo" / "history" / "prod" / "prod-1").exists()
+    assert not (temp_projects_dir / "demo" / "history" / "dev" / "dev-0").exists()
+
+
+def test_cleanup_project_history_honours_environment_overrides(
+    storage_service: ProjectStorageService, temp_projects_dir
+):
+    now = datetime.utcnow()
+    history = [
+        HistoryEntry(build_id=f"{env}-{index}", uploaded_at=now - timedelta(hours=10 - index), environment=env)
+        for index in range(3)
+        for env in ("dev", "prod")
+    ]
+    metadata = ProjectMetadata(
+        project="demo",
+        latest="prod-2",
+        latest_by_environment={"prod": "prod-2", "dev": "dev-2"},
+        history=history,
+        retention_runs=3,
+        retention_runs_by_environment={"dev": 1},
+    )
+    _make_build_dirs(temp_projects_dir, metadata)
+
+    storage_service.cleanup_project_history(metadata)
+
+    assert [entry.build_id for entry in metadata.history] == ["prod-0", "prod-1", "dev-2", "prod-2"]
+
+
+def test_cleanup_project_history_expires_by_age_and_updates_latest(
+    storage_service: ProjectStorageService, temp_projects_dir
+):
+    now = datetime.utcnow()
+    metadata = ProjectMetadata(
+        project="demo",
+        latest="prod-new",
+        latest_by_environment={"dev": "dev-old", "prod": "prod-new"},
+        history=[
+            HistoryEntry(build_id="dev-old", uploaded_at=now - timedelta(days=9), environment="dev"),
+            HistoryEntry(build_id="prod-old", uploaded_at=now - timedelta(days=8), environment="prod"),
+            HistoryEntry(build_id="prod-new", uploaded_at=now - timedelta(days=1), environment="prod"),
+        ],
+        retention_days=7,
+    )
+    _make_build_dirs(temp_projects_dir, metadata)
+
+    assert storage_service.cleanup_project_history(metadata) is True
+    assert [entry.build_id for entry in metadata.history] == ["prod-new"]
+    assert metadata.latest_by_environment == {"prod": "prod-new"}
+
+
+def test_metadata_history_is_ordered_oldest_first_on_load():
+    newest_first = [
+        HistoryEntry(build_id="b", uploaded_at=datetime(2024, 1, 2), environment="prod"),
+        HistoryEntry(build_id="a", uploaded_at=datetime(2024, 1, 1), environment="prod"),
+    ]
+    metadata = ProjectMetadata.model_validate_json(
+        ProjectMetadata(project="demo", history=newest_first).model_dump_json()
+    )
+
+    assert [entry.build_id for entry in metadata.history] == ["a", "b"]
+
+
+def test_metadata_trims_history_per_environment_and_report_type():
+    start = datetime(2024, 1, 1)
+    metadata = ProjectMetadata(project="demo")
+    for index in range(6):
+        metadata.add_history_entry(
+            HistoryEntry(
+                build_id=f"b{index}",
+                uploaded_at=start + timedelta(hours=index),
+                environment="dev" if index % 2 else "prod",
+                report_type="loadtest" if index == 4 else "allure",
+            )
+        )
+
+    metadata.expire_history(start + timedelta(minutes=30))
+    assert [entry.build_id for entry in metadata.trim_history("dev", "allure", 1)] == ["b1", "b3"]
+    assert metadata.trim_history("prod", "loadtest", 1) == []
+
+    assert [entry.build_id for entry in metadata.history] == ["b2", "b4", "b5"]
+    assert sorted(metadata.history_kinds()) == [("dev", "allure"), ("prod", "allure"), ("prod", "loadtest")]
+    assert [entry.build_id for entry in metadata.trim_history("prod", "allure", 0)] == ["b2"]
+    assert [entry.build_id for entry in metadata.history] == ["b4", "b5"]
+
+
+def test_cleanup_keeps_builds_still_listed_in_history(storage_service: ProjectStorageService, temp_projects_dir):
+    now = datetime.utcnow()
+    # Metadata written before re-uploads replaced their entry can list a build twice.
+    metadata = ProjectMetadata(
+        project="demo",
+        latest="b1",
+        latest_by_environment={"prod": "b1"},
+        history=[
+            HistoryEntry(build_id="b1", uploaded_at=now - timedelta(minutes=1)),
+            HistoryEntry(build_id="b1", uploaded_at=now),
+        ],
+        retention_runs=1,
+    )
+    (temp_projects_dir / "demo" / "history" / "prod" / "b1").mkdir(parents=True)
+
+    assert storage_service.cleanup_project_history(metadata) is True
+
+    assert [entry.uploaded_at for entry in metadata.history] == [now]
+    assert metadata.latest_by_environment == {"prod": "b1"}
+    assert (temp_projects_dir / "demo" / "history" / "prod" / "b1").is_dir()
+
+    metadata.add_history_entry(HistoryEntry(build_id="b1", uploaded_at=now + timedelta(minutes=1)))
+    assert [entry.uploaded_at for entry in metadata.history] == [now + timedelta(minutes=1)]
+
+
+def test_project_locks_are_dropped_once_unused(storage_service: ProjectStorageService):
+    lock = storage_service._project_lock("demo")
+    assert storage_service._project_lock("demo") is lock
+
+    del lock
+    assert "demo" not in storage_service._project_locks
@@ -0,0 +1,107 @@
+"""Measure the per-call overhead of generated clients over raw httpx.
+
+Requests go to an in-process ``httpx.MockTransport``, so the timings contain no
+network I/O: what remains is request building in httpx plus whatever the generated
+client adds on top. Run from the repository root::
+
+    python benchmarks/bench_client_overhead.py --calls 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import httpx  # noqa: E402
+
+from openapi_locustgen.codegen.client_codegen import write_client  # noqa: E402
+from openapi_locustgen.http_adapters import AsyncHttpxAdapter, HttpxAdapter  # noqa: E402
+from openapi_locustgen.utils import load_openapi  # noqa: E402
+
+SPEC = ROOT / "tests" / "data" / "simple_openapi.yaml"
+BASE_URL = "http://api.test"
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=b'{"id":"1"}')
+
+
+def _load_client_module(directory: Path):
+    path = write_client(load_openapi(SPEC), directory / "bench_client.py")
+    spec = importlib.util.spec_from_file_location("bench_client", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _per_call(calls: int, func: Callable[[], object]) -> float:
+    for _ in range(min(calls, 1000)):
+        func()
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls
+
+
+async def _per_call_async(calls: int, func: Callable[[], Awaitable[object]]) -> float:
+    for _ in range(min(calls, 1000)):
+        await func()
+    start = time.perf_counter()
+    for _ in range(calls):
+        await func()
+    return (time.perf_counter() - start) / calls
+
+
+def _report(name: str, seconds: float, baseline: float) -> None:
+    overhead = seconds - baseline
+    print(f"{name:>28}: {seconds * 1e6:8.2f} us/call  overhead {overhead * 1e6:+7.2f} us ({overhead / baseline:+.1%})")
+
+
+async def _run_async(module, calls: int) -> None:
+    async with httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(_handler)) as raw:
+        baseline = await _per_call_async(calls, lambda: raw.request("GET", "/pets", params={"limit": 10}))
+        _report("raw httpx.AsyncClient", baseline, baseline)
+
+    client = httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(_handler))
+    async with module.SimplePetstoreAsyncClient(AsyncHttpxAdapter(client=client)) as api:
+        seconds = await _per_call_async(calls, lambda: api.list_pets(limit=10))
+        _report("generated async client", seconds, baseline)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        module = _load_client_module(Path(tmp))
+
+    with httpx.Client(base_url=BASE_URL, transport=httpx.MockTransport(_handler)) as raw:
+        baseline = _per_call(args.calls, lambda: raw.request("GET", "/pets", params={"limit": 10}))
+        _report("raw httpx.Client", baseline, baseline)
+
+    client = httpx.Client(base_url=BASE_URL, transport=httpx.MockTransport(_handler))
+    with HttpxAdapter(client=client) as adapter:
+        seconds = _per_call(args.calls, lambda: adapter.request("GET", "/pets", params={"limit": 10}))
+        _report("HttpxAdapter", seconds, baseline)
+
+    client = httpx.Client(base_url=BASE_URL, transport=httpx.MockTransport(_handler))
+    with module.SimplePetstoreClient(HttpxAdapter(client=client)) as api:
+        seconds = _per_call(args.calls, lambda: api.list_pets(limit=10))
+        _report("generated client", seconds, baseline)
+
+    asyncio.run(_run_async(module, args.calls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Compare requests/sec and latency percentiles of the HTTP adapters.
+
+Drives a local keep-alive stand-in server (no external services). The Locust adapter
+is included when ``locust`` is installed. Run from the repository root::
+
+    python benchmarks/bench_http_adapters.py --requests 5000 --concurrency 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from openapi_locustgen.http_adapters import AsyncHttpxAdapter, HttpxAdapter, LocustSessionAdapter  # noqa: E402
+from standin_server import StandInServer  # noqa: E402
+
+
+def _report(name: str, latencies: List[float], elapsed: float) -> None:
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:>22}: {len(latencies) / elapsed:9.0f} req/s  "
+        f"p50 {quantiles[49] * 1000:6.2f} ms  p95 {quantiles[94] * 1000:6.2f} ms  p99 {quantiles[98] * 1000:6.2f} ms"
+    )
+
+
+def _run_sync(name: str, call: Callable[[], object], requests: int) -> None:
+    call()  # open the connection outside the measurement
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(requests):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    _report(name, latencies, time.perf_counter() - started)
+
+
+async def _run_async(base_url: str, requests: int, concurrency: int, http2: bool) -> None:
+    async with AsyncHttpxAdapter(base_url, concurrency=concurrency, http2=http2) as adapter:
+        latencies: List[float] = []
+
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                start = time.perf_counter()
+                await adapter.request("GET", "/pets/1")
+                latencies.append(time.perf_counter() - start)
+
+        # Closed loop: ``concurrency`` workers each keep one request in flight.
+        await asyncio.gather(*(worker(1) for _ in range(concurrency)))
+        latencies.clear()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+        _report(f"AsyncHttpxAdapter x{concurrency}", latencies, time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--http2", action="store_true", help="negotiate HTTP/2 where the adapter supports it")
+    args = parser.parse_args()
+
+    import httpx
+
+    with StandInServer() as server:
+        with httpx.Client(base_url=server.base_url) as raw:
+            _run_sync("raw httpx.Client", lambda: raw.get("/pets/1"), args.requests)
+        with HttpxAdapter(server.base_url, http2=args.http2) as adapter:
+            _run_sync("HttpxAdapter", lambda: adapter.request("GET", "/pets/1"), args.requests)
+        asyncio.run(_run_async(server.base_url, args.requests, args.concurrency, args.http2))
+
+        try:
+            from locust.contrib.fasthttp import FastHttpSession
+            from locust.env import Environment
+        except ImportError:
+            print(f"{'LocustSessionAdapter':>22}: skipped (locust not installed)")
+        else:
+            session = FastHttpSession(Environment(), base_url=server.base_url, user=None)
+            adapter = LocustSessionAdapter(session)
+            _run_sync(
+                "LocustSessionAdapter", lambda: adapter.request("GET", "/pets/1", name="/pets/{id}"), args.requests
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark OpenAPI loading: pure-Python vs libyaml parsing, disk cache and lazy mode.
+
+Run from the repository root::
+
+    python benchmarks/bench_load_openapi.py --operations 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import yaml  # noqa: E402
+
+from openapi_locustgen import utils  # noqa: E402
+from openapi_locustgen.utils import load_openapi, load_openapi_lazy  # noqa: E402
+from synthetic_spec import write_spec  # noqa: E402
+
+
+def _best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operations", type=int, default=4000)
+    parser.add_argument("--tags", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        spec_path = write_spec(Path(temp_dir) / "spec.yaml", args.operations, args.tags)
+        cache_dir = Path(temp_dir) / "cache"
+        lines = spec_path.read_text(encoding="utf-8").count("\n")
+        print(f"spec: {args.operations} operations, {lines} lines, libyaml={yaml.__with_libyaml__}")
+
+        def pure_python_load() -> None:
+            original = getattr(yaml, "CSafeLoader", None)
+            if original is not None:
+                del yaml.CSafeLoader
+            try:
+                utils.load_openapi(spec_path)
+            finally:
+                if original is not None:
+                    yaml.CSafeLoader = original
+
+        results = {
+            "pure-python yaml": _best_of(1, pure_python_load),
+            "libyaml": _best_of(args.repeat, lambda: load_openapi(spec_path)),
+        }
+        load_openapi(spec_path, cache_dir=cache_dir)
+        results["cache hit"] = _best_of(args.repeat, lambda: load_openapi(spec_path, cache_dir=cache_dir))
+        load_openapi_lazy(spec_path, cache_dir=cache_dir)
+        results["cached lazy, 1 tag"] = _best_of(
+            args.repeat, lambda: load_openapi_lazy(spec_path, cache_dir=cache_dir).materialize(tags=["tag0"])
+        )
+
+        for name, seconds in results.items():
+            print(f"{name:>18}: {seconds * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
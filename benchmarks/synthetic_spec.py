@@ -0,0 +1,135 @@
+"""Synthetic OpenAPI specs for benchmarking openapi-locustgen on large APIs.
+
+Specs mimic a gateway: many tags, CRUD paths per resource, shared component schemas
+and parameters referenced via ``$ref`` (including a recursive schema).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+
+def build_spec(operations: int = 4000, tags: int = 40) -> Dict[str, Any]:
+    resources = max(1, operations // 4)
+    components: Dict[str, Any] = {
+        "schemas": {
+            "Error": {
+                "type": "object",
+                "properties": {"code": {"type": "integer"}, "message": {"type": "string"}},
+            },
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}},
+                },
+            },
+            "Page": {
+                "type": "object",
+                "properties": {"next": {"type": "string"}, "nodes": {"$ref": "#/components/schemas/Node"}},
+            },
+        },
+        "parameters": {
+            "Limit": {
+                "name": "limit",
+                "in": "query",
+                "required": False,
+                "schema": {"type": "integer"},
+                "example": 20,
+            },
+        },
+    }
+    paths: Dict[str, Any] = {}
+    emitted = 0
+    for index in range(resources):
+        tag = f"tag{index % tags}"
+        name = f"resource{index}"
+        schema_ref = {"$ref": f"#/components/schemas/{name.capitalize()}"}
+        components["schemas"][name.capitalize()] = {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "name": {"type": "string"},
+                "parent": {"$ref": "#/components/schemas/Node"},
+            },
+        }
+        error_response = {
+            "description": "Error",
+            "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Error"}}},
+        }
+        paths[f"/{tag}/{name}"] = {
+            "get": {
+                "operationId": f"list_{name}",
+                "tags": [tag],
+                "parameters": [{"$ref": "#/components/parameters/Limit"}],
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Page"}}},
+                    },
+                    "400": error_response,
+                },
+            },
+            "post": {
+                "operationId": f"create_{name}",
+                "tags": [tag],
+                "requestBody": {
+                    "content": {"application/json": {"schema": schema_ref, "example": {"name": name}}},
+                },
+                "responses": {"201": {"description": "Created"}, "400": error_response},
+            },
+        }
+        paths[f"/{tag}/{name}/{{itemId}}"] = {
+            "parameters": [{"name": "itemId", "in": "path", "required": True, "schema": {"type": "string"}}],
+            "get": {
+                "operationId": f"get_{name}",
+                "tags": [tag],
+                "responses": {
+                    "200": {"description": "OK", "content": {"application/json": {"schema": schema_ref}}},
+                    "404": error_response,
+                },
+            },
+            "delete": {
+                "operationId": f"delete_{name}",
+                "tags": [tag],
+                "responses": {"204": {"description": "Deleted"}, "404": error_response},
+            },
+        }
+        emitted += 4
+        if emitted >= operations:
+            break
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Synthetic Gateway", "version": "1.0.0"},
+        "paths": paths,
+        "components": components,
+    }
+
+
+def write_spec(path: Path, operations: int = 4000, tags: int = 40) -> Path:
+    spec = build_spec(operations, tags)
+    if path.suffix.lower() == ".json":
+        path.write_text(json.dumps(spec), encoding="utf-8")
+    else:
+        import yaml
+
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        path.write_text(yaml.dump(spec, Dumper=dumper, sort_keys=False), encoding="utf-8")
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--operations", type=int, default=4000)
+    parser.add_argument("--tags", type=int, default=40)
+    args = parser.parse_args()
+    write_spec(args.output, args.operations, args.tags)
+
+
+if __name__ == "__main__":
+    main()
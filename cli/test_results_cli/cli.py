@@ -6,7 +6,6 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterator
 
-import httpx
 import typer
 
 app = typer.Typer(help="Upload test result archives to the Test Results Dashboard API.")
@@ -52,6 +51,9 @@ def upload(
 ) -> None:
     """Package and upload a test results report to the dashboard backend."""
 
+    # httpx pulls in ssl, h11 and friends; only pay for it when actually uploading.
+    import httpx
+
     endpoint = f"{api_url.rstrip('/')}/projects/{project}/upload"
     typer.echo(f"Preparing archive from: {report_path}")
 
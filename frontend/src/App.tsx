@@ -151,30 +151,57 @@ function App() {
   })
 
   useEffect(() => {
+    // Responses for an environment the user has already switched away from are dropped.
+    let cancelled = false
+    const applyProjects = (data: ProjectSummary[]) => {
+      if (cancelled) return
+      setProjects(data)
+      setSelectedProject((current) => {
+        if (current) {
+          const matching = data.find((project) => project.project === current.project)
+          if (matching) return matching
+        }
+        return data[0] ?? null
+      })
+      setLoading(false)
+    }
+
     setLoading(true)
     setError(null)
-    fetchProjects(environment)
-      .then((data) => {
-        setProjects(data)
-        setSelectedProject((current) => {
-          if (current) {
-            const matching = data.find((project) => project.project === current.project)
-            if (matching) return matching
-          }
-          return data[0] ?? null
-        })
+    fetchProjects(environment, { onStale: applyProjects })
+      .then(applyProjects)
+      .catch(() => {
+        if (!cancelled) setError('Unable to load projects. Please check the API service.')
+      })
+      .finally(() => {
+        if (!cancelled) setLoading(false)
       })
-      .catch(() => setError('Unable to load projects. Please check the API service.'))
-      .finally(() => setLoading(false))
+    return () => {
+      cancelled = true
+    }
   }, [environment])
 
   useEffect(() => {
+    let cancelled = false
+    const applyOverview = (data: ProjectOverview[]) => {
+      if (cancelled) return
+      setOverview(data)
+      setOverviewLoading(false)
+    }
+
     setOverviewLoading(true)
     setOverviewError(null)
-    fetchProjectOverview(environment)
-      .then((data) => setOverview(data))
-      .catch(() => setOverviewError('Unable to load project overview. Please check the API service.'))
-      .finally(() => setOverviewLoading(false))
+    fetchProjectOverview(environment, { onStale: applyOverview })
+      .then(applyOverview)
+      .catch(() => {
+        if (!cancelled) setOverviewError('Unable to load project overview. Please check the API service.')
+      })
+      .finally(() => {
+        if (!cancelled) setOverviewLoading(false)
+      })
+    return () => {
+      cancelled = true
+    }
   }, [environment])
 
   const handleSelect = (projectName: string) => {
@@ -1,17 +1,148 @@
-import { ProjectOverview, ProjectSummary } from './types'
+import {
+  BuildDiff,
+  Environment,
+  LoadTestMetric,
+  LoadTestTrends,
+  ProjectEnvironmentsOverview,
+  ProjectOverview,
+  ProjectSummary,
+  SearchResponse,
+} from './types'
 
-export async function fetchProjects(environment: string): Promise<ProjectSummary[]> {
-  const response = await fetch(`/api/projects?environment=${encodeURIComponent(environment)}`)
+type CacheEntry = {
+  data: unknown
+  etag: string | null
+}
+
+export type CachedFetchOptions<T> = {
+  /** Called synchronously with the cached copy (if any) before the network revalidates it. */
+  onStale?: (data: T) => void
+}
+
+// Listing responses keyed by URL (so per environment), revalidated with `If-None-Match`.
+const responseCache = new Map<string, CacheEntry>()
+const inFlight = new Map<string, Promise<unknown>>()
+
+async function revalidate(url: string, errorMessage: string): Promise<unknown> {
+  const cached = responseCache.get(url)
+  const response = await fetch(url, {
+    headers: cached?.etag ? { 'If-None-Match': cached.etag } : undefined,
+  })
+  if (response.status === 304 && cached) {
+    return cached.data
+  }
+  if (!response.ok) {
+    throw new Error(errorMessage)
+  }
+  const data = await response.json()
+  responseCache.set(url, { data, etag: response.headers.get('ETag') })
+  return data
+}
+
+/**
+ * Stale-while-revalidate GET: hands any cached copy to `onStale` straight away, then
+ * revalidates against the server. Concurrent calls for one URL share a single request.
+ */
+async function fetchJsonCached<T>(url: string, errorMessage: string, options: CachedFetchOptions<T> = {}): Promise<T> {
+  const cached = responseCache.get(url)
+  if (cached && options.onStale) {
+    options.onStale(cached.data as T)
+  }
+
+  let request = inFlight.get(url)
+  if (!request) {
+    request = revalidate(url, errorMessage).finally(() => inFlight.delete(url))
+    inFlight.set(url, request)
+  }
+  return (await request) as T
+}
+
+export async function fetchProjects(
+  environment: string,
+  options: CachedFetchOptions<ProjectSummary[]> = {},
+): Promise<ProjectSummary[]> {
+  return fetchJsonCached(
+    `/api/projects?environment=${encodeURIComponent(environment)}`,
+    'Failed to fetch projects',
+    options,
+  )
+}
+
+export async function fetchProjectOverview(
+  environment: string,
+  options: CachedFetchOptions<ProjectOverview[]> = {},
+): Promise<ProjectOverview[]> {
+  return fetchJsonCached(
+    `/api/overview?environment=${encodeURIComponent(environment)}`,
+    'Failed to fetch overview',
+    options,
+  )
+}
+
+export async function fetchOverviewByEnvironment(
+  environments: Environment[] = [],
+  options: CachedFetchOptions<ProjectEnvironmentsOverview[]> = {},
+): Promise<ProjectEnvironmentsOverview[]> {
+  const query = environments.map((environment) => `environments=${encodeURIComponent(environment)}`).join('&')
+  return fetchJsonCached(`/api/overview/environments${query ? `?${query}` : ''}`, 'Failed to fetch overview', options)
+}
+
+export async function fetchLoadTestTrends(
+  project: string,
+  environment: Environment,
+  options: { endpoints?: string[]; metrics?: LoadTestMetric[]; limit?: number } = {},
+): Promise<LoadTestTrends> {
+  const params = new URLSearchParams({ environment })
+  options.endpoints?.forEach((endpoint) => params.append('endpoint', endpoint))
+  options.metrics?.forEach((metric) => params.append('metric', metric))
+  if (options.limit) {
+    params.set('limit', String(options.limit))
+  }
+  const response = await fetch(`/api/projects/${encodeURIComponent(project)}/loadtests/trends?${params}`)
   if (!response.ok) {
-    throw new Error('Failed to fetch projects')
+    throw new Error('Failed to fetch load test trends')
   }
   return response.json()
 }
 
-export async function fetchProjectOverview(environment: string): Promise<ProjectOverview[]> {
-  const response = await fetch(`/api/overview?environment=${encodeURIComponent(environment)}`)
+export async function fetchBuildDiff(
+  project: string,
+  base: string,
+  head: string,
+  environment: Environment,
+  threshold?: number,
+): Promise<BuildDiff> {
+  const params = new URLSearchParams({ base, head, environment })
+  if (threshold !== undefined) {
+    params.set('threshold', String(threshold))
+  }
+  const response = await fetch(`/api/projects/${encodeURIComponent(project)}/diff?${params}`)
+  if (!response.ok) {
+    throw new Error('Failed to fetch build diff')
+  }
+  return response.json()
+}
+
+export type SearchFilters = {
+  project?: string
+  environment?: Environment
+  since?: string
+  until?: string
+  status?: string
+  limit?: number
+  offset?: number
+}
+
+export async function searchTestResults(query: string, filters: SearchFilters = {}): Promise<SearchResponse> {
+  const params = new URLSearchParams({ q: query })
+  Object.entries(filters).forEach(([key, value]) => {
+    if (value !== undefined && value !== '') {
+      params.set(key, String(value))
+    }
+  })
+  const response = await fetch(`/api/search?${params}`)
   if (!response.ok) {
-    throw new Error('Failed to fetch overview')
+    throw new Error('Failed to search test results')
   }
   return response.json()
 }
@@ -1,6 +1,12 @@
 import type { Environment, ProjectSummary } from '../types'
+import { useWindowedRows } from '../useWindowedRows'
 import './ProjectList.css'
 
+// Longer lists only render the items scrolled into view.
+const WINDOWING_THRESHOLD = 40
+const ESTIMATED_ITEM_HEIGHT = 48
+const ITEM_GAP = 8
+
 type Props = {
   projects: ProjectSummary[]
   selected: string
@@ -10,6 +16,15 @@ type Props = {
 }
 
 export function ProjectList({ projects, selected, statusMessage, environment, onSelect }: Props) {
+  const windowed = !statusMessage && projects.length > WINDOWING_THRESHOLD
+  const { containerRef, onScroll, measureRow, start, end, paddingTop, paddingBottom } =
+    useWindowedRows<HTMLDivElement>({
+      count: projects.length,
+      estimatedRowHeight: ESTIMATED_ITEM_HEIGHT,
+      gap: ITEM_GAP,
+      enabled: windowed,
+    })
+
   if (statusMessage) {
     return (
       <div className="project-list project-list--empty">
@@ -26,20 +41,30 @@ export function ProjectList({ projects, selected, statusMessage, environment, on
         <p className="muted">Latest Allure report per project</p>
         <span className="tag project-list__env">Environment: {environment.toUpperCase()}</span>
       </div>
-      <ul>
-        {projects.map((project) => (
-          <li key={project.project} className={selected === project.project ? 'active' : ''}>
-            <button type="button" onClick={() => onSelect(project.project)}>
-              <span className="name">{project.project}</span>
-              {project.latest && (
-                <span className="badge" title={`Latest build: ${project.latest}`}>
-                  {project.latest}
-                </span>
-              )}
-            </button>
-          </li>
-        ))}
-      </ul>
+      <div
+        className={windowed ? 'project-list__viewport project-list__viewport--windowed' : 'project-list__viewport'}
+        ref={containerRef}
+        onScroll={windowed ? onScroll : undefined}
+      >
+        <ul style={windowed ? { paddingTop, paddingBottom } : undefined}>
+          {projects.slice(start, end).map((project, index) => (
+            <li
+              key={project.project}
+              ref={windowed && index === 0 ? measureRow : undefined}
+              className={selected === project.project ? 'active' : ''}
+            >
+              <button type="button" onClick={() => onSelect(project.project)}>
+                <span className="name">{project.project}</span>
+                {project.latest && (
+                  <span className="badge" title={`Latest build: ${project.latest}`}>
+                    {project.latest}
+                  </span>
+                )}
+              </button>
+            </li>
+          ))}
+        </ul>
+      </div>
     </div>
   )
 }
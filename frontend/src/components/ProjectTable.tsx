@@ -1,5 +1,6 @@
-import { useMemo, useState } from 'react'
+import { useEffect, useMemo, useState } from 'react'
 import type { Environment, ProjectOverview } from '../types'
+import { useWindowedRows } from '../useWindowedRows'
 import '../styles/table.css'
 
 type Props = {
@@ -13,6 +14,12 @@ type StatusVariant = {
   tone: 'success' | 'warning' | 'danger' | 'muted'
 }
 
+const ROWS_PER_PAGE_OPTIONS = [5, 8, 10, 20, 50, 100, 0]
+// Pages longer than this only render the rows scrolled into view.
+const WINDOWING_THRESHOLD = 40
+const ESTIMATED_ROW_HEIGHT = 56
+const COLUMN_COUNT = 10
+
 const statusVariants: Record<ProjectOverview['status'] | 'flaky', StatusVariant> = {
   passed: { label: 'Passing', tone: 'success' },
   failed: { label: 'Failing', tone: 'danger' },
@@ -44,10 +51,24 @@ export function ProjectTable({ overview, statusMessage, environment }: Props) {
   const [page, setPage] = useState(0)
 
   const rows = useMemo(() => overview, [overview])
-  const totalPages = Math.max(1, Math.ceil(rows.length / rowsPerPage))
+  const pageSize = rowsPerPage || Math.max(1, rows.length)
+  const totalPages = Math.max(1, Math.ceil(rows.length / pageSize))
   const clampedPage = Math.min(page, totalPages - 1)
-  const pageStart = clampedPage * rowsPerPage
-  const pageRows = rows.slice(pageStart, pageStart + rowsPerPage)
+  const pageStart = clampedPage * pageSize
+  const pageRows = useMemo(() => rows.slice(pageStart, pageStart + pageSize), [rows, pageStart, pageSize])
+
+  const windowed = pageRows.length > WINDOWING_THRESHOLD
+  const { containerRef, onScroll, measureRow, start, end, paddingTop, paddingBottom } =
+    useWindowedRows<HTMLDivElement>({
+      count: pageRows.length,
+      estimatedRowHeight: ESTIMATED_ROW_HEIGHT,
+      enabled: windowed,
+    })
+  const visibleRows = pageRows.slice(start, end)
+
+  useEffect(() => {
+    if (containerRef.current) containerRef.current.scrollTop = 0
+  }, [clampedPage, pageSize, environment, containerRef])
 
   const handleRowsPerPageChange = (value: number) => {
     setRowsPerPage(value)
@@ -83,7 +104,11 @@ export function ProjectTable({ overview, statusMessage, environment }: Props) {
         {statusMessage ? (
           <div className="empty-table">{statusMessage}</div>
         ) : (
-          <div className="table-container">
+          <div
+            className={windowed ? 'table-container table-container--windowed' : 'table-container'}
+            ref={containerRef}
+            onScroll={windowed ? onScroll : undefined}
+          >
             <table className="projects-table">
               <thead>
                 <tr>
@@ -110,7 +135,12 @@ export function ProjectTable({ overview, statusMessage, environment }: Props) {
                 </tr>
               </thead>
               <tbody>
-                {pageRows.map((project) => {
+                {windowed && (
+                  <tr className="table-spacer" aria-hidden="true">
+                    <td colSpan={COLUMN_COUNT} style={{ height: paddingTop }} />
+                  </tr>
+                )}
+                {visibleRows.map((project, index) => {
                   const statusVariant = getStatusVariant(project.status)
                   const isClickable = Boolean(project.reportUrl)
                   const failedTotal = project.statistics.failed + project.statistics.broken
@@ -118,6 +148,7 @@ export function ProjectTable({ overview, statusMessage, environment }: Props) {
                   return (
                     <tr
                       key={project.project}
+                      ref={windowed && index === 0 ? measureRow : undefined}
                       className={isClickable ? 'is-clickable' : undefined}
                       onClick={() => handleRowActivate(project.reportUrl)}
                       onKeyDown={(event) => {
@@ -199,6 +230,11 @@ export function ProjectTable({ overview, statusMessage, environment }: Props) {
                     </tr>
                   )
                 })}
+                {paddingBottom > 0 && (
+                  <tr className="table-spacer" aria-hidden="true">
+                    <td colSpan={COLUMN_COUNT} style={{ height: paddingBottom }} />
+                  </tr>
+                )}
               </tbody>
             </table>
           </div>
@@ -214,9 +250,9 @@ export function ProjectTable({ overview, statusMessage, environment }: Props) {
               value={rowsPerPage}
               onChange={(event) => handleRowsPerPageChange(Number(event.target.value))}
             >
-              {[5, 8, 10, 20].map((option) => (
+              {ROWS_PER_PAGE_OPTIONS.map((option) => (
                 <option key={option} value={option}>
-                  {option}
+                  {option || 'All'}
                 </option>
               ))}
             </select>
@@ -1,6 +1,11 @@
 export type Environment = 'dev' | 'staging' | 'prod'
 
-export type HistoryEntry = { build_id: string; uploaded_at: string; environment: Environment }
+export type HistoryEntry = {
+  build_id: string
+  uploaded_at: string
+  environment: Environment
+  report_type?: 'allure' | 'loadtest'
+}
 
 export type ProjectSummary = {
   project: string
@@ -29,3 +34,64 @@ export type ProjectOverview = {
   }
   reportUrl: string | null
 }
+
+export type ProjectEnvironmentsOverview = {
+  project: string
+  retentionRuns: number | null
+  retentionDays: number | null
+  environments: Partial<Record<Environment, ProjectOverview>>
+}
+
+export type LoadTestMetric = 'rps' | 'failure_rate' | 'p50' | 'p95' | 'p99'
+
+export type LoadTestTrends = {
+  project: string
+  environment: Environment
+  builds: string[]
+  timestamps: string[]
+  endpoints: Record<string, { method: string | null; name: string } & Partial<Record<LoadTestMetric, (number | null)[]>>>
+}
+
+export type BuildDiffEntry = {
+  key: string
+  name: string
+  baseStatus: string | null
+  headStatus: string | null
+  baseDuration: number | null
+  headDuration: number | null
+  message: string | null
+  change?: number
+}
+
+export type BuildDiff = {
+  project: string
+  environment: Environment
+  base: string
+  head: string
+  threshold: number
+  summary: { tests: number; newlyFailing: number; fixed: number; slower: number; added: number; removed: number }
+  newlyFailing: BuildDiffEntry[]
+  fixed: BuildDiffEntry[]
+  slower: BuildDiffEntry[]
+}
+
+export type SearchResult = {
+  project: string
+  environment: Environment
+  buildId: string
+  uploadedAt: string
+  name: string
+  fullName: string | null
+  suite: string | null
+  status: string
+  message: string | null
+  snippet: string | null
+}
+
+export type SearchResponse = {
+  query: string
+  results: SearchResult[]
+  limit: number
+  offset: number
+  hasMore: boolean
+}
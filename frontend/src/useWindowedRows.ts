@@ -0,0 +1,97 @@
+import { useCallback, useEffect, useLayoutEffect, useRef, useState } from 'react'
+import type { RefObject, UIEvent } from 'react'
+
+type Options = {
+  count: number
+  estimatedRowHeight: number
+  overscan?: number
+  enabled?: boolean
+  gap?: number
+}
+
+export type WindowedRows<T extends HTMLElement> = {
+  containerRef: RefObject<T>
+  onScroll: (event: UIEvent<T>) => void
+  measureRow: (element: HTMLElement | null) => void
+  start: number
+  end: number
+  paddingTop: number
+  paddingBottom: number
+}
+
+/**
+ * Renders only the rows visible in a scrollable container (plus `overscan` rows either side).
+ *
+ * Rows are assumed to share one height, measured from the first rendered row, so the
+ * visible range is plain arithmetic on `scrollTop`; scroll updates are batched to one
+ * per animation frame. When disabled every row is rendered.
+ */
+export function useWindowedRows<T extends HTMLElement>({
+  count,
+  estimatedRowHeight,
+  overscan = 6,
+  enabled = true,
+  gap = 0,
+}: Options): WindowedRows<T> {
+  const containerRef = useRef<T>(null)
+  const frame = useRef<number | null>(null)
+  const [scrollTop, setScrollTop] = useState(0)
+  const [viewportHeight, setViewportHeight] = useState(0)
+  const [rowHeight, setRowHeight] = useState(estimatedRowHeight)
+
+  useLayoutEffect(() => {
+    const container = containerRef.current
+    if (!enabled || !container) return
+    setViewportHeight(container.clientHeight)
+    if (typeof ResizeObserver === 'undefined') return
+    const observer = new ResizeObserver(() => setViewportHeight(container.clientHeight))
+    observer.observe(container)
+    return () => observer.disconnect()
+    // The container may mount after the hook (e.g. once data has loaded).
+  }, [enabled, count])
+
+  useEffect(
+    () => () => {
+      if (frame.current !== null) cancelAnimationFrame(frame.current)
+    },
+    [],
+  )
+
+  const onScroll = useCallback((event: UIEvent<T>) => {
+    const target = event.currentTarget
+    if (frame.current !== null) return
+    frame.current = requestAnimationFrame(() => {
+      frame.current = null
+      setScrollTop(target.scrollTop)
+    })
+  }, [])
+
+  const measureRow = useCallback((element: HTMLElement | null) => {
+    if (!element) return
+    const height = element.getBoundingClientRect().height
+    if (height > 0) {
+      setRowHeight((current) => (Math.abs(current - height) > 0.5 ? height : current))
+    }
+  }, [])
+
+  if (!enabled) {
+    return { containerRef, onScroll, measureRow, start: 0, end: count, paddingTop: 0, paddingBottom: 0 }
+  }
+
+  const stride = rowHeight + gap
+  const visible = Math.ceil((viewportHeight || stride * 10) / stride)
+  const first = Math.min(Math.max(0, Math.floor(scrollTop / stride) - overscan), Math.max(0, count - 1))
+  // Start on an even row so `:nth-child` striping does not flip while scrolling.
+  const start = first - (first % 2)
+  const end = Math.min(count, start + visible + overscan * 2)
+
+  return {
+    containerRef,
+    onScroll,
+    measureRow,
+    start,
+    end,
+    paddingTop: start * stride,
+    paddingBottom: Math.max(0, (count - end) * stride),
+  }
+}
@@ -7,13 +7,20 @@ from .models import (
     RequestBody,
     Response,
 )
-from .utils import load_openapi
+from .refs import RefResolutionError, RefResolver, ResolutionStats, resolve_references
+from .utils import LazyOpenApiDocument, load_openapi, load_openapi_lazy
 
 __all__ = [
+    "LazyOpenApiDocument",
     "OpenApiDocument",
     "Operation",
     "Parameter",
+    "RefResolutionError",
+    "RefResolver",
     "RequestBody",
+    "ResolutionStats",
     "Response",
     "load_openapi",
+    "load_openapi_lazy",
+    "resolve_references",
 ]
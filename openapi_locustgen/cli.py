@@ -1,15 +1,144 @@
-"""Command-line interface entrypoint for openapi-locustgen.
+"""Command-line interface entrypoint for openapi-locustgen."""
 
-Phase 0 scaffold: this module will be expanded in later phases to wire
-OpenAPI parsing and code generation together.
-"""
+from __future__ import annotations
 
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
 
-def main() -> None:
-    """Placeholder CLI entrypoint."""
+from .codegen.incremental import KINDS, GenerationResult, generate
+from .orchestrator import RunOptions, run
 
-    raise SystemExit("CLI functionality will be implemented in a later phase.")
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="openapi-locustgen",
+        description="Generate API clients and Locust load tests from OpenAPI specs.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    gen = commands.add_parser(
+        "generate",
+        help="generate one client and one locustfile module per tag",
+        description="Generate modules incrementally: only modules whose operations changed are rewritten.",
+    )
+    gen.add_argument("spec", type=Path, help="OpenAPI spec (YAML or JSON)")
+    gen.add_argument("-o", "--output", type=Path, default=Path("generated"), help="output directory")
+    gen.add_argument(
+        "--kind", action="append", choices=KINDS, dest="kinds", help="what to generate (repeatable; default: all)"
+    )
+    gen.add_argument("--tag", action="append", dest="tags", help="only generate modules for this tag (repeatable)")
+    gen.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    gen.add_argument("--force", action="store_true", help="rewrite every module even if its inputs are unchanged")
+    gen.add_argument("--cache-dir", type=Path, default=None, help="parsed-spec cache directory")
+    gen.add_argument("--no-cache", action="store_true", help="do not use the parsed-spec cache")
+    gen.add_argument("--watch", action="store_true", help="regenerate whenever the spec changes")
+    gen.add_argument("--interval", type=float, default=1.0, help="seconds between checks in --watch mode")
+    gen.add_argument("-q", "--quiet", action="store_true")
+
+    run_parser = commands.add_parser(
+        "run",
+        help="run locustfiles on a local master and worker processes",
+        description="Run a headless Locust master with one worker per CPU core and write a JSON summary.",
+    )
+    run_parser.add_argument("locustfiles", nargs="+", type=Path, help="locustfiles to run together")
+    run_parser.add_argument("-H", "--host", required=True, help="base URL of the system under test")
+    run_parser.add_argument("-u", "--users", type=int, default=10, help="peak number of concurrent users")
+    run_parser.add_argument("-r", "--spawn-rate", type=float, default=10.0, help="users started per second")
+    run_parser.add_argument("-t", "--run-time", default="1m", help="e.g. 30s, 5m, 1h30m")
+    run_parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    run_parser.add_argument("--results", type=Path, default=Path("locust-results"), help="results directory")
+    run_parser.add_argument("--user-class", action="append", default=[], dest="user_classes")
+    return parser
+
+
+def _generate_once(args: argparse.Namespace, force: bool = False) -> GenerationResult:
+    result = generate(
+        args.spec,
+        args.output,
+        kinds=args.kinds or KINDS,
+        tags=args.tags,
+        cache_dir=args.cache_dir,
+        use_cache=not args.no_cache,
+        workers=args.jobs,
+        force=force,
+    )
+    if not args.quiet:
+        if result.up_to_date:
+            print(f"{args.output}: up to date ({result.seconds * 1000:.0f} ms)")
+        else:
+            print(
+                f"{args.output}: {len(result.written)} written, {len(result.unchanged)} unchanged, "
+                f"{len(result.deleted)} deleted ({result.seconds * 1000:.0f} ms)"
+            )
+    return result
+
+
+def _mtimes(paths: List[Path]) -> Dict[Path, Optional[int]]:
+    stamps: Dict[Path, Optional[int]] = {}
+    for path in paths:
+        try:
+            stamps[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            stamps[path] = None
+    return stamps
+
+
+def _watch(args: argparse.Namespace, result: GenerationResult) -> None:
+    stamps = _mtimes(result.inputs)
+    while True:
+        time.sleep(args.interval)
+        current = _mtimes(list(stamps))
+        if current == stamps:
+            continue
+        try:
+            result = _generate_once(args)
+        except Exception as exc:  # keep watching; the spec may be mid-edit
+            print(f"error: {exc}", file=sys.stderr)
+            stamps = current
+            continue
+        stamps = _mtimes(result.inputs)
+
+
+def _run(args: argparse.Namespace) -> int:
+    options = RunOptions(
+        locustfiles=args.locustfiles,
+        host=args.host,
+        users=args.users,
+        spawn_rate=args.spawn_rate,
+        run_time=args.run_time,
+        workers=args.workers,
+        results_dir=args.results,
+        user_classes=args.user_classes,
+    )
+    summary = run(options)
+    total = summary["total"]
+    print(
+        f"{total['requests']} requests, {total['failures']} failures, {total['rps']:.1f} req/s "
+        f"on {summary['workers']} workers; summary in {args.results / 'summary.json'}"
+    )
+    return summary["exit_code"]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if args.command == "run":
+        return _run(args)
+    if args.command == "generate":
+        if not args.spec.exists():
+            print(f"error: OpenAPI file not found: {args.spec}", file=sys.stderr)
+            return 2
+        result = _generate_once(args, force=args.force)
+        if args.watch:
+            try:
+                _watch(args, result)
+            except KeyboardInterrupt:
+                pass
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
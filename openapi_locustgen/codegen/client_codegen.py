@@ -1 +1,281 @@
-"""Client code generation will be implemented in a later phase."""
+"""Generate typed API clients from an :class:`OpenApiDocument`.
+
+Each operation becomes a method on a synchronous and an asynchronous client class.
+The per-call work is reduced to what the call actually varies: paths are f-strings
+compiled into the generated module, query parameters and headers are assembled by
+straight-line code for exactly the parameters the operation declares (no generic
+dict walking), and responses are wrapped in a ``__slots__`` class. Each client sends
+every call through one :mod:`openapi_locustgen.http_adapters` adapter, i.e. one
+keep-alive connection pool; httpx cannot share a pool between its sync and async
+clients, so each flavour owns its own.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..models import OpenApiDocument, Operation, Parameter
+from .common import class_name, path_parameter_names, python_identifier, unique_names
+
+_RESERVED_ARGUMENTS = {"self", "body", "content", "headers", "params", "url", "response"}
+# Members every generated client class defines before its operation methods.
+_RESERVED_METHODS = {"from_url", "close", "aclose", "_adapter"}
+
+_PYTHON_TYPES = {"integer": "int", "number": "float", "boolean": "bool", "string": "str", "array": "list", "object": "dict"}
+
+
+@dataclass
+class ClientOptions:
+    class_name: Optional[str] = None
+    sync: bool = True
+    asynchronous: bool = True
+
+
+def _annotation(parameter: Parameter) -> str:
+    schema_type = parameter.schema.get("type") if isinstance(parameter.schema, dict) else None
+    return _PYTHON_TYPES.get(schema_type, "Any")
+
+
+def _docstring(text: str) -> str:
+    if '"""' in text or "\\" in text or text.endswith('"'):
+        return repr(text)
+    return f'"""{text}"""'
+
+
+def _argument_names(operation: Operation) -> Dict[Tuple[str, str], str]:
+    names: Dict[Tuple[str, str], str] = {}
+    taken = set(_RESERVED_ARGUMENTS)
+    # Template placeholders without a declared path parameter still become arguments.
+    undeclared = [("path", name) for name in path_parameter_names(operation.path)]
+    declared = [(parameter.in_, parameter.name) for parameter in operation.parameters]
+    for location, raw_name in declared + undeclared:
+        if location not in {"path", "query", "header"} or (location, raw_name) in names:
+            continue
+        base = python_identifier(raw_name)
+        name = base if base not in taken else f"{base}_{location}"
+        while name in taken:
+            name = f"{name}_"
+        taken.add(name)
+        names[(location, raw_name)] = name
+    return names
+
+
+def _render_method(operation: Operation, method_name: str, is_async: bool) -> List[str]:
+    arguments = _argument_names(operation)
+    by_location: Dict[str, List[Parameter]] = {"path": [], "query": [], "header": []}
+    seen = set()
+    for parameter in operation.parameters:
+        key = (parameter.in_, parameter.name)
+        if key in arguments and key not in seen:
+            seen.add(key)
+            by_location[parameter.in_].append(parameter)
+
+    # Path parameters named in the template are positional and always required.
+    template_names = path_parameter_names(operation.path)
+    path_parameters = {parameter.name: parameter for parameter in by_location["path"]}
+    signature = ["self"]
+    for name in template_names:
+        parameter = path_parameters.get(name)
+        annotation = _annotation(parameter) if parameter else "Any"
+        signature.append(f"{arguments[('path', name)]}: {annotation}")
+
+    keyword_only: List[str] = []
+    optional: List[str] = []
+    for location in ("query", "header"):
+        for parameter in by_location[location]:
+            argument = arguments[(location, parameter.name)]
+            if parameter.required:
+                keyword_only.append(f"{argument}: {_annotation(parameter)}")
+            else:
+                optional.append(f"{argument}: {_annotation(parameter)} | None = None")
+    if operation.request_body is not None:
+        optional.append("body: Any = None")
+        optional.append("content: bytes | None = None")
+    optional.append("headers: Mapping[str, str] | None = None")
+    signature.append("*")
+    signature.extend(keyword_only + optional)
+
+    body: List[str] = []
+    path_expression = operation.path
+    for name in template_names:
+        path_expression = path_expression.replace(f"{{{name}}}", f"{{_quote(str({arguments[('path', name)]}))}}")
+    url = f"f{path_expression!r}" if template_names else repr(operation.path)
+
+    def build_mapping(variable: str, parameters: List[Parameter], location: str) -> Optional[str]:
+        if not parameters:
+            return None
+        required = [parameter for parameter in parameters if parameter.required]
+        literal = ", ".join(f"{parameter.name!r}: {arguments[(location, parameter.name)]}" for parameter in required)
+        body.append(f"        {variable} = {{{literal}}}")
+        for parameter in parameters:
+            if parameter.required:
+                continue
+            argument = arguments[(location, parameter.name)]
+            body.append(f"        if {argument} is not None:")
+            body.append(f"            {variable}[{parameter.name!r}] = {argument}")
+        return variable
+
+    params = build_mapping("params", by_location["query"], "query")
+
+    header_parameters = by_location["header"]
+    content_type = operation.request_body.content_type if operation.request_body is not None else None
+    if header_parameters or content_type:
+        entries = [f"'Content-Type': {content_type!r}"] if content_type else []
+        entries += [
+            f"{parameter.name!r}: str({arguments[('header', parameter.name)]})"
+            for parameter in header_parameters
+            if parameter.required
+        ]
+        literal = ", ".join(entries)
+        body.append(f"        request_headers = {{{literal}}}")
+        for parameter in header_parameters:
+            if parameter.required:
+                continue
+            argument = arguments[("header", parameter.name)]
+            body.append(f"        if {argument} is not None:")
+            body.append(f"            request_headers[{parameter.name!r}] = str({argument})")
+        body.append("        if headers:")
+        body.append("            request_headers.update(headers)")
+        headers_expression = "request_headers"
+    else:
+        headers_expression = "headers"
+
+    if operation.request_body is not None:
+        if "json" in operation.request_body.content_type:
+            body.append("        if content is None and body is not None:")
+            body.append("            content = _dumps(body).encode()")
+        else:
+            body.append("        if content is None and body is not None:")
+            body.append("            content = body if isinstance(body, bytes) else str(body).encode()")
+
+    call_arguments = [repr(operation.method), url]
+    if params:
+        call_arguments.append(f"params={params}")
+    call_arguments.append(f"headers={headers_expression}")
+    if operation.request_body is not None:
+        call_arguments.append("content=content")
+    call_arguments.append(f"name={operation.path!r}")
+    await_ = "await " if is_async else ""
+    body.append(f"        raw = {await_}self._adapter.request({', '.join(call_arguments)})")
+    body.append("        return ApiResponse(raw.status_code, raw.headers, raw.content)")
+
+    summary = " ".join((operation.summary or operation.operation_id).split()).rstrip(".")
+    docstring = f"{summary} ({operation.method} {operation.path})."
+    definition = "async def" if is_async else "def"
+    return [
+        f"    {definition} {method_name}({', '.join(signature)}) -> ApiResponse:",
+        f"        {_docstring(docstring)}",
+        *body,
+        "",
+    ]
+
+
+def _render_class(
+    document: OpenApiDocument, name: str, names: Dict[str, str], is_async: bool, operations: List[Operation]
+) -> List[str]:
+    adapter_type = "AsyncHttpAdapter" if is_async else "HttpAdapter"
+    default_adapter = "AsyncHttpxAdapter" if is_async else "HttpxAdapter"
+    close = (
+        ["    async def aclose(self) -> None:", "        await self._adapter.aclose()"]
+        if is_async
+        else ["    def close(self) -> None:", "        self._adapter.close()"]
+    )
+    enter, exit_ = ("__aenter__", "__aexit__") if is_async else ("__enter__", "__exit__")
+    lines = [
+        f"class {name}:",
+        f'    """{"Asynchronous" if is_async else "Synchronous"} client for {document.title} {document.version}."""',
+        "",
+        '    __slots__ = ("_adapter",)',
+        "",
+        f"    def __init__(self, adapter: {adapter_type}) -> None:",
+        "        self._adapter = adapter",
+        "",
+        "    @classmethod",
+        f"    def from_url(cls, base_url: str, **options: Any) -> {name}:",
+        f"        return cls({default_adapter}(base_url, **options))",
+        "",
+        *close,
+        "",
+        f"    {'async ' if is_async else ''}def {enter}(self) -> {name}:",
+        "        return self",
+        "",
+        f"    {'async ' if is_async else ''}def {exit_}(self, *exc_info: object) -> None:",
+        f"        {'await self.aclose()' if is_async else 'self.close()'}",
+        "",
+    ]
+    for operation in operations:
+        lines.extend(_render_method(operation, names[operation.operation_id], is_async))
+    return lines
+
+
+def render_client(document: OpenApiDocument, options: ClientOptions | None = None) -> str:
+    """Return the source of a client module for ``document``."""
+
+    options = options or ClientOptions()
+    names = unique_names(document.operations, _RESERVED_METHODS)
+    base_name = options.class_name or class_name(document.title, "Client")
+    async_name = base_name[: -len("Client")] + "AsyncClient" if base_name.endswith("Client") else f"{base_name}Async"
+
+    adapter_imports = []
+    if options.sync:
+        adapter_imports += ["HttpAdapter", "HttpxAdapter"]
+    if options.asynchronous:
+        adapter_imports += ["AsyncHttpAdapter", "AsyncHttpxAdapter"]
+
+    lines = [
+        f'"""API client for {document.title} {document.version}.',
+        "",
+        "Generated by openapi-locustgen; regenerate instead of editing by hand.",
+        '"""',
+        "",
+        "from __future__ import annotations",
+        "",
+        "import functools",
+        "import json",
+        "from typing import Any, Mapping",
+        "from urllib.parse import quote",
+        "",
+        f"from openapi_locustgen.http_adapters import {', '.join(sorted(adapter_imports))}",
+        "",
+        '_quote = functools.partial(quote, safe="")',
+        '_dumps = functools.partial(json.dumps, separators=(",", ":"))',
+        "",
+        "",
+        "class ApiResponse:",
+        '    __slots__ = ("status_code", "headers", "content")',
+        "",
+        "    def __init__(self, status_code: int, headers: Mapping[str, str], content: bytes) -> None:",
+        "        self.status_code = status_code",
+        "        self.headers = headers",
+        "        self.content = content",
+        "",
+        "    @property",
+        "    def ok(self) -> bool:",
+        "        return 200 <= self.status_code < 400",
+        "",
+        "    def json(self) -> Any:",
+        "        return json.loads(self.content)",
+        "",
+        "    def __repr__(self) -> str:",
+        '        return f"<ApiResponse [{self.status_code}]>"',
+        "",
+        "",
+    ]
+    if options.sync:
+        lines.extend(_render_class(document, base_name, names, False, document.operations))
+        lines.append("")
+    if options.asynchronous:
+        lines.extend(_render_class(document, async_name, names, True, document.operations))
+    return "\n".join(lines).rstrip("\n") + "\n"
+
+
+def write_client(document: OpenApiDocument, path: str | Path, options: ClientOptions | None = None) -> Path:
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(render_client(document, options), encoding="utf-8")
+    return output
+
+
+__all__ = ["ClientOptions", "render_client", "write_client"]
@@ -0,0 +1,150 @@
+"""Helpers shared by the client and Locust code generators."""
+
+from __future__ import annotations
+
+import json
+import keyword
+import re
+from typing import Any, Dict, Iterable
+from urllib.parse import quote, urlencode
+
+from ..models import Operation, Parameter
+
+_NON_IDENTIFIER = re.compile(r"\W+")
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_PATH_PARAMETER = re.compile(r"{([^}]+)}")
+
+_TYPE_PLACEHOLDERS: Dict[str, Any] = {
+    "integer": 1,
+    "number": 1.0,
+    "boolean": True,
+    "string": "string",
+    "array": [],
+    "object": {},
+}
+
+
+def python_identifier(name: str) -> str:
+    """Turn an operation id or parameter name into a snake_case Python identifier."""
+
+    snake = _CAMEL_BOUNDARY.sub("_", name)
+    snake = _NON_IDENTIFIER.sub("_", snake).strip("_").lower() or "op"
+    if snake[0].isdigit():
+        snake = f"_{snake}"
+    if keyword.iskeyword(snake):
+        snake = f"{snake}_"
+    return snake
+
+
+def class_name(title: str, suffix: str) -> str:
+    words = _NON_IDENTIFIER.split(title)
+    name = "".join(word[:1].upper() + word[1:] for word in words if word)
+    if not name or name[0].isdigit():
+        name = f"Api{name}"
+    return f"{name}{suffix}"
+
+
+def unique_names(operations: Iterable[Operation], reserved: Iterable[str] = ()) -> Dict[str, str]:
+    """Map each operation id to a unique Python identifier.
+
+    Names in ``reserved`` (and dunder names) are never produced; like repeated names,
+    they get a numeric suffix.
+    """
+
+    names: Dict[str, str] = {}
+    taken: set[str] = set(reserved)
+    for operation in operations:
+        base = python_identifier(operation.operation_id)
+        name, counter = base, 2
+        while name in taken or (name.startswith("__") and name.endswith("__")):
+            name, counter = f"{base}_{counter}", counter + 1
+        taken.add(name)
+        names[operation.operation_id] = name
+    return names
+
+
+def example_value(schema: Dict[str, Any], depth: int = 3) -> Any:
+    """Best-effort example for ``schema``.
+
+    Uses an explicit example, default or first enum value, then builds objects and
+    arrays from their members down to ``depth`` levels, then falls back to a type
+    placeholder. Unresolved (recursive) references yield ``None``.
+    """
+
+    if not isinstance(schema, dict) or "$ref" in schema:
+        return None
+    for key in ("example", "default"):
+        if key in schema:
+            return schema[key]
+    if schema.get("enum"):
+        return schema["enum"][0]
+
+    schema_type = schema.get("type", "object" if "properties" in schema else "string")
+    if depth > 0 and schema_type == "object" and schema.get("properties"):
+        values = {name: example_value(prop, depth - 1) for name, prop in schema["properties"].items()}
+        return {name: value for name, value in values.items() if value is not None}
+    if depth > 0 and schema_type == "array" and isinstance(schema.get("items"), dict):
+        item = example_value(schema["items"], depth - 1)
+        return [item] if item is not None else []
+    placeholder = _TYPE_PLACEHOLDERS.get(schema_type)
+    return placeholder.copy() if isinstance(placeholder, (list, dict)) else placeholder
+
+
+def parameter_value(parameter: Parameter) -> Any:
+    return parameter.example if parameter.example is not None else example_value(parameter.schema)
+
+
+def path_parameter_names(path: str) -> list[str]:
+    return _PATH_PARAMETER.findall(path)
+
+
+def format_scalar(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def example_url(operation: Operation) -> str:
+    """Concrete URL for ``operation`` with path and query parameters filled from examples."""
+
+    path_values = {param.name: parameter_value(param) for param in operation.parameters if param.in_ == "path"}
+    url = _PATH_PARAMETER.sub(
+        lambda match: quote(format_scalar(path_values.get(match.group(1), "1")), safe=""), operation.path
+    )
+    query = [
+        (param.name, format_scalar(value))
+        for param in operation.parameters
+        if param.in_ == "query" and (param.required or param.example is not None)
+        for value in [parameter_value(param)]
+        if value is not None
+    ]
+    return f"{url}?{urlencode(query)}" if query else url
+
+
+def example_headers(operation: Operation) -> Dict[str, str]:
+    headers = {
+        param.name: format_scalar(value)
+        for param in operation.parameters
+        if param.in_ == "header" and (param.required or param.example is not None)
+        for value in [parameter_value(param)]
+        if value is not None
+    }
+    if operation.request_body is not None:
+        headers["Content-Type"] = operation.request_body.content_type
+    return headers
+
+
+def example_body(operation: Operation) -> bytes | None:
+    """Request body for ``operation`` serialised once, ready to send as-is."""
+
+    request_body = operation.request_body
+    if request_body is None:
+        return None
+    value = request_body.example if request_body.example is not None else example_value(request_body.schema)
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        return value
+    if "json" in request_body.content_type:
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+    return str(value).encode("utf-8")
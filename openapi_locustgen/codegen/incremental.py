@@ -0,0 +1,261 @@
+"""Incremental, per-tag generation of client and Locust modules.
+
+Operations are grouped into one module per tag (the first tag of each operation;
+untagged operations go to ``default``); generating locustfiles also writes a
+``run_locust.py`` harness that runs them all. Every module's inputs -- the operations it
+contains, the document title and version and the generator settings -- are hashed and
+recorded in a manifest next to the generated files. A later run only renders and
+rewrites modules whose input hash changed, deletes modules whose tag disappeared, and
+returns without parsing the spec at all when neither the spec (nor any file it
+references) nor the settings changed since the manifest was written.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..models import OpenApiDocument, Operation
+from ..utils import _dependencies_unchanged, _load_document, default_cache_dir, write_atomic
+from .client_codegen import ClientOptions, render_client
+from .common import class_name, python_identifier
+from .locust_codegen import LocustOptions, render_locustfile
+
+MANIFEST_NAME = ".openapi-locustgen.json"
+# Bump whenever generated output changes for the same inputs, so existing outputs are rebuilt.
+MANIFEST_VERSION = 2
+KINDS = ("client", "locust")
+# Entry point that runs every generated locustfile via :mod:`openapi_locustgen.orchestrator`.
+HARNESS_NAME = "run_locust.py"
+DEFAULT_TAG = "default"
+# Rendering is CPU-bound (processes, not threads); below this many operations
+# worker start-up and pickling cost more than they save.
+PARALLEL_THRESHOLD = 2000
+
+
+@dataclass
+class GenerationResult:
+    written: List[Path] = field(default_factory=list)
+    unchanged: List[Path] = field(default_factory=list)
+    deleted: List[Path] = field(default_factory=list)
+    # True when the manifest matched and the spec was not parsed.
+    up_to_date: bool = False
+    # Spec and referenced files, for callers that watch inputs for changes.
+    inputs: List[Path] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+def operation_digest(operation: Operation) -> str:
+    """Content hash of everything generated code depends on for ``operation``."""
+
+    return hashlib.sha256(repr(operation).encode("utf-8")).hexdigest()
+
+
+def group_by_tag(operations: Iterable[Operation], tags: Optional[Iterable[str]] = None) -> Dict[str, List[Operation]]:
+    """Group operations by their first tag, optionally keeping only ``tags``."""
+
+    wanted = set(tags) if tags is not None else None
+    groups: Dict[str, List[Operation]] = {}
+    for operation in operations:
+        tag = operation.tags[0] if operation.tags else DEFAULT_TAG
+        if wanted is None or tag in wanted:
+            groups.setdefault(tag, []).append(operation)
+    return groups
+
+
+def _module_stems(tags: Iterable[str]) -> Dict[str, str]:
+    stems: Dict[str, str] = {}
+    taken: set[str] = set()
+    for tag in sorted(tags):
+        base = python_identifier(tag)
+        stem, counter = base, 2
+        while stem in taken:
+            stem, counter = f"{base}_{counter}", counter + 1
+        taken.add(stem)
+        stems[tag] = stem
+    return stems
+
+
+def _settings(kinds: Sequence[str], tags: Optional[Iterable[str]], resolve_refs: bool) -> Dict[str, Any]:
+    return {
+        "manifest_version": MANIFEST_VERSION,
+        "kinds": sorted(kinds),
+        "tags": sorted(tags) if tags is not None else None,
+        "resolve_refs": resolve_refs,
+    }
+
+
+def _read_manifest(output_dir: Path) -> Dict[str, Any]:
+    try:
+        manifest = json.loads((output_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) and manifest.get("version") == MANIFEST_VERSION else {}
+
+
+def _render_module(kind: str, document: OpenApiDocument, tag: str) -> str:
+    if kind == "client":
+        return render_client(document, ClientOptions(class_name=class_name(tag, "Client")))
+    return render_locustfile(document, LocustOptions(class_name=class_name(tag, "User")))
+
+
+def render_harness(locustfiles: Sequence[str]) -> str:
+    """Return a script running ``locustfiles`` (relative to itself) on local master and workers."""
+
+    lines = [
+        '"""Run the generated Locust suite on a local master and one worker per CPU core.',
+        "",
+        "    python run_locust.py --host http://localhost:8000 --users 50 --run-time 5m",
+        "",
+        "Results, including summary.json, are written to ./locust-results (see --results).",
+        "Generated by openapi-locustgen; regenerate instead of editing by hand.",
+        '"""',
+        "",
+        "import sys",
+        "from pathlib import Path",
+        "",
+        "from openapi_locustgen.cli import main",
+        "",
+        "HERE = Path(__file__).resolve().parent",
+        f"LOCUSTFILES = {sorted(locustfiles)!r}",
+        "",
+        'if __name__ == "__main__":',
+        '    sys.exit(main(["run", *(str(HERE / name) for name in LOCUSTFILES), *sys.argv[1:]]))',
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _render_all(jobs: List[Tuple[str, OpenApiDocument, str]], workers: int) -> List[str]:
+    operations = sum(len(document.operations) for _, document, _ in jobs)
+    if workers <= 1 or len(jobs) <= 1 or operations < PARALLEL_THRESHOLD:
+        return [_render_module(*job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        return list(executor.map(_render_module, *zip(*jobs)))
+
+
+def generate(
+    spec_path: str | os.PathLike[str],
+    output_dir: str | os.PathLike[str],
+    *,
+    kinds: Sequence[str] = KINDS,
+    tags: Optional[Iterable[str]] = None,
+    cache_dir: str | os.PathLike[str] | None = None,
+    use_cache: bool = True,
+    resolve_refs: bool = True,
+    workers: Optional[int] = None,
+    force: bool = False,
+) -> GenerationResult:
+    """Generate ``<tag>_client.py`` / ``<tag>_locust.py`` modules into ``output_dir``."""
+
+    started = time.perf_counter()
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        raise ValueError(f"Unknown output kind(s): {', '.join(sorted(unknown))}")
+
+    spec_file = Path(spec_path)
+    output = Path(output_dir)
+    content = spec_file.read_bytes()
+    spec_digest = hashlib.sha256(content).hexdigest()
+    spec_location = str(spec_file.resolve())
+    settings = _settings(kinds, tags, resolve_refs)
+    manifest = _read_manifest(output)
+    previous: Dict[str, Dict[str, Any]] = manifest.get("modules", {})
+
+    if (
+        not force
+        and manifest.get("spec_sha256") == spec_digest
+        and manifest.get("spec") == spec_location
+        and manifest.get("settings") == settings
+        and _dependencies_unchanged(manifest.get("dependencies", {}))
+        and all((output / name).exists() for name in previous)
+    ):
+        return GenerationResult(
+            unchanged=[output / name for name in previous],
+            up_to_date=True,
+            inputs=[spec_file, *map(Path, manifest.get("dependencies", {}))],
+            seconds=time.perf_counter() - started,
+        )
+
+    if cache_dir is None and use_cache:
+        cache_dir = default_cache_dir()
+    document, dependencies = _load_document(spec_file, content, cache_dir if use_cache else None, resolve_refs)
+    groups = group_by_tag(document.operations, tags)
+    stems = _module_stems(groups)
+
+    modules: Dict[str, Dict[str, Any]] = {}
+    pending: List[Tuple[str, Tuple[str, OpenApiDocument, str]]] = []
+    result = GenerationResult(inputs=[spec_file, *map(Path, dependencies)])
+    for tag, operations in groups.items():
+        digests = [operation_digest(operation) for operation in operations]
+        for kind in kinds:
+            name = f"{stems[tag]}_{kind}.py"
+            inputs = hashlib.sha256(
+                json.dumps([kind, tag, document.title, document.version, digests]).encode("utf-8")
+            ).hexdigest()
+            modules[name] = {"tag": tag, "kind": kind, "inputs": inputs, "operations": len(operations)}
+            if not force and previous.get(name, {}).get("inputs") == inputs and (output / name).exists():
+                result.unchanged.append(output / name)
+                continue
+            tag_document = OpenApiDocument(title=document.title, version=document.version, operations=operations)
+            pending.append((name, (kind, tag_document, tag)))
+
+    harness = None
+    if "locust" in kinds:
+        harness = render_harness([name for name, module in modules.items() if module["kind"] == "locust"])
+        inputs = hashlib.sha256(harness.encode("utf-8")).hexdigest()
+        if not force and previous.get(HARNESS_NAME, {}).get("inputs") == inputs and (output / HARNESS_NAME).exists():
+            result.unchanged.append(output / HARNESS_NAME)
+            harness = None
+        modules[HARNESS_NAME] = {"tag": None, "kind": "harness", "inputs": inputs, "operations": 0}
+
+    output.mkdir(parents=True, exist_ok=True)
+    rendered = _render_all([job for _, job in pending], workers or os.cpu_count() or 1)
+    for (name, _), source in zip(pending, rendered):
+        write_atomic(output / name, source.encode("utf-8"))
+        result.written.append(output / name)
+    if harness is not None:
+        write_atomic(output / HARNESS_NAME, harness.encode("utf-8"))
+        result.written.append(output / HARNESS_NAME)
+
+    # Only ever delete files this generator recorded writing.
+    for name in previous.keys() - modules.keys():
+        stale = output / name
+        if stale.exists():
+            stale.unlink()
+            result.deleted.append(stale)
+
+    write_atomic(
+        output / MANIFEST_NAME,
+        json.dumps(
+            {
+                "version": MANIFEST_VERSION,
+                "spec": spec_location,
+                "spec_sha256": spec_digest,
+                "settings": settings,
+                "dependencies": dependencies,
+                "modules": modules,
+            },
+            indent=2,
+            sort_keys=True,
+        ).encode("utf-8")
+        + b"\n",
+    )
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+__all__ = [
+    "GenerationResult",
+    "HARNESS_NAME",
+    "MANIFEST_NAME",
+    "generate",
+    "group_by_tag",
+    "operation_digest",
+    "render_harness",
+]
@@ -1 +1,169 @@
-"""Locust code generation will be implemented in a later phase."""
+"""Generate Locust user classes from an :class:`OpenApiDocument`.
+
+Everything that does not change between requests is computed at generation time:
+URLs (path and query parameters filled from examples), request bodies serialised to
+``bytes`` and per-operation headers all become module-level constants, so each task
+is a single ``self.client.request`` call with no string formatting or JSON encoding.
+Templated paths report under their template (``name="/pets/{petId}"``) so Locust
+groups their statistics instead of creating one entry per concrete URL.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from ..models import OpenApiDocument, Operation
+from .common import class_name, example_body, example_headers, example_url, path_parameter_names, unique_names
+
+USER_CLASSES = ("FastHttpUser", "HttpUser")
+# Task methods share the user class body with these: the decorators the template uses
+# and the attributes Locust's ``User``/``HttpUser``/``FastHttpUser`` look up on it.
+RESERVED_NAMES = frozenset(
+    {
+        "task",
+        "tag",
+        "between",
+        "abstract",
+        "client",
+        "context",
+        "environment",
+        "fixed_count",
+        "greenlet",
+        "host",
+        "on_start",
+        "on_stop",
+        "run",
+        "start",
+        "stop",
+        "tasks",
+        "wait",
+        "wait_time",
+        "weight",
+        "client_pool",
+        "concurrency",
+        "connection_timeout",
+        "default_headers",
+        "insecure",
+        "max_redirects",
+        "max_retries",
+        "network_timeout",
+        "pool_manager",
+        "proxy_host",
+        "proxy_port",
+    }
+)
+
+
+@dataclass
+class LocustOptions:
+    user_class: str = "FastHttpUser"
+    class_name: Optional[str] = None
+    host: Optional[str] = None
+    # Task weights keyed by operation id or tag; operation ids win over tags.
+    weights: Mapping[str, int] = field(default_factory=dict)
+    default_weight: int = 1
+    # ``(min, max)`` seconds between tasks; ``None`` runs tasks back to back.
+    wait_time: Optional[Tuple[float, float]] = None
+    group_templated_paths: bool = True
+
+    def __post_init__(self) -> None:
+        if self.user_class not in USER_CLASSES:
+            raise ValueError(f"user_class must be one of {', '.join(USER_CLASSES)}")
+
+
+def task_weight(operation: Operation, options: LocustOptions) -> int:
+    if operation.operation_id in options.weights:
+        return options.weights[operation.operation_id]
+    for tag in operation.tags:
+        if tag in options.weights:
+            return options.weights[tag]
+    return options.default_weight
+
+
+def _render_constants(prefix: str, operation: Operation) -> Tuple[List[str], Dict[str, str]]:
+    lines = [
+        f"# {operation.operation_id}: {operation.method} {operation.path}",
+        f"{prefix}_URL = {example_url(operation)!r}",
+    ]
+    kwargs: Dict[str, str] = {}
+
+    headers = example_headers(operation)
+    if headers:
+        lines.append(f"{prefix}_HEADERS = {headers!r}")
+        kwargs["headers"] = f"{prefix}_HEADERS"
+
+    body = example_body(operation)
+    if body is not None:
+        lines.append(f"{prefix}_BODY = {body!r}")
+        kwargs["data"] = f"{prefix}_BODY"
+    return lines, kwargs
+
+
+def render_locustfile(document: OpenApiDocument, options: LocustOptions | None = None) -> str:
+    """Return the source of a locustfile exercising every operation in ``document``."""
+
+    options = options or LocustOptions()
+    names = unique_names(document.operations, RESERVED_NAMES)
+    user_name = options.class_name or class_name(document.title, "User")
+
+    imports = [options.user_class, "task"]
+    if options.wait_time is not None:
+        imports.append("between")
+
+    constants: List[str] = []
+    tasks: List[str] = []
+    for operation in document.operations:
+        weight = task_weight(operation, options)
+        if weight == 0:
+            continue
+        method_name = names[operation.operation_id]
+        op_constants, kwargs = _render_constants(method_name.upper(), operation)
+        constants.extend(op_constants)
+        constants.append("")
+
+        arguments = [repr(operation.method), f"{method_name.upper()}_URL"]
+        if options.group_templated_paths and path_parameter_names(operation.path):
+            arguments.append(f"name={operation.path!r}")
+        arguments.extend(f"{key}={value}" for key, value in kwargs.items())
+        tasks.extend(
+            [
+                f"    @task({weight})",
+                f"    def {method_name}(self):",
+                f"        self.client.request({', '.join(arguments)})",
+                "",
+            ]
+        )
+
+    lines = [
+        f'"""Locust load test for {document.title} {document.version}.',
+        "",
+        "Generated by openapi-locustgen; regenerate instead of editing by hand.",
+        '"""',
+        "",
+        f"from locust import {', '.join(sorted(imports))}",
+        "",
+        "",
+        *constants,
+        "",
+        f"class {user_name}({options.user_class}):",
+    ]
+    if options.host:
+        lines.append(f"    host = {options.host!r}")
+    if options.wait_time is not None:
+        lines.append(f"    wait_time = between({options.wait_time[0]!r}, {options.wait_time[1]!r})")
+    if options.host or options.wait_time is not None:
+        lines.append("")
+    lines.extend(tasks or ["    pass", ""])
+    return "\n".join(lines).rstrip("\n") + "\n"
+
+
+def write_locustfile(document: OpenApiDocument, path: str | Path, options: LocustOptions | None = None) -> Path:
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(render_locustfile(document, options), encoding="utf-8")
+    return output
+
+
+__all__ = ["LocustOptions", "render_locustfile", "task_weight", "write_locustfile"]
@@ -1 +1,210 @@
-"""HTTP client adapters will be implemented in a later phase."""
+"""HTTP backends used by generated API clients.
+
+Generated clients only depend on the small :class:`HttpAdapter` /
+:class:`AsyncHttpAdapter` protocols, so the same client code can run on a pooled
+``httpx.Client``, an ``httpx.AsyncClient`` or inside a Locust ``FastHttpUser``.
+Every adapter owns one long-lived connection pool and keeps connections alive between
+calls; construct one per target host and reuse it.
+
+``httpx`` and ``locust`` are optional dependencies and are imported only when the
+corresponding adapter is created.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Mapping, Optional, Protocol
+from urllib.parse import urlencode
+
+Params = Optional[Mapping[str, Any]]
+Headers = Optional[Mapping[str, str]]
+
+
+class HttpAdapter(Protocol):
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Params = None,
+        headers: Headers = None,
+        content: bytes | None = None,
+        name: str | None = None,
+    ) -> Any:
+        """Send a request; ``name`` is a grouping label for adapters that report statistics."""
+
+    def close(self) -> None: ...
+
+
+class AsyncHttpAdapter(Protocol):
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Params = None,
+        headers: Headers = None,
+        content: bytes | None = None,
+        name: str | None = None,
+    ) -> Any: ...
+
+    async def aclose(self) -> None: ...
+
+
+def _httpx_limits(max_connections: int | None, max_keepalive_connections: int | None, keepalive_expiry: float):
+    import httpx
+
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+class HttpxAdapter:
+    """Synchronous adapter over a pooled ``httpx.Client``."""
+
+    def __init__(
+        self,
+        base_url: str = "",
+        *,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        timeout: float = 30.0,
+        client: Any = None,
+    ) -> None:
+        if client is None:
+            import httpx
+
+            client = httpx.Client(
+                base_url=base_url,
+                limits=_httpx_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+                http2=http2,
+                timeout=timeout,
+            )
+        self.client = client
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Params = None,
+        headers: Headers = None,
+        content: bytes | None = None,
+        name: str | None = None,
+    ) -> Any:
+        return self.client.request(method, url, params=params, headers=headers, content=content)
+
+    def close(self) -> None:
+        self.client.close()
+
+    def __enter__(self) -> HttpxAdapter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class AsyncHttpxAdapter:
+    """Asynchronous adapter over a pooled ``httpx.AsyncClient``.
+
+    ``concurrency`` caps the number of requests in flight; callers beyond it wait for a
+    slot instead of queueing inside the connection pool (or opening new connections).
+    """
+
+    def __init__(
+        self,
+        base_url: str = "",
+        *,
+        concurrency: int = 100,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        timeout: float = 30.0,
+        client: Any = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if client is None:
+            import httpx
+
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                limits=_httpx_limits(
+                    max_connections or concurrency, max_keepalive_connections or concurrency, keepalive_expiry
+                ),
+                http2=http2,
+                timeout=timeout,
+            )
+        self.client = client
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Params = None,
+        headers: Headers = None,
+        content: bytes | None = None,
+        name: str | None = None,
+    ) -> Any:
+        async with self._semaphore:
+            return await self.client.request(method, url, params=params, headers=headers, content=content)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self) -> AsyncHttpxAdapter:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+
+class LocustSessionAdapter:
+    """Adapter over a Locust user's ``client`` (``FastHttpSession`` or ``HttpSession``).
+
+    Requests are recorded in Locust's statistics under ``name`` when given, so calls
+    to templated paths are grouped. The session owns the keep-alive connection pool;
+    HTTP/2 is not available through Locust's clients.
+    """
+
+    def __init__(self, session: Any) -> None:
+        self.session = session
+
+    @classmethod
+    def for_user(cls, user: Any) -> LocustSessionAdapter:
+        return cls(user.client)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Params = None,
+        headers: Headers = None,
+        content: bytes | None = None,
+        name: str | None = None,
+    ) -> Any:
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(params, doseq=True)}"
+        return self.session.request(method, url, name=name, headers=headers, data=content)
+
+    def close(self) -> None:
+        # The session belongs to the Locust user and lives as long as it does.
+        pass
+
+
+__all__ = [
+    "AsyncHttpAdapter",
+    "AsyncHttpxAdapter",
+    "HttpAdapter",
+    "HttpxAdapter",
+    "LocustSessionAdapter",
+]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
@@ -36,6 +36,7 @@ class Operation:
     parameters: List[Parameter]
     request_body: Optional[RequestBody]
     responses: Dict[int, Response]
+    tags: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -0,0 +1,239 @@
+"""Run generated Locust suites on a local master and a pool of worker processes.
+
+One Locust process is limited to one CPU core, so :func:`run` starts a headless master
+plus ``workers`` worker processes (one per core by default) on the loopback
+interface, waits for the run to finish and turns the master's aggregated
+``<prefix>_stats.csv`` into a JSON summary::
+
+    {"endpoints": [{"method": "GET", "name": "/pets/{petId}", "requests": 1200,
+                    "failures": 3, "rps": 40.1, "failure_rate": 0.0025,
+                    "p50": 12.0, "p95": 48.0, "p99": 95.0, ...}], "total": {...}}
+
+``locust`` itself is only needed by the spawned processes, not to import this module.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+SUMMARY_NAME = "summary.json"
+CSV_PREFIX = "locust"
+# Columns of Locust's ``*_stats.csv`` mapped to summary keys.
+_PERCENTILE_COLUMNS = {"p50": "50%", "p95": "95%", "p99": "99%"}
+
+
+@dataclass
+class RunOptions:
+    locustfiles: Sequence[str | os.PathLike[str]]
+    host: str
+    users: int = 10
+    spawn_rate: float = 10.0
+    run_time: str = "1m"
+    # Worker processes; ``None`` means one per CPU core.
+    workers: Optional[int] = None
+    results_dir: Path = Path("locust-results")
+    master_port: Optional[int] = None
+    user_classes: List[str] = field(default_factory=list)
+    locust_command: Sequence[str] = (sys.executable, "-m", "locust")
+    # Seconds to wait for workers to exit after the master finished.
+    shutdown_timeout: float = 10.0
+    # Seconds the master waits for all workers to connect before giving up, so a
+    # worker that dies on startup cannot leave the run hanging.
+    worker_connect_timeout: int = 60
+
+    def __post_init__(self) -> None:
+        if not self.locustfiles:
+            raise ValueError("at least one locustfile is required")
+        if self.workers is not None and self.workers < 1:
+            raise ValueError("workers must be at least 1")
+
+    @property
+    def worker_count(self) -> int:
+        return self.workers or os.cpu_count() or 1
+
+
+def free_port(host: str = "127.0.0.1") -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def _locustfile_argument(options: RunOptions) -> str:
+    return ",".join(str(path) for path in options.locustfiles)
+
+
+def master_command(options: RunOptions, port: int) -> List[str]:
+    return [
+        *options.locust_command,
+        "-f",
+        _locustfile_argument(options),
+        "--master",
+        "--headless",
+        "--master-bind-host",
+        "127.0.0.1",
+        "--master-bind-port",
+        str(port),
+        "--expect-workers",
+        str(options.worker_count),
+        "--expect-workers-max-wait",
+        str(options.worker_connect_timeout),
+        "--host",
+        options.host,
+        "--users",
+        str(options.users),
+        "--spawn-rate",
+        str(options.spawn_rate),
+        "--run-time",
+        options.run_time,
+        "--csv",
+        str(Path(options.results_dir) / CSV_PREFIX),
+        "--only-summary",
+        *options.user_classes,
+    ]
+
+
+def worker_command(options: RunOptions, port: int) -> List[str]:
+    return [
+        *options.locust_command,
+        "-f",
+        _locustfile_argument(options),
+        "--worker",
+        "--master-host",
+        "127.0.0.1",
+        "--master-port",
+        str(port),
+        *options.user_classes,
+    ]
+
+
+def _number(value: str | None) -> float:
+    try:
+        return float(value) if value not in (None, "", "N/A") else 0.0
+    except ValueError:
+        return 0.0
+
+
+def _endpoint(row: Dict[str, str]) -> Dict[str, Any]:
+    requests = int(_number(row.get("Request Count")))
+    failures = int(_number(row.get("Failure Count")))
+    entry: Dict[str, Any] = {
+        "method": row.get("Type") or None,
+        "name": row.get("Name", ""),
+        "requests": requests,
+        "failures": failures,
+        "rps": _number(row.get("Requests/s")),
+        "failure_rate": failures / requests if requests else 0.0,
+        "avg": _number(row.get("Average Response Time")),
+        "max": _number(row.get("Max Response Time")),
+    }
+    for key, column in _PERCENTILE_COLUMNS.items():
+        entry[key] = _number(row.get(column))
+    return entry
+
+
+def parse_stats_csv(path: str | os.PathLike[str]) -> Dict[str, Any]:
+    """Convert a Locust ``*_stats.csv`` file into the summary structure."""
+
+    endpoints: List[Dict[str, Any]] = []
+    total: Optional[Dict[str, Any]] = None
+    with open(path, newline="", encoding="utf-8") as fp:
+        for row in csv.DictReader(fp):
+            entry = _endpoint(row)
+            if entry["name"] == "Aggregated":
+                entry.pop("method")
+                total = entry
+            else:
+                endpoints.append(entry)
+    if total is None:
+        requests = sum(entry["requests"] for entry in endpoints)
+        failures = sum(entry["failures"] for entry in endpoints)
+        total = {
+            "name": "Aggregated",
+            "requests": requests,
+            "failures": failures,
+            "rps": sum(entry["rps"] for entry in endpoints),
+            "failure_rate": failures / requests if requests else 0.0,
+        }
+    return {"endpoints": endpoints, "total": total}
+
+
+def _remove_previous_results(results_dir: Path) -> None:
+    # A master that dies before writing stats must not be summarised from an older run.
+    for path in (*results_dir.glob(f"{CSV_PREFIX}_*.csv"), results_dir / SUMMARY_NAME):
+        path.unlink(missing_ok=True)
+
+
+def _terminate(processes: Sequence[subprocess.Popen], timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    for process in processes:
+        try:
+            process.wait(max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            process.send_signal(signal.SIGTERM)
+    for process in processes:
+        try:
+            process.wait(5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def run(options: RunOptions) -> Dict[str, Any]:
+    """Run the suite locally and return (and write) the JSON summary."""
+
+    results_dir = Path(options.results_dir)
+    results_dir.mkdir(parents=True, exist_ok=True)
+    _remove_previous_results(results_dir)
+    port = options.master_port or free_port()
+    master: Optional[subprocess.Popen] = None
+    workers: List[subprocess.Popen] = []
+    logs = []
+    started = time.time()
+    try:
+        master_log = (results_dir / "master.log").open("wb")
+        logs.append(master_log)
+        master = subprocess.Popen(master_command(options, port), stdout=master_log, stderr=subprocess.STDOUT)
+        for index in range(options.worker_count):
+            log = (results_dir / f"worker-{index}.log").open("wb")
+            logs.append(log)
+            workers.append(subprocess.Popen(worker_command(options, port), stdout=log, stderr=subprocess.STDOUT))
+        exit_code = master.wait()
+    except BaseException:
+        # Covers a worker failing to spawn as well as an interrupted wait.
+        for process in (master, *workers):
+            if process is not None and process.poll() is None:
+                process.send_signal(signal.SIGTERM)
+        if master is not None:
+            _terminate([master], options.shutdown_timeout)
+        raise
+    finally:
+        _terminate(workers, options.shutdown_timeout)
+        for log in logs:
+            log.close()
+
+    stats_path = results_dir / f"{CSV_PREFIX}_stats.csv"
+    if not stats_path.exists():
+        raise RuntimeError(f"Locust master exited with {exit_code} without writing {stats_path}; see master.log")
+    summary = {
+        "host": options.host,
+        "users": options.users,
+        "workers": options.worker_count,
+        "started_at": started,
+        "duration": time.time() - started,
+        "exit_code": exit_code,
+        **parse_stats_csv(stats_path),
+    }
+    (results_dir / SUMMARY_NAME).write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+    return summary
+
+
+__all__ = ["RunOptions", "free_port", "master_command", "parse_stats_csv", "run", "worker_command"]
@@ -0,0 +1,171 @@
+"""Resolution of ``$ref`` references in raw OpenAPI documents.
+
+References are resolved once per target and the result is interned: every
+``{"$ref": "#/components/schemas/Pet"}`` in the document is replaced by the *same*
+dict object, so a component shared by hundreds of operations exists once in memory
+and downstream code generation never re-walks it. Resolved structures are shared
+and must be treated as read-only.
+
+Recursive schemas are not expanded: a reference back to a target that is still being
+resolved is left as a ``{"$ref": ...}`` dict (itself interned per target), which keeps
+the resolved graph finite and acyclic.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+from urllib.parse import unquote
+
+# (document path or None for the root document, JSON pointer)
+_TargetKey = Tuple[Optional[Path], str]
+
+
+@dataclass
+class ResolutionStats:
+    references: int = 0
+    targets: int = 0
+    cycles: int = 0
+    documents: int = 1
+    seconds: float = 0.0
+
+
+class RefResolutionError(ValueError):
+    """Raised when a ``$ref`` cannot be followed."""
+
+
+def _default_loader(path: Path) -> Dict[str, Any]:
+    from .utils import _parse_spec_text
+
+    return _parse_spec_text(path.read_bytes(), path.suffix)
+
+
+class RefResolver:
+    """Resolve local (``#/...``) and file-relative (``other.yaml#/...``) references.
+
+    The resolver rewrites containers in place and memoises each target, so calling
+    :meth:`resolve` repeatedly (e.g. once per operation) only pays for parts of the
+    document it has not seen yet.
+    """
+
+    def __init__(
+        self,
+        document: Dict[str, Any],
+        base_path: str | Path | None = None,
+        loader: Callable[[Path], Dict[str, Any]] = _default_loader,
+    ) -> None:
+        self._root_path = Path(base_path).resolve() if base_path is not None else None
+        self._documents: Dict[Optional[Path], Dict[str, Any]] = {None: document}
+        self._loader = loader
+        self._resolved: Dict[_TargetKey, Any] = {}
+        self._in_progress: Set[_TargetKey] = set()
+        self._cycle_markers: Dict[_TargetKey, Dict[str, str]] = {}
+        self._walked: Set[int] = set()
+        self._active: Set[int] = set()
+        self.stats = ResolutionStats()
+
+    @property
+    def external_documents(self) -> list[Path]:
+        """Files other than the root document that references were followed into."""
+
+        return [path for path in self._documents if path is not None]
+
+    def resolve(self, node: Any) -> Any:
+        """Return ``node`` with every reference below it resolved."""
+
+        start = time.perf_counter()
+        try:
+            return self._walk(node, None)
+        finally:
+            self.stats.seconds += time.perf_counter() - start
+
+    def _walk(self, node: Any, document: Optional[Path]) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                return self._resolve_ref(ref, document)
+            items = node.items()
+        elif isinstance(node, list):
+            items = enumerate(node)
+        else:
+            return node
+
+        node_id = id(node)
+        if node_id in self._walked:
+            return node
+        self._walked.add(node_id)
+        self._active.add(node_id)
+        try:
+            for key, value in list(items):
+                if isinstance(value, (dict, list)):
+                    resolved = self._walk(value, document)
+                    if resolved is not value:
+                        node[key] = resolved
+        finally:
+            self._active.discard(node_id)
+        return node
+
+    def _resolve_ref(self, ref: str, document: Optional[Path]) -> Any:
+        self.stats.references += 1
+        key = self._target_key(ref, document)
+        if key in self._resolved:
+            return self._resolved[key]
+
+        target = self._lookup(key)
+        # A target that is still being walked (an ancestor of this reference, or a
+        # reference chain that loops) would make the graph cyclic: leave a marker.
+        if key in self._in_progress or id(target) in self._active:
+            marker = self._cycle_markers.get(key)
+            if marker is None:
+                self.stats.cycles += 1
+                marker = self._cycle_markers[key] = {"$ref": ref}
+            return marker
+
+        self._in_progress.add(key)
+        try:
+            resolved = self._walk(target, key[0])
+        finally:
+            self._in_progress.discard(key)
+        self._resolved[key] = resolved
+        self.stats.targets += 1
+        return resolved
+
+    def _target_key(self, ref: str, document: Optional[Path]) -> _TargetKey:
+        location, _, pointer = ref.partition("#")
+        if not location:
+            return document, pointer
+
+        base = document or self._root_path
+        if base is None:
+            raise RefResolutionError(f"Cannot resolve file reference {ref!r} without a base path")
+        target = (base.parent / unquote(location)).resolve()
+        return (None if target == self._root_path else target), pointer
+
+    def _lookup(self, key: _TargetKey) -> Any:
+        path, pointer = key
+        if path not in self._documents:
+            try:
+                self._documents[path] = self._loader(path)
+            except OSError as exc:
+                raise RefResolutionError(f"Cannot load referenced document {path}: {exc}") from None
+            self.stats.documents += 1
+
+        node: Any = self._documents[path]
+        for token in pointer.lstrip("/").split("/") if pointer.strip("/") else []:
+            token = unquote(token).replace("~1", "/").replace("~0", "~")
+            try:
+                node = node[int(token)] if isinstance(node, list) else node[token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                location = f"{path}#{pointer}" if path else f"#{pointer}"
+                raise RefResolutionError(f"Unresolvable reference: {location}") from None
+        return node
+
+
+def resolve_references(document: Dict[str, Any], base_path: str | Path | None = None) -> ResolutionStats:
+    """Resolve every reference in ``document`` in place and return resolution statistics."""
+
+    resolver = RefResolver(document, base_path)
+    resolver.resolve(document)
+    return resolver.stats
@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import pickle
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, List
-
-import yaml
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 from .models import OpenApiDocument, Operation, Parameter, RequestBody, Response
+from .refs import RefResolver
 
 
 ALLOWED_METHODS = {"get", "post", "put", "delete"}
 
+# Bump whenever the pickled model layout changes so stale cache entries are ignored.
+CACHE_FORMAT_VERSION = 2
+
+
+def default_cache_dir() -> Path:
+    """Directory used for parsed-spec caches unless a caller chooses another one."""
+
+    configured = os.environ.get("OPENAPI_LOCUSTGEN_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "openapi-locustgen"
+
 
 def _coerce_status_code(status: str) -> int:
     try:
@@ -68,48 +84,274 @@ def _parse_responses(raw_responses: Dict[str, Any]) -> Dict[int, Response]:
     return responses
 
 
-def load_openapi(path: str) -> OpenApiDocument:
-    """Load an OpenAPI spec from a file and convert to :class:`OpenApiDocument`."""
+def _parse_spec_text(text: str | bytes, suffix: str) -> Dict[str, Any]:
+    if suffix.lower() == ".json":
+        return json.loads(text)
 
-    file_path = Path(path)
-    if not file_path.exists():
-        raise FileNotFoundError(f"OpenAPI file not found: {path}")
+    # PyYAML is comparatively slow to import; JSON specs never need it.
+    import yaml
 
-    text = file_path.read_text(encoding="utf-8")
-    if file_path.suffix.lower() == ".json":
-        raw_spec = json.loads(text)
-    else:
-        raw_spec = yaml.safe_load(text)
+    # The libyaml-backed loader is an order of magnitude faster on large specs.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(text, Loader=loader)
 
-    info = raw_spec.get("info", {})
-    title = info.get("title", "")
-    version = info.get("version", "")
 
-    operations: List[Operation] = []
+def _iter_raw_operations(
+    raw_spec: Dict[str, Any],
+) -> Iterator[Tuple[str, str, List[Dict[str, Any]], Dict[str, Any]]]:
+    """Yield ``(path, method, path-level parameters, operation)`` for supported operations."""
+
     paths = raw_spec.get("paths", {})
     for path_name, path_item in paths.items():
-        path_parameters = _parse_parameters(path_item.get("parameters", [])) if isinstance(path_item, dict) else []
         if not isinstance(path_item, dict):
             continue
+        path_parameters = path_item.get("parameters", [])
         for method, operation in path_item.items():
             if method.lower() not in ALLOWED_METHODS:
                 continue
             if not isinstance(operation, dict):
                 continue
-            op_parameters = path_parameters + _parse_parameters(operation.get("parameters", []))
-            request_body = _parse_request_body(operation.get("requestBody"))
-            responses = _parse_responses(operation.get("responses", {}))
-            operation_id = operation.get("operationId") or _build_operation_id(method, path_name)
-            operations.append(
-                Operation(
-                    operation_id=operation_id,
-                    method=method.upper(),
-                    path=path_name,
-                    summary=operation.get("summary"),
-                    parameters=op_parameters,
-                    request_body=request_body,
-                    responses=responses,
-                )
+            yield path_name, method, path_parameters, operation
+
+
+def _operation_matches(
+    path_name: str, operation_tags: Iterable[str], tags: set[str] | None, path_prefix: str | None
+) -> bool:
+    if path_prefix is not None and not path_name.startswith(path_prefix):
+        return False
+    if tags is not None and tags.isdisjoint(operation_tags):
+        return False
+    return True
+
+
+def _build_operation(
+    path_name: str,
+    method: str,
+    path_parameters: List[Dict[str, Any]],
+    operation: Dict[str, Any],
+    resolver: RefResolver | None = None,
+) -> Operation:
+    if resolver is not None:
+        path_parameters = resolver.resolve(path_parameters)
+        operation = resolver.resolve(operation)
+    op_parameters = _parse_parameters(path_parameters) + _parse_parameters(operation.get("parameters", []))
+    request_body = _parse_request_body(operation.get("requestBody"))
+    responses = _parse_responses(operation.get("responses", {}))
+    operation_id = operation.get("operationId") or _build_operation_id(method, path_name)
+    return Operation(
+        operation_id=operation_id,
+        method=method.upper(),
+        path=path_name,
+        summary=operation.get("summary"),
+        parameters=op_parameters,
+        request_body=request_body,
+        responses=responses,
+        tags=list(operation.get("tags", [])),
+    )
+
+
+def _build_document(
+    raw_spec: Dict[str, Any],
+    tags: Iterable[str] | None = None,
+    path_prefix: str | None = None,
+    resolver: RefResolver | None = None,
+) -> OpenApiDocument:
+    info = raw_spec.get("info", {})
+    tags = set(tags) if tags is not None else None
+    operations = [
+        _build_operation(path_name, method, path_parameters, operation, resolver)
+        for path_name, method, path_parameters, operation in _iter_raw_operations(raw_spec)
+        if _operation_matches(path_name, operation.get("tags", []), tags, path_prefix)
+    ]
+    return OpenApiDocument(title=info.get("title", ""), version=info.get("version", ""), operations=operations)
+
+
+def _cache_path(cache_dir: str | os.PathLike[str], content: bytes, kind: str, origin: Path | None = None) -> Path:
+    hasher = hashlib.sha256(content)
+    if origin is not None:
+        # Relative ``$ref``s resolve against the spec's location, so identical specs in
+        # different directories can resolve to different documents.
+        hasher.update(b"\0" + os.fsencode(origin.resolve()))
+    digest = hasher.hexdigest()
+    return Path(cache_dir) / f"{digest}-{kind}-v{CACHE_FORMAT_VERSION}.pickle"
+
+
+def _file_digests(paths: Iterable[Path]) -> Dict[str, str]:
+    return {str(path): hashlib.sha256(path.read_bytes()).hexdigest() for path in paths}
+
+
+def _dependencies_unchanged(dependencies: Dict[str, str]) -> bool:
+    try:
+        return _file_digests(Path(path) for path in dependencies) == dependencies
+    except OSError:
+        return False
+
+
+def _read_cache(cache_path: Path, expected_type: type) -> Any:
+    try:
+        with cache_path.open("rb") as fp:
+            cached = pickle.load(fp)
+    except Exception:
+        # Missing, truncated or incompatible entries are all just cache misses.
+        return None
+    return cached if isinstance(cached, expected_type) else None
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so concurrent readers see the old or new file, never a partial one."""
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _write_cache(cache_path: Path, value: Any) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(cache_path, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _filter_document(
+    document: OpenApiDocument, tags: Iterable[str] | None, path_prefix: str | None
+) -> OpenApiDocument:
+    if tags is None and path_prefix is None:
+        return document
+    tags = set(tags) if tags is not None else None
+    operations = [op for op in document.operations if _operation_matches(op.path, op.tags, tags, path_prefix)]
+    return OpenApiDocument(title=document.title, version=document.version, operations=operations)
+
+
+def load_openapi(
+    path: str | os.PathLike[str],
+    *,
+    cache_dir: str | os.PathLike[str] | None = None,
+    tags: Iterable[str] | None = None,
+    path_prefix: str | None = None,
+    resolve_refs: bool = True,
+) -> OpenApiDocument:
+    """Load an OpenAPI spec from a file and convert to :class:`OpenApiDocument`.
+
+    ``$ref`` references are resolved (see :mod:`openapi_locustgen.refs`) unless
+    ``resolve_refs`` is false. When ``cache_dir`` is given, the parsed document is
+    pickled there keyed by a hash of the spec's content and location (and checked
+    against the hashes of any files it references), so unchanged specs skip YAML parsing entirely
+    on later loads. ``tags`` and ``path_prefix`` restrict the returned operations.
+    """
+
+    file_path = Path(path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"OpenAPI file not found: {path}")
+
+    content = file_path.read_bytes()
+    if cache_dir is None:
+        raw_spec = _parse_spec_text(content, file_path.suffix)
+        resolver = RefResolver(raw_spec, file_path) if resolve_refs else None
+        return _build_document(raw_spec, tags, path_prefix, resolver)
+
+    document, _ = _load_document(file_path, content, cache_dir, resolve_refs)
+    return _filter_document(document, tags, path_prefix)
+
+
+def _load_document(
+    file_path: Path, content: bytes, cache_dir: str | os.PathLike[str] | None, resolve_refs: bool = True
+) -> Tuple[OpenApiDocument, Dict[str, str]]:
+    """Return the full document and the digests of the external files it references."""
+
+    cache_path = None
+    if cache_dir is not None:
+        if resolve_refs:
+            cache_path = _cache_path(cache_dir, content, "document", origin=file_path)
+        else:
+            cache_path = _cache_path(cache_dir, content, "document-unresolved")
+        cached = _read_cache(cache_path, tuple)
+        if cached is not None and _dependencies_unchanged(cached[1]):
+            return cached
+
+    raw_spec = _parse_spec_text(content, file_path.suffix)
+    resolver = RefResolver(raw_spec, file_path) if resolve_refs else None
+    document = _build_document(raw_spec, resolver=resolver)
+    dependencies = _file_digests(resolver.external_documents) if resolver is not None else {}
+    if cache_path is not None:
+        _write_cache(cache_path, (document, dependencies))
+    return document, dependencies
+
+
+class LazyOpenApiDocument:
+    """Parsed spec whose :class:`Operation` objects are built on first request.
+
+    Useful for very large specs when only a slice of the API (a tag, a path prefix or
+    a handful of operation ids) is needed. Built operations are memoised.
+    """
+
+    def __init__(self, raw_spec: Dict[str, Any], resolver: RefResolver | None = None) -> None:
+        info = raw_spec.get("info", {})
+        self.title: str = info.get("title", "")
+        self.version: str = info.get("version", "")
+        self._raw_spec = raw_spec
+        self._resolver = resolver
+        self._operations: Dict[Tuple[str, str], Operation] = {}
+
+    def _operation(
+        self, path_name: str, method: str, path_parameters: List[Dict[str, Any]], operation: Dict[str, Any]
+    ) -> Operation:
+        key = (path_name, method)
+        built = self._operations.get(key)
+        if built is None:
+            built = self._operations[key] = _build_operation(
+                path_name, method, path_parameters, operation, self._resolver
             )
+        return built
+
+    def operations(self, tags: Iterable[str] | None = None, path_prefix: str | None = None) -> Iterator[Operation]:
+        """Yield operations matching ``tags``/``path_prefix``, building each only once."""
+
+        tags = set(tags) if tags is not None else None
+        for path_name, method, path_parameters, operation in _iter_raw_operations(self._raw_spec):
+            if not _operation_matches(path_name, operation.get("tags", []), tags, path_prefix):
+                continue
+            yield self._operation(path_name, method, path_parameters, operation)
+
+    def get_operation(self, operation_id: str) -> Operation:
+        for path_name, method, path_parameters, operation in _iter_raw_operations(self._raw_spec):
+            if (operation.get("operationId") or _build_operation_id(method, path_name)) != operation_id:
+                continue
+            return self._operation(path_name, method, path_parameters, operation)
+        raise KeyError(operation_id)
+
+    def materialize(self, tags: Iterable[str] | None = None, path_prefix: str | None = None) -> OpenApiDocument:
+        return OpenApiDocument(
+            title=self.title, version=self.version, operations=list(self.operations(tags, path_prefix))
+        )
+
+
+def load_openapi_lazy(
+    path: str | os.PathLike[str],
+    *,
+    cache_dir: str | os.PathLike[str] | None = None,
+    resolve_refs: bool = True,
+) -> LazyOpenApiDocument:
+    """Parse an OpenAPI spec without building its operations up front.
+
+    With ``cache_dir`` the parsed (raw) spec is cached by content hash like
+    :func:`load_openapi` does for full documents. References are resolved per
+    operation as operations are materialised.
+    """
+
+    file_path = Path(path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"OpenAPI file not found: {path}")
 
-    return OpenApiDocument(title=title, version=version, operations=operations)
+    content = file_path.read_bytes()
+    raw_spec = None
+    if cache_dir is not None:
+        cache_path = _cache_path(cache_dir, content, "raw")
+        raw_spec = _read_cache(cache_path, dict)
+    if raw_spec is None:
+        raw_spec = _parse_spec_text(content, file_path.suffix)
+        if cache_dir is not None:
+            _write_cache(cache_path, raw_spec)
+    return LazyOpenApiDocument(raw_spec, RefResolver(raw_spec, file_path) if resolve_refs else None)
@@ -0,0 +1,44 @@
+"""``python -X importtime`` helper shared by the import-time budget tests.
+
+Used by ``tests/test_import_time.py`` and ``backend/tests/test_startup.py``; the
+backend suite puts this directory on ``sys.path`` to import it.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+
+def import_profile(module: str, cwd: str | os.PathLike[str]) -> tuple[float, set[str]]:
+    """Import ``module`` in a fresh interpreter and return (cumulative ms, imported modules)."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative_us = 0
+    imported: set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        name = name.strip()
+        imported.add(name)
+        if name == module:
+            cumulative_us = int(cumulative)
+    return cumulative_us / 1000, imported
+
+
+def best_of(module: str, cwd: str | os.PathLike[str], runs: int = 3) -> tuple[float, set[str]]:
+    """Fastest of ``runs`` profiles, which keeps bytecode compilation out of the measurement."""
+
+    profiles = [import_profile(module, cwd) for _ in range(runs)]
+    return min(elapsed for elapsed, _ in profiles), profiles[0][1]
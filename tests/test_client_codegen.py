@@ -0,0 +1,155 @@
+import asyncio
+import importlib.util
+import json
+
+import httpx
+
+from openapi_locustgen.codegen.client_codegen import ClientOptions, render_client, write_client
+from openapi_locustgen.http_adapters import AsyncHttpxAdapter, HttpxAdapter
+from openapi_locustgen.models import OpenApiDocument, Operation, Parameter
+from openapi_locustgen.utils import load_openapi
+
+
+def _import_client(tmp_path, document, options=None):
+    path = write_client(document, tmp_path / "petstore_client.py", options)
+    spec = importlib.util.spec_from_file_location("petstore_client", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _recording_transport(requests):
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    return httpx.MockTransport(handler)
+
+
+def test_generated_sync_client_builds_requests(tmp_path):
+    module = _import_client(tmp_path, load_openapi("tests/data/simple_openapi.yaml"))
+    requests = []
+    client = httpx.Client(base_url="http://api.test", transport=_recording_transport(requests))
+
+    with module.SimplePetstoreClient(HttpxAdapter(client=client)) as api:
+        response = api.get_pet("a b/c")
+        api.list_pets(limit=5)
+        api.list_pets()
+        api.put_pets_pet_id(7, verbose=True, body={"name": "Rex"}, headers={"X-Trace": "1"})
+
+    assert response.status_code == 200
+    assert response.ok
+    assert response.json() == {"ok": True}
+    assert not hasattr(response, "__dict__")
+
+    get_pet, limited, unlimited, update = requests
+    assert get_pet.url.raw_path == b"/pets/a%20b%2Fc"
+    assert limited.url.params["limit"] == "5"
+    assert not unlimited.url.query
+    assert update.method == "PUT"
+    assert update.url.raw_path == b"/pets/7?verbose=true"
+    assert update.headers["Content-Type"] == "application/json"
+    assert update.headers["X-Trace"] == "1"
+    assert update.content == b'{"name":"Rex"}'
+    assert client.is_closed
+
+
+def test_generated_async_client_shares_the_adapter_pool(tmp_path):
+    module = _import_client(tmp_path, load_openapi("tests/data/simple_openapi.yaml"))
+    requests = []
+
+    async def scenario():
+        client = httpx.AsyncClient(base_url="http://api.test", transport=_recording_transport(requests))
+        async with module.SimplePetstoreAsyncClient(AsyncHttpxAdapter(client=client, concurrency=4)) as api:
+            responses = await asyncio.gather(*(api.get_pet(str(index)) for index in range(10)))
+            created = await api.create_pet(content=b'{"name":"raw"}')
+        return responses, created
+
+    responses, created = asyncio.run(scenario())
+
+    assert [response.status_code for response in responses] == [200] * 10
+    assert created.json() == {"ok": True}
+    assert sorted(request.url.path for request in requests[:10]) == sorted(f"/pets/{index}" for index in range(10))
+    assert requests[-1].content == b'{"name":"raw"}'
+
+
+def test_render_client_handles_header_parameters_and_name_clashes():
+    operation = Operation(
+        operation_id="searchItems",
+        method="GET",
+        path="/items/{id}",
+        summary='Search "items"',
+        parameters=[
+            Parameter(name="id", in_="path", required=True, schema={"type": "integer"}),
+            Parameter(name="X-Tenant", in_="header", required=True, schema={"type": "string"}),
+            Parameter(name="id", in_="query", required=False, schema={"type": "string"}),
+            Parameter(name="content", in_="query", required=True, schema={"type": "string"}),
+        ],
+        request_body=None,
+        responses={},
+    )
+    document = OpenApiDocument(title="Items", version="1", operations=[operation])
+
+    source = render_client(document, ClientOptions(asynchronous=False))
+    namespace = {}
+    exec(compile(source, "items_client.py", "exec"), namespace)
+
+    requests = []
+    client = httpx.Client(base_url="http://api.test", transport=_recording_transport(requests))
+    api = namespace["ItemsClient"](HttpxAdapter(client=client))
+    api.search_items(3, x_tenant="acme", content_query="c", id_query="q")
+
+    assert "ItemsAsyncClient" not in namespace
+    assert requests[0].url.raw_path == b"/items/3?content=c&id=q"
+    assert requests[0].headers["X-Tenant"] == "acme"
+    assert json.loads(api.search_items(3, x_tenant="acme", content_query="c").content) == {"ok": True}
+
+
+def test_render_client_names_undeclared_path_placeholders_uniquely():
+    operation = Operation(
+        operation_id="getItem",
+        method="GET",
+        path="/items/{id}",
+        summary=None,
+        parameters=[Parameter(name="id", in_="query", required=True, schema={"type": "string"})],
+        request_body=None,
+        responses={},
+    )
+    document = OpenApiDocument(title="Items", version="1", operations=[operation])
+
+    namespace = {}
+    exec(compile(render_client(document, ClientOptions(asynchronous=False)), "items_client.py", "exec"), namespace)
+
+    requests = []
+    client = httpx.Client(base_url="http://api.test", transport=_recording_transport(requests))
+    namespace["ItemsClient"](HttpxAdapter(client=client)).get_item("a/b", id="q")
+
+    assert requests[0].url.raw_path == b"/items/a%2Fb?id=q"
+
+
+def test_render_client_keeps_operation_names_off_client_members():
+    operations = [
+        Operation(
+            operation_id=operation_id,
+            method="POST",
+            path=f"/{operation_id}",
+            summary=None,
+            parameters=[],
+            request_body=None,
+            responses={},
+        )
+        for operation_id in ("close", "from_url", "aclose")
+    ]
+    document = OpenApiDocument(title="Items", version="1", operations=operations)
+
+    namespace = {}
+    exec(compile(render_client(document), "items_client.py", "exec"), namespace)
+
+    requests = []
+    client = httpx.Client(base_url="http://api.test", transport=_recording_transport(requests))
+    with namespace["ItemsClient"].from_url("http://api.test", client=client) as api:
+        api.close_2()
+        api.from_url_2()
+    assert [request.url.path for request in requests] == ["/close", "/from_url"]
+    assert client.is_closed
+    assert callable(namespace["ItemsAsyncClient"].aclose) and hasattr(namespace["ItemsAsyncClient"], "aclose_2")
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from openapi_locustgen.http_adapters import AsyncHttpxAdapter, HttpxAdapter, LocustSessionAdapter
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _respond(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        time.sleep(self.server.delay)
+        with self.server.lock:
+            self.server.in_flight -= 1
+        payload = json.dumps(
+            {"method": self.command, "path": self.path, "trace": self.headers.get("X-Trace"), "body": body.decode()}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture()
+def echo_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = server.in_flight = server.max_in_flight = 0
+    server.delay = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _base_url(server):
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def test_httpx_adapter_reuses_connections(echo_server):
+    pytest.importorskip("httpx")
+
+    with HttpxAdapter(_base_url(echo_server)) as adapter:
+        for _ in range(5):
+            response = adapter.request(
+                "POST", "/pets", params={"limit": 2}, headers={"X-Trace": "abc"}, content=b"{}", name="/pets"
+            )
+
+    assert response.status_code == 200
+    assert response.json() == {"method": "POST", "path": "/pets?limit=2", "trace": "abc", "body": "{}"}
+    assert echo_server.connections == 1
+
+
+def test_async_httpx_adapter_limits_concurrency(echo_server):
+    pytest.importorskip("httpx")
+    echo_server.delay = 0.05
+
+    async def run():
+        async with AsyncHttpxAdapter(_base_url(echo_server), concurrency=3) as adapter:
+            responses = await asyncio.gather(*(adapter.request("GET", f"/pets/{index}") for index in range(9)))
+        return responses
+
+    responses = asyncio.run(run())
+
+    assert [response.json()["path"] for response in responses] == [f"/pets/{index}" for index in range(9)]
+    assert echo_server.max_in_flight <= 3
+    assert echo_server.connections <= 3
+
+
+def test_async_httpx_adapter_rejects_invalid_concurrency():
+    with pytest.raises(ValueError):
+        AsyncHttpxAdapter(concurrency=0, client=object())
+
+
+def test_locust_session_adapter_groups_requests_by_name():
+    class RecordingSession:
+        def __init__(self):
+            self.calls = []
+
+        def request(self, method, url, **kwargs):
+            self.calls.append((method, url, kwargs))
+            return "response"
+
+    session = RecordingSession()
+    adapter = LocustSessionAdapter(session)
+
+    result = adapter.request("GET", "/pets/1?x=1", params={"tag": ["a", "b"]}, name="/pets/{petId}")
+
+    assert result == "response"
+    assert session.calls == [
+        ("GET", "/pets/1?x=1&tag=a&tag=b", {"name": "/pets/{petId}", "headers": None, "data": None})
+    ]
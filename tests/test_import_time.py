@@ -0,0 +1,36 @@
+import os
+from pathlib import Path
+
+import pytest
+from import_profile import best_of
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Cumulative import budget for ``openapi_locustgen`` in milliseconds.
+IMPORT_BUDGET_MS = float(os.environ.get("OPENAPI_LOCUSTGEN_IMPORT_BUDGET_MS", "150"))
+
+# Heavy or optional dependencies that must only load when a feature needs them.
+LAZY_MODULES = {"yaml", "httpx", "locust"}
+
+# Budget for the upload CLI, which CI spawns once per report. typer imports rich (and
+# its markdown/syntax renderers) from ``typer.core`` whenever rich is installed, which
+# is most of this; the CLI's own network stack must stay out of it.
+CLI_IMPORT_BUDGET_MS = float(os.environ.get("TRD_CLI_IMPORT_BUDGET_MS", "300"))
+CLI_LAZY_MODULES = {"httpx", "h11", "ssl"}
+
+
+def test_package_import_stays_within_budget():
+    best_ms, imported = best_of("openapi_locustgen", ROOT)
+
+    assert best_ms < IMPORT_BUDGET_MS, f"import openapi_locustgen took {best_ms:.0f}ms (budget {IMPORT_BUDGET_MS:.0f}ms)"
+    assert not LAZY_MODULES & imported
+
+
+def test_upload_cli_import_stays_within_budget():
+    pytest.importorskip("typer")
+    best_ms, imported = best_of("test_results_cli.cli", ROOT / "cli")
+
+    assert best_ms < CLI_IMPORT_BUDGET_MS, (
+        f"import test_results_cli.cli took {best_ms:.0f}ms (budget {CLI_IMPORT_BUDGET_MS:.0f}ms)"
+    )
+    assert not CLI_LAZY_MODULES & imported
@@ -0,0 +1,150 @@
+import json
+
+from openapi_locustgen.cli import main
+from openapi_locustgen.codegen.incremental import MANIFEST_NAME, generate, group_by_tag, operation_digest
+from openapi_locustgen.utils import load_openapi
+
+SPEC = """
+openapi: 3.0.0
+info:
+  title: Shop
+  version: "1"
+paths:
+  /pets:
+    get:
+      operationId: listPets
+      tags: [pets]
+      responses:
+        "200":
+          description: ok
+  /orders:
+    get:
+      operationId: listOrders
+      tags: [orders]
+      summary: List orders
+      responses:
+        "200":
+          description: ok
+  /health:
+    get:
+      operationId: health
+      responses:
+        "200":
+          description: ok
+"""
+
+
+def _write_spec(path, text=SPEC):
+    path.write_text(text)
+    return path
+
+
+def test_group_by_tag_and_operation_digest(tmp_path):
+    document = load_openapi(_write_spec(tmp_path / "spec.yaml"))
+
+    groups = group_by_tag(document.operations)
+    assert {tag: [op.operation_id for op in ops] for tag, ops in groups.items()} == {
+        "pets": ["listPets"],
+        "orders": ["listOrders"],
+        "default": ["health"],
+    }
+    assert list(group_by_tag(document.operations, tags=["pets"])) == ["pets"]
+
+    pets = groups["pets"][0]
+    digest = operation_digest(pets)
+    assert digest == operation_digest(load_openapi(tmp_path / "spec.yaml").operations[0])
+    pets.summary = "changed"
+    assert operation_digest(pets) != digest
+
+
+def test_generate_rewrites_only_changed_modules(tmp_path):
+    spec = _write_spec(tmp_path / "spec.yaml")
+    output = tmp_path / "out"
+    cache = tmp_path / "cache"
+
+    first = generate(spec, output, cache_dir=cache, workers=1)
+    names = sorted(path.name for path in first.written)
+    assert names == [
+        "default_client.py",
+        "default_locust.py",
+        "orders_client.py",
+        "orders_locust.py",
+        "pets_client.py",
+        "pets_locust.py",
+        "run_locust.py",
+    ]
+    assert "class OrdersClient:" in (output / "orders_client.py").read_text()
+    manifest = json.loads((output / MANIFEST_NAME).read_text())
+    assert manifest["modules"]["pets_client.py"]["tag"] == "pets"
+
+    second = generate(spec, output, cache_dir=cache, workers=1)
+    assert second.up_to_date
+    assert second.written == []
+
+    _write_spec(spec, SPEC.replace("summary: List orders", "summary: List all orders"))
+    third = generate(spec, output, cache_dir=cache, workers=1)
+    assert not third.up_to_date
+    assert sorted(path.name for path in third.written) == ["orders_client.py", "orders_locust.py"]
+    assert len(third.unchanged) == 5
+
+    (output / "pets_client.py").unlink()
+    fourth = generate(spec, output, cache_dir=cache, workers=1)
+    assert [path.name for path in fourth.written] == ["pets_client.py"]
+
+
+def test_generate_deletes_modules_of_removed_tags(tmp_path):
+    spec = _write_spec(tmp_path / "spec.yaml")
+    output = tmp_path / "out"
+    (output).mkdir()
+    (output / "handwritten.py").write_text("# keep me\n")
+
+    generate(spec, output, use_cache=False, workers=1)
+    _write_spec(spec, SPEC.replace("tags: [orders]", "tags: [pets]"))
+    result = generate(spec, output, use_cache=False, workers=1)
+
+    assert sorted(path.name for path in result.deleted) == ["orders_client.py", "orders_locust.py"]
+    assert not (output / "orders_client.py").exists()
+    assert (output / "handwritten.py").exists()
+    assert "def list_orders" in (output / "pets_client.py").read_text()
+    assert "orders_locust.py" not in (output / "run_locust.py").read_text()
+
+
+def test_generate_regenerates_when_settings_change(tmp_path):
+    spec = _write_spec(tmp_path / "spec.yaml")
+    output = tmp_path / "out"
+
+    generate(spec, output, use_cache=False, workers=1)
+    result = generate(spec, output, kinds=["client"], use_cache=False, workers=1)
+
+    assert not result.up_to_date
+    assert sorted(path.name for path in result.deleted) == [
+        "default_locust.py",
+        "orders_locust.py",
+        "pets_locust.py",
+        "run_locust.py",
+    ]
+
+
+def test_generate_regenerates_when_spec_moves(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    output = tmp_path / "out"
+
+    generate(_write_spec(tmp_path / "a" / "spec.yaml"), output, use_cache=False, workers=1)
+    result = generate(_write_spec(tmp_path / "b" / "spec.yaml"), output, use_cache=False, workers=1)
+
+    assert not result.up_to_date
+
+
+def test_cli_generate(tmp_path, capsys):
+    spec = _write_spec(tmp_path / "spec.yaml")
+    output = tmp_path / "out"
+
+    assert main(["generate", str(spec), "-o", str(output), "--no-cache", "--kind", "client", "--tag", "pets"]) == 0
+    assert "1 written" in capsys.readouterr().out
+    assert sorted(path.name for path in output.glob("*.py")) == ["pets_client.py"]
+
+    assert main(["generate", str(spec), "-o", str(output), "--no-cache", "--kind", "client", "--tag", "pets"]) == 0
+    assert "up to date" in capsys.readouterr().out
+
+    assert main(["generate", str(tmp_path / "missing.yaml"), "-o", str(output)]) == 2
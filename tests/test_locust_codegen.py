@@ -0,0 +1,86 @@
+import ast
+
+import pytest
+
+from openapi_locustgen.codegen.locust_codegen import LocustOptions, render_locustfile
+from openapi_locustgen.utils import load_openapi
+
+
+def _module_constants(source):
+    tree = ast.parse(source)
+    return {
+        node.targets[0].id: ast.literal_eval(node.value)
+        for node in tree.body
+        if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name)
+    }
+
+
+def _task_calls(source):
+    tree = ast.parse(source)
+    user_class = next(node for node in tree.body if isinstance(node, ast.ClassDef))
+    return {
+        node.name: (node.decorator_list[0], node.body[0].value)
+        for node in user_class.body
+        if isinstance(node, ast.FunctionDef)
+    }
+
+
+def test_render_locustfile_precomputes_urls_and_bodies():
+    document = load_openapi("tests/data/simple_openapi.yaml")
+    document.operations[0].parameters[0].example = 25  # listPets ?limit
+
+    source = render_locustfile(document)
+    constants = _module_constants(source)
+
+    assert "from locust import FastHttpUser, task" in source
+    assert "class SimplePetstoreUser(FastHttpUser):" in source
+    assert constants["LIST_PETS_URL"] == "/pets?limit=25"
+    assert constants["GET_PET_URL"] == "/pets/string"
+    assert constants["CREATE_PET_BODY"] == b'{"name":"string"}'
+    assert constants["CREATE_PET_HEADERS"] == {"Content-Type": "application/json"}
+
+    tasks = _task_calls(source)
+    get_pet_call = tasks["get_pet"][1]
+    assert [keyword.arg for keyword in get_pet_call.keywords] == ["name"]
+    assert get_pet_call.keywords[0].value.value == "/pets/{petId}"
+    assert [keyword.arg for keyword in tasks["list_pets"][1].keywords] == []
+
+
+def test_render_locustfile_applies_weights_and_user_options():
+    document = load_openapi("tests/data/simple_openapi.yaml")
+    options = LocustOptions(
+        user_class="HttpUser",
+        host="http://localhost:8000",
+        weights={"listPets": 5, "createPet": 0},
+        wait_time=(0.5, 1.0),
+        group_templated_paths=False,
+    )
+
+    source = render_locustfile(document, options)
+    tasks = _task_calls(source)
+
+    assert "class SimplePetstoreUser(HttpUser):" in source
+    assert "host = 'http://localhost:8000'" in source
+    assert "wait_time = between(0.5, 1.0)" in source
+    assert "create_pet" not in tasks
+    assert tasks["list_pets"][0].args[0].value == 5
+    assert tasks["get_pet"][1].keywords == []
+
+
+def test_locust_options_reject_unknown_user_class():
+    with pytest.raises(ValueError):
+        LocustOptions(user_class="WebSocketUser")
+
+
+def test_render_locustfile_keeps_task_names_off_locust_members():
+    document = load_openapi("tests/data/simple_openapi.yaml")
+    document.operations[0].operation_id = "task"
+    document.operations[1].operation_id = "on_start"
+
+    source = render_locustfile(document)
+    tasks = _task_calls(source)
+
+    assert {"task_2", "on_start_2"} <= set(tasks)
+    assert not {"task", "on_start"} & set(tasks)
+    assert all(decorator.func.id == "task" for decorator, _ in tasks.values())
+    assert "TASK_2_URL" in _module_constants(source)
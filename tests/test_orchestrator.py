@@ -0,0 +1,123 @@
+import subprocess
+import sys
+
+import pytest
+
+from openapi_locustgen import orchestrator
+from openapi_locustgen.codegen.incremental import render_harness
+from openapi_locustgen.orchestrator import RunOptions, master_command, parse_stats_csv, run, worker_command
+
+# Stand-in for ``locust``: workers exit at once, the master sleeps for its first argument.
+FAKE_LOCUST = """
+import sys, time
+if "--worker" not in sys.argv:
+    time.sleep(float(sys.argv[1]))
+"""
+
+STATS_CSV = """Type,Name,Request Count,Failure Count,Median Response Time,Average Response Time,Min Response Time,Max Response Time,Average Content Size,Requests/s,Failures/s,50%,66%,75%,80%,90%,95%,98%,99%,99.9%,99.99%,100%
+GET,/pets,1000,10,12,14.5,2,120,40,50.0,0.5,12,14,16,18,25,40,60,80,110,120,120
+POST,/pets,0,0,0,0,0,0,0,0.0,0.0,N/A,N/A,N/A,N/A,N/A,N/A,N/A,N/A,N/A,N/A,N/A
+,Aggregated,1000,10,12,14.5,2,120,40,50.0,0.5,12,14,16,18,25,40,60,80,110,120,120
+"""
+
+
+def test_commands_wire_master_and_workers(tmp_path):
+    options = RunOptions(
+        locustfiles=["a_locust.py", "b_locust.py"],
+        host="http://localhost:8000",
+        users=50,
+        workers=3,
+        results_dir=tmp_path,
+        user_classes=["PetsUser"],
+        locust_command=["locust"],
+    )
+
+    master = master_command(options, 6000)
+    assert master[:3] == ["locust", "-f", "a_locust.py,b_locust.py"]
+    assert {"--master", "--headless"} <= set(master)
+    assert master[master.index("--expect-workers") + 1] == "3"
+    assert master[master.index("--expect-workers-max-wait") + 1] == "60"
+    assert master[master.index("--master-bind-port") + 1] == "6000"
+    assert master[master.index("--csv") + 1] == str(tmp_path / "locust")
+    assert master[-1] == "PetsUser"
+
+    worker = worker_command(options, 6000)
+    assert "--worker" in worker
+    assert worker[worker.index("--master-port") + 1] == "6000"
+
+
+def test_run_options_default_to_one_worker_per_core(monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 12)
+    assert RunOptions(locustfiles=["a.py"], host="http://x").worker_count == 12
+    with pytest.raises(ValueError):
+        RunOptions(locustfiles=[], host="http://x")
+    with pytest.raises(ValueError):
+        RunOptions(locustfiles=["a.py"], host="http://x", workers=0)
+
+
+def test_parse_stats_csv(tmp_path):
+    path = tmp_path / "locust_stats.csv"
+    path.write_text(STATS_CSV)
+
+    summary = parse_stats_csv(path)
+
+    pets, create = summary["endpoints"]
+    assert pets["method"] == "GET"
+    assert pets["name"] == "/pets"
+    assert pets["requests"] == 1000
+    assert pets["failure_rate"] == pytest.approx(0.01)
+    assert (pets["p50"], pets["p95"], pets["p99"]) == (12.0, 40.0, 80.0)
+    assert pets["rps"] == 50.0
+    assert create["failure_rate"] == 0.0
+    assert create["p95"] == 0.0
+    assert summary["total"]["requests"] == 1000
+    assert "method" not in summary["total"]
+
+
+def _fake_options(tmp_path, master_seconds):
+    return RunOptions(
+        locustfiles=["a_locust.py"],
+        host="http://localhost:8000",
+        workers=2,
+        results_dir=tmp_path,
+        locust_command=[sys.executable, "-c", FAKE_LOCUST, str(master_seconds)],
+        shutdown_timeout=1,
+    )
+
+
+def test_run_ignores_stats_from_a_previous_run(tmp_path):
+    (tmp_path / "locust_stats.csv").write_text(STATS_CSV)
+    (tmp_path / "summary.json").write_text("{}")
+
+    with pytest.raises(RuntimeError, match="without writing"):
+        run(_fake_options(tmp_path, 0))
+
+    assert not (tmp_path / "locust_stats.csv").exists()
+    assert not (tmp_path / "summary.json").exists()
+
+
+def test_run_stops_master_when_a_worker_fails_to_spawn(tmp_path, monkeypatch):
+    started = []
+    real_popen = subprocess.Popen
+
+    def popen(command, **kwargs):
+        if len(started) == 2:
+            raise OSError("cannot spawn worker")
+        process = real_popen(command, **kwargs)
+        started.append(process)
+        return process
+
+    monkeypatch.setattr(orchestrator.subprocess, "Popen", popen)
+
+    with pytest.raises(OSError):
+        run(_fake_options(tmp_path, 60))
+
+    assert all(process.poll() is not None for process in started)
+
+
+def test_render_harness_runs_all_locustfiles():
+    source = render_harness(["pets_locust.py", "orders_locust.py"])
+
+    compile(source, "run_locust.py", "exec")
+    assert "LOCUSTFILES = ['orders_locust.py', 'pets_locust.py']" in source
+    assert "from openapi_locustgen.cli import main" in source
@@ -0,0 +1,123 @@
+import pytest
+
+from openapi_locustgen.refs import RefResolutionError, RefResolver, resolve_references
+from openapi_locustgen.utils import load_openapi
+
+
+def test_shared_components_are_interned():
+    spec = {
+        "paths": {
+            "/a": {"get": {"responses": {"200": {"schema": {"$ref": "#/components/schemas/Pet"}}}}},
+            "/b": {"get": {"responses": {"200": {"schema": {"$ref": "#/components/schemas/Pet"}}}}},
+        },
+        "components": {"schemas": {"Pet": {"type": "object"}}},
+    }
+
+    stats = resolve_references(spec)
+
+    first = spec["paths"]["/a"]["get"]["responses"]["200"]["schema"]
+    second = spec["paths"]["/b"]["get"]["responses"]["200"]["schema"]
+    assert first == {"type": "object"}
+    assert first is second is spec["components"]["schemas"]["Pet"]
+    assert stats.references == 2
+    assert stats.targets == 1
+
+
+def test_recursive_schemas_are_not_expanded():
+    spec = {
+        "components": {
+            "schemas": {
+                "Node": {"properties": {"children": {"items": {"$ref": "#/components/schemas/Node"}}}},
+                "Tree": {"properties": {"root": {"$ref": "#/components/schemas/Node"}}},
+                "A": {"$ref": "#/components/schemas/B"},
+                "B": {"$ref": "#/components/schemas/A"},
+            }
+        }
+    }
+
+    stats = resolve_references(spec)
+
+    node = spec["components"]["schemas"]["Node"]
+    assert node["properties"]["children"]["items"] == {"$ref": "#/components/schemas/Node"}
+    assert spec["components"]["schemas"]["Tree"]["properties"]["root"] is node
+    # A pure reference loop has nothing to expand; both ends stay references.
+    assert set(spec["components"]["schemas"]["A"]) == {"$ref"}
+    assert set(spec["components"]["schemas"]["B"]) == {"$ref"}
+    assert stats.cycles == 2
+
+
+def test_file_relative_references(tmp_path):
+    (tmp_path / "schemas").mkdir()
+    (tmp_path / "schemas" / "pet.yaml").write_text(
+        "Pet:\n  type: object\n  properties:\n    owner:\n      $ref: '#/Owner'\nOwner:\n  type: string\n",
+        encoding="utf-8",
+    )
+    spec = {"schema": {"$ref": "schemas/pet.yaml#/Pet"}}
+
+    resolver = RefResolver(spec, tmp_path / "openapi.yaml")
+    resolver.resolve(spec)
+
+    assert spec["schema"]["properties"]["owner"] == {"type": "string"}
+    assert resolver.external_documents == [(tmp_path / "schemas" / "pet.yaml").resolve()]
+
+
+def test_unresolvable_reference_raises():
+    with pytest.raises(RefResolutionError, match="#/components/schemas/Missing"):
+        resolve_references({"schema": {"$ref": "#/components/schemas/Missing"}})
+
+
+def test_load_openapi_resolves_parameter_and_body_references(tmp_path):
+    spec_path = tmp_path / "openapi.yaml"
+    spec_path.write_text(
+        """
+openapi: 3.0.0
+info: {title: Refs, version: "1"}
+paths:
+  /pets:
+    post:
+      operationId: createPet
+      parameters:
+        - $ref: '#/components/parameters/Trace'
+      requestBody:
+        $ref: 'bodies.yaml#/PetBody'
+      responses: {"201": {description: created}}
+components:
+  parameters:
+    Trace: {name: X-Trace, in: header, schema: {type: string}}
+""",
+        encoding="utf-8",
+    )
+    bodies = tmp_path / "bodies.yaml"
+    bodies.write_text("PetBody:\n  content:\n    application/json:\n      schema: {type: object}\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    operation = load_openapi(spec_path, cache_dir=cache_dir).operations[0]
+    assert [(param.name, param.in_) for param in operation.parameters] == [("X-Trace", "header")]
+    assert operation.request_body.schema == {"type": "object"}
+
+    bodies.write_text(bodies.read_text(encoding="utf-8").replace("object", "array"), encoding="utf-8")
+    assert load_openapi(spec_path, cache_dir=cache_dir).operations[0].request_body.schema == {"type": "array"}
+
+
+def test_document_cache_is_keyed_by_spec_location(tmp_path):
+    cache_dir = tmp_path / "cache"
+    spec = (
+        "openapi: 3.0.0\n"
+        "info: {title: T, version: '1'}\n"
+        "paths:\n"
+        "  /items:\n"
+        "    get:\n"
+        "      parameters:\n"
+        "        - $ref: 'params.yaml#/Name'\n"
+        "      responses: {'200': {description: ok}}\n"
+    )
+    for directory, name in (("a", "alpha"), ("b", "beta")):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "spec.yaml").write_text(spec, encoding="utf-8")
+        (tmp_path / directory / "params.yaml").write_text(
+            f"Name: {{name: {name}, in: query, schema: {{type: string}}}}\n", encoding="utf-8"
+        )
+
+    for directory, name in (("a", "alpha"), ("b", "beta"), ("a", "alpha")):
+        operation = load_openapi(tmp_path / directory / "spec.yaml", cache_dir=cache_dir).operations[0]
+        assert [param.name for param in operation.parameters] == [name]
@@ -1,4 +1,4 @@
-from openapi_locustgen.utils import load_openapi
+from openapi_locustgen.utils import load_openapi, load_openapi_lazy
 
 
 def test_load_openapi_parses_operations():
@@ -25,3 +25,62 @@ def test_load_openapi_parses_operations():
 
     list_pets = next(op for op in doc.operations if op.operation_id == "listPets")
     assert list_pets.responses[200].description == "A paged array of pets"
+
+
+def _write_tagged_spec(path):
+    path.write_text(
+        """
+openapi: 3.0.0
+info: {title: Tagged, version: "1"}
+paths:
+  /pets:
+    get: {operationId: listPets, tags: [pets], responses: {"200": {description: ok}}}
+  /stores/{storeId}:
+    get: {operationId: getStore, tags: [stores], responses: {"200": {description: ok}}}
+""",
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_load_openapi_filters_by_tag_and_path_prefix(tmp_path):
+    spec = _write_tagged_spec(tmp_path / "spec.yaml")
+
+    assert [op.operation_id for op in load_openapi(spec, tags=["stores"]).operations] == ["getStore"]
+    assert [op.operation_id for op in load_openapi(spec, path_prefix="/pets").operations] == ["listPets"]
+    assert load_openapi(spec).operations[0].tags == ["pets"]
+
+
+def test_load_openapi_cache_is_keyed_by_content(tmp_path):
+    spec = _write_tagged_spec(tmp_path / "spec.yaml")
+    cache_dir = tmp_path / "cache"
+
+    first = load_openapi(spec, cache_dir=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 1
+    assert load_openapi(spec, cache_dir=cache_dir) == first
+
+    spec.write_text(spec.read_text(encoding="utf-8").replace("listPets", "listAllPets"), encoding="utf-8")
+    changed = load_openapi(spec, cache_dir=cache_dir)
+    assert {op.operation_id for op in changed.operations} == {"listAllPets", "getStore"}
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_load_openapi_ignores_corrupt_cache_entries(tmp_path):
+    spec = _write_tagged_spec(tmp_path / "spec.yaml")
+    cache_dir = tmp_path / "cache"
+    load_openapi(spec, cache_dir=cache_dir)
+    for entry in cache_dir.iterdir():
+        entry.write_bytes(b"not a pickle")
+
+    assert len(load_openapi(spec, cache_dir=cache_dir).operations) == 2
+
+
+def test_lazy_document_materializes_on_demand(tmp_path):
+    spec = _write_tagged_spec(tmp_path / "spec.yaml")
+    lazy = load_openapi_lazy(spec)
+
+    store = lazy.get_operation("getStore")
+    assert store.path == "/stores/{storeId}"
+    assert lazy.get_operation("getStore") is store
+    assert lazy.materialize(tags=["pets"]).operations[0].operation_id == "listPets"
+    assert lazy.materialize() == load_openapi(spec)